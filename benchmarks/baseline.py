@@ -0,0 +1,94 @@
+"""
+Helpers shared by the benchmark scripts: save results as baseline JSON and
+compare a fresh run against a saved baseline.
+
+Baselines are machine-specific, so they are written under benchmarks/results/
+(git-ignored) unless an explicit path is given.
+"""
+import json
+import os
+import platform
+import sys
+from typing import Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# A metric may get this much slower (relative) before it counts as a regression
+DEFAULT_TOLERANCE = 0.20
+
+
+def default_path(name: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{name}.json")
+
+
+def save_baseline(path: str, metrics: Dict[str, float]) -> None:
+    """
+    Write metrics (lower is better) plus a little machine context to path.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    payload = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "metrics": metrics,
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2, sort_keys=True)
+    print(f"Saved baseline: {path}")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, float]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh).get("metrics", {})
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Print a current-vs-baseline table and return the names of regressed metrics.
+    Metrics missing from either side are reported but never count as regressions.
+    """
+    regressions = []
+    width = max([len(k) for k in current] + [6])
+    print(f"{'metric':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+    for name in sorted(set(current) | set(baseline)):
+        old, new = baseline.get(name), current.get(name)
+        if old is None or new is None:
+            print(f"{name:<{width}}  {old if old is not None else '-':>12}  {new if new is not None else '-':>12}  {'n/a':>8}")
+            continue
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<{width}}  {old:>12.3f}  {new:>12.3f}  {change:>+7.1%}{flag}")
+    return regressions
+
+
+def finish(name: str, metrics: Dict[str, float], save: Optional[str], compare_to: Optional[str], tolerance: float) -> int:
+    """
+    Common tail of every benchmark script: optionally save, optionally compare.
+    Returns a process exit code (1 if any metric regressed).
+    """
+    if save is not None:
+        save_baseline(save or default_path(name), metrics)
+    if compare_to is not None:
+        path = compare_to or default_path(name)
+        baseline = load_baseline(path)
+        if baseline is None:
+            print(f"No baseline at {path}; run with --save first.")
+            return 0
+        regressions = compare(metrics, baseline, tolerance)
+        if regressions:
+            print(f"Regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+def add_baseline_args(parser) -> None:
+    parser.add_argument("--save", nargs="?", const="", default=None, metavar="PATH",
+                        help="save results as the new baseline (default path under benchmarks/results/)")
+    parser.add_argument("--compare", nargs="?", const="", default=None, metavar="PATH",
+                        help="compare results against a saved baseline and exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before a metric counts as regressed")
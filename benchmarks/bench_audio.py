@@ -0,0 +1,211 @@
+"""
+Music start-latency benchmark that runs fully offline.
+
+    python benchmarks/bench_audio.py [--save | --compare]
+
+A generated WAV file is served from 127.0.0.1 and stands in for the remote
+stream, and a stub yt_dlp module (installed with audio.override_backend)
+"resolves" every YouTube URL to that local file after --resolve-delay ms.
+Scenarios:
+
+- stream_cold:       play_stream_url() opens and buffers the media after PLAY
+- stream_prerolled:  prepare_stream_url() buffers it paused first; PLAY only unpauses
+- youtube_cold:      play_youtube_stream() resolves, then opens the stream
+- youtube_prerolled: prepare_youtube_stream() resolves and pre-rolls first
+- local_loop:        play_local_music_loop() with pygame
+
+For each scenario the median PLAY-to-audible latency and the mean of every
+recorded stage (see utils.audio.AudioMetrics) are reported. Stream scenarios
+need python-vlc + libVLC and local_loop needs pygame; missing backends are
+skipped.
+"""
+import argparse
+import functools
+import itertools
+import math
+import os
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+import types
+import wave
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+from baseline import add_baseline_args, finish  # noqa: E402
+from utils import audio  # noqa: E402
+
+
+def write_test_tone(path: str, seconds: float = 30.0, rate: int = 44100) -> None:
+    """
+    Write a mono 16-bit sine tone; long enough that playback never ends mid-run.
+    """
+    frames = bytearray()
+    for i in range(int(seconds * rate)):
+        frames += struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(frames))
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        pass
+
+
+@contextmanager
+def serve_directory(directory: str) -> Iterator[str]:
+    """
+    Serve directory over HTTP on an ephemeral localhost port; yields the base URL.
+    """
+    handler = functools.partial(_QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def make_stub_yt_dlp(stream_url: str, resolve_delay_ms: float) -> types.ModuleType:
+    """
+    A stand-in for the yt_dlp module: extract_info() waits resolve_delay_ms and
+    returns one audio-only format pointing at stream_url.
+    """
+    class YoutubeDL:
+        def __init__(self, opts=None):
+            self.opts = opts or {}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url, download=False):
+            time.sleep(resolve_delay_ms / 1000.0)
+            return {"formats": [{"url": stream_url, "vcodec": "none", "acodec": "pcm_s16le", "abr": 705}]}
+
+    module = types.ModuleType("yt_dlp")
+    module.YoutubeDL = YoutubeDL
+    return module
+
+
+def _wait_ready(timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not audio.is_prepared_stream_ready():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _run_once(prepare: Optional[Callable[[], None]], play: Callable[[], None], timeout: float) -> Optional[float]:
+    if prepare is not None:
+        prepare()
+        if not _wait_ready(timeout):
+            audio.stop_music()
+            return None
+    play()
+    latency = audio.wait_for_play_latency(timeout)
+    # An explicit stop also lets the next run pre-roll again, like a fresh menu
+    audio.stop_music()
+    return latency
+
+
+def build_scenarios(stream_url: str, wav_path: str, next_run: Callable[[], int]):
+    """
+    Scenario name -> (required backend, factory returning (prepare or None, play)).
+    YouTube URLs are unique per run so the worker's resolve cache never hides the resolve.
+    """
+    def stream_cold():
+        return None, lambda: audio.play_stream_url(stream_url)
+
+    def stream_prerolled():
+        return (lambda: audio.prepare_stream_url(stream_url)), (lambda: audio.play_stream_url(stream_url))
+
+    def youtube_cold():
+        url = f"https://www.youtube.com/watch?v=bench{next_run()}"
+        return None, lambda: audio.play_youtube_stream(url)
+
+    def youtube_prerolled():
+        url = f"https://www.youtube.com/watch?v=bench{next_run()}"
+        return (lambda: audio.prepare_youtube_stream(url)), (lambda: audio.play_youtube_stream(url))
+
+    def local_loop():
+        return None, lambda: audio.play_local_music_loop(wav_path)
+
+    return {
+        "stream_cold": ("vlc", stream_cold),
+        "stream_prerolled": ("vlc", stream_prerolled),
+        "youtube_cold": ("vlc", youtube_cold),
+        "youtube_prerolled": ("vlc", youtube_prerolled),
+        "local_loop": ("pygame", local_loop),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=15.0, help="seconds to wait for audio per run")
+    parser.add_argument("--resolve-delay", type=float, default=300.0,
+                        help="simulated yt-dlp resolve time in ms")
+    parser.add_argument("--network-caching", type=int, default=audio.get_network_caching(),
+                        help="VLC network caching in ms")
+    parser.add_argument("--only", nargs="*", help="run only these scenarios")
+    add_baseline_args(parser)
+    args = parser.parse_args(argv)
+
+    audio.set_network_caching(args.network_caching)
+    counter = itertools.count()
+    metrics: Dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory(prefix="leaf_catcher_bench_") as tmpdir:
+        wav_path = os.path.join(tmpdir, "tone.wav")
+        write_test_tone(wav_path)
+        with serve_directory(tmpdir) as base_url:
+            stream_url = f"{base_url}/tone.wav"
+            audio.override_backend("yt_dlp", make_stub_yt_dlp(stream_url, args.resolve_delay))
+            scenarios = build_scenarios(stream_url, wav_path, lambda: next(counter))
+            for name, (backend, make_run) in scenarios.items():
+                if args.only and name not in args.only:
+                    continue
+                if audio._import_backend(backend) is None:
+                    print(f"{name:<18} skipped ({backend} not available)")
+                    continue
+                audio.reset_audio_metrics()
+                samples: List[float] = []
+                for _ in range(args.runs):
+                    prepare, play = make_run()
+                    latency = _run_once(prepare, play, args.timeout)
+                    if latency is not None:
+                        samples.append(latency)
+                if not samples:
+                    print(f"{name:<18} no successful runs")
+                    continue
+                metrics[f"{name}.play_to_audible_ms"] = statistics.median(samples)
+                print(f"{name:<18} play->audible median {statistics.median(samples):8.1f} ms "
+                      f"(min {min(samples):.1f}, max {max(samples):.1f}, n={len(samples)})")
+                for stage, stats in audio.get_audio_metrics().items():
+                    if stage == "play_to_audible":
+                        continue
+                    metrics[f"{name}.{stage}_ms"] = stats["mean_ms"]
+                    print(f"{'':<18}   {stage:<14} mean {stats['mean_ms']:8.1f} ms (n={stats['count']})")
+
+    audio.shutdown_audio()
+    return finish("audio", metrics, args.save, args.compare, args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Input-to-photon latency: single-threaded loop vs threaded simulation.
+
+    python benchmarks/bench_latency.py [--save | --compare] [--seconds 5] [--leaves 300]
+
+For each mode this opens the game window, keeps --leaves leaves on screen as
+render load, and sends a Left/Right key press every --interval-ms through
+Tk's event queue. Latency is GameController.input_latency: from the key
+handler to the end of the repaint (an after_idle callback queued behind the
+canvas redisplay) of the first frame that includes the move. Needs a
+display and is skipped without one.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Dict, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+from baseline import add_baseline_args, finish  # noqa: E402
+
+from controllers.game_controller import GameController  # noqa: E402
+from controllers.threaded_sim import ThreadedGame  # noqa: E402
+from models.game_state import GameState  # noqa: E402
+from models.leaf import Leaf  # noqa: E402
+from utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, LEAF_SIZE, LEAF_COLOR  # noqa: E402
+
+MODES = ("single", "threaded")
+
+
+def keep_leaves(controller: GameController, n: int, seed: int) -> None:
+    """
+    Top the controller's leaves up to n every tick (on whichever thread ticks).
+    """
+    rng = random.Random(seed)
+    state = controller.game_state
+
+    def top_up():
+        while len(state.leaves) < n:
+            state.leaves.append(Leaf(x=rng.randint(0, WINDOW_WIDTH - LEAF_SIZE), y=rng.randint(0, WINDOW_HEIGHT // 2),
+                                     speed=2, size=LEAF_SIZE, color=LEAF_COLOR))
+
+    controller.scheduler.call_every(1, top_up)
+
+
+def run_mode(mode: str, seconds: float, leaves: int, interval_ms: int, seed: int) -> Optional[Dict[str, float]]:
+    import tkinter
+    from views.game_view import GameView
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        print(f"Skipping: {e}")
+        return None
+    with redirect_stdout(io.StringIO()):
+        view = GameView(root, GameState())
+    threaded_game = None
+    if mode == "threaded":
+        controller = GameController(GameState(), seed=seed)
+        keep_leaves(controller, leaves, seed)
+        threaded_game = ThreadedGame(controller, view)
+        threaded_game.start(root)
+    else:
+        controller = GameController(view.game_state, view, seed=seed)
+        keep_leaves(controller, leaves, seed)
+        controller.start_game(root)
+
+    keys = ("<Left>", "<Right>")
+    presses = [0]
+
+    def press():
+        root.event_generate(keys[presses[0] % 2], when="tail")
+        presses[0] += 1
+        root.after(interval_ms, press)
+
+    root.after(500, press)  # let the first frames settle
+    root.after(int((0.5 + seconds) * 1000), root.quit)
+    started = time.perf_counter()
+    root.mainloop()
+    elapsed = time.perf_counter() - started
+    if threaded_game is not None:
+        threaded_game.stop()
+    root.destroy()
+
+    summary = controller.input_latency.summary()
+    summary["fps"] = controller.frame_stats.fps()
+    print(f"{mode:>9} {summary['p50']:>9.2f} {summary['p99']:>9.2f} {summary['count']:>7.0f} "
+          f"{summary['fps']:>6.1f}   ({elapsed:.1f} s)")
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0, help="key presses per mode for this long")
+    parser.add_argument("--leaves", type=int, default=300, help="leaves kept on screen as render load")
+    parser.add_argument("--interval-ms", type=int, default=97, help="time between key presses")
+    parser.add_argument("--seed", type=int, default=1234)
+    add_baseline_args(parser)
+    args = parser.parse_args(argv)
+
+    metrics: Dict[str, float] = {}
+    print(f"{'mode':>9} {'p50 ms':>9} {'p99 ms':>9} {'inputs':>7} {'fps':>6}   ({args.leaves} leaves)")
+    for mode in MODES:
+        summary = run_mode(mode, args.seconds, args.leaves, args.interval_ms, args.seed)
+        if summary is None:
+            return 0
+        metrics[f"input_to_photon_p50[{mode}]_ms"] = summary["p50"]
+        metrics[f"input_to_photon_p99[{mode}]_ms"] = summary["p99"]
+
+    return finish("latency", metrics, args.save, args.compare, args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
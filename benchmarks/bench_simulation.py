@@ -0,0 +1,226 @@
+"""
+Simulation and rendering hot-path benchmarks (headless, no display needed).
+
+    python benchmarks/bench_simulation.py [--save | --compare] [--max-leaves N]
+
+For seeded leaf populations of 10 to 100k leaves this measures:
+
+- update_game:   GameController.update_game() without a view (move + sweep + collision)
+- collision:     GameController.check_collision() alone
+- autopilot:     Autopilot.choose_target(), the per-tick decision of the autopilot
+- render:        GameView.render() against a RecordingCanvas stand-in
+- tk_calls:      canvas/label calls issued by one render (reported, not timed)
+
+plus, for 1k to 10k leaves, the spectator stream: the StateSnapshot copy
+that the game thread makes on every publishing tick (us), the time (us,
+on the publisher's loop) and size (bytes) of encoding a keyframe and a
+delta after one tick of movement, and the resulting bandwidth at the tick
+rate with a keyframe every SPECTATOR_KEYFRAME_TICKS. Last, a headless simulation of --sim-seconds of play at
+the real tick and spawn rates, reported as mean ms per tick. Each timing
+is the median over --repeats runs, each on a freshly seeded population.
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+from baseline import add_baseline_args, finish  # noqa: E402
+from recording_canvas import recording_widgets  # noqa: E402
+
+from controllers.autopilot import Autopilot  # noqa: E402
+from controllers.game_controller import GameController  # noqa: E402
+from models.game_state import GameState  # noqa: E402
+from models.leaf import Leaf  # noqa: E402
+from utils.constants import (  # noqa: E402
+    WINDOW_WIDTH, WINDOW_HEIGHT, LEAF_SIZE, LEAF_COLOR,
+    LEAF_MIN_SPEED, LEAF_MAX_SPEED, TICK_MS, LEAF_MAX_DRIFT, WIND_PHASES,
+    SPECTATOR_KEYFRAME_TICKS,
+)
+from utils.spectator import StateEncoder, snapshot_state  # noqa: E402
+from views import game_view  # noqa: E402
+
+LEAF_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+SPECTATOR_LEAF_COUNTS = (1_000, 3_000, 10_000)
+
+
+def seeded_state(n: int, seed: int) -> GameState:
+    """
+    A GameState with n leaves spread over the whole window, reproducible by seed.
+    """
+    rng = random.Random(seed)
+    state = GameState()
+    state.leaves = [
+        Leaf(
+            x=rng.randint(0, WINDOW_WIDTH - LEAF_SIZE),
+            y=rng.randint(-LEAF_SIZE, WINDOW_HEIGHT),
+            speed=rng.randint(LEAF_MIN_SPEED, LEAF_MAX_SPEED),
+            size=LEAF_SIZE,
+            color=LEAF_COLOR,
+            drift=rng.uniform(-LEAF_MAX_DRIFT, LEAF_MAX_DRIFT),
+            phase=rng.randrange(WIND_PHASES),
+        )
+        for _ in range(n)
+    ]
+    return state
+
+
+def time_call(setup: Callable[[int], Callable[[], None]], repeats: int, seed: int) -> float:
+    """
+    Median ms of the callable returned by setup(seed + i), over repeats runs.
+    Setup (building the population) is not timed.
+    """
+    samples: List[float] = []
+    for i in range(repeats):
+        fn = setup(seed + i)
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def make_view(state: GameState, leaf_images: bool) -> "game_view.GameView":
+    # GameView prints its asset loading; keep the benchmark table readable
+    with recording_widgets(game_view), redirect_stdout(io.StringIO()):
+        view = game_view.GameView(master=None, game_state=state)
+    if leaf_images:
+        # Stand-in PhotoImage so the create_image path is exercised even without Pillow
+        view._leaf_photo = "leaf"
+    view.render()  # first frame also draws the background; keep it out of the timings
+    return view
+
+
+def bench_population(n: int, repeats: int, seed: int, leaf_images: bool) -> Dict[str, float]:
+    def update_game(s):
+        controller = GameController(seeded_state(n, s))
+        return controller.update_game
+
+    def collision(s):
+        controller = GameController(seeded_state(n, s))
+        return controller.check_collision
+
+    def autopilot(s):
+        return Autopilot(GameController(seeded_state(n, s))).choose_target
+
+    def render(s):
+        return make_view(seeded_state(n, s), leaf_images).render
+
+    results = {
+        f"update_game[n={n}]_ms": time_call(update_game, repeats, seed),
+        f"collision[n={n}]_ms": time_call(collision, repeats, seed),
+        f"autopilot[n={n}]_ms": time_call(autopilot, repeats, seed),
+        f"render[n={n}]_ms": time_call(render, repeats, seed),
+    }
+
+    view = make_view(seeded_state(n, seed), leaf_images)
+    view.canvas.calls.clear()
+    view.score_label.calls.clear()
+    view.render()
+    results[f"tk_calls[n={n}]"] = float(sum(view.canvas.calls.values()) + sum(view.score_label.calls.values()))
+    return results
+
+
+def bench_spectator(n: int, repeats: int, seed: int) -> Dict[str, float]:
+    """
+    Snapshot and encode a keyframe of n leaves, move them one tick with
+    update_game() and snapshot and encode the delta; medians over repeats.
+    """
+    snap_us: List[float] = []
+    key_us: List[float] = []
+    key_bytes: List[float] = []
+    delta_us: List[float] = []
+    delta_bytes: List[float] = []
+    for i in range(repeats):
+        controller = GameController(seeded_state(n, seed + i))
+        state = controller.game_state
+        encoder = StateEncoder()
+        start = time.perf_counter()
+        frame, _ = encoder.encode_snapshot(snapshot_state(state))  # the first frame is always a keyframe
+        key_us.append((time.perf_counter() - start) * 1e6)
+        key_bytes.append(float(len(frame)))
+        controller.update_game(render=False)
+        start = time.perf_counter()
+        snapshot = snapshot_state(state)
+        snap_us.append((time.perf_counter() - start) * 1e6)
+        start = time.perf_counter()
+        frame, _ = encoder.encode_snapshot(snapshot)
+        delta_us.append((time.perf_counter() - start) * 1e6)
+        delta_bytes.append(float(len(frame)))
+    keyframe, delta = statistics.median(key_bytes), statistics.median(delta_bytes)
+    per_tick = (keyframe + (SPECTATOR_KEYFRAME_TICKS - 1) * delta) / SPECTATOR_KEYFRAME_TICKS
+    return {
+        f"spectator_snapshot[n={n}]_us": statistics.median(snap_us),
+        f"spectator_keyframe[n={n}]_us": statistics.median(key_us),
+        f"spectator_keyframe[n={n}]_bytes": keyframe,
+        f"spectator_delta[n={n}]_us": statistics.median(delta_us),
+        f"spectator_delta[n={n}]_bytes": delta,
+        f"spectator_stream[n={n}]_kb_per_s": per_tick * (1000.0 / TICK_MS) / 1024.0,
+    }
+
+
+def bench_headless_run(sim_seconds: float, seed: int) -> Dict[str, float]:
+    """
+    Play sim_seconds of game time headlessly: spawn on the real schedule and
+    keep the basket centred. Reports mean ms per tick and the peak leaf count.
+    """
+    state = GameState()
+    controller = GameController(state, seed=seed)
+    ticks = int(sim_seconds * 1000 / TICK_MS)
+    peak = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        controller.step()  # fires scheduled spawns, then update_game()
+        peak = max(peak, len(state.leaves))
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return {"headless_tick_mean_ms": elapsed_ms / max(1, ticks), "headless_peak_leaves": float(peak)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--max-leaves", type=int, default=LEAF_COUNTS[-1], help="largest population to run")
+    parser.add_argument("--sim-seconds", type=float, default=120.0, help="game time for the headless run")
+    parser.add_argument("--no-leaf-images", action="store_true", help="render leaves with the oval fallback")
+    add_baseline_args(parser)
+    args = parser.parse_args(argv)
+
+    metrics: Dict[str, float] = {}
+    print(f"{'leaves':>8} {'update_game':>12} {'collision':>12} {'autopilot':>12} {'render':>12} {'tk calls':>10}   (ms, median of {args.repeats})")
+    for n in LEAF_COUNTS:
+        if n > args.max_leaves:
+            continue
+        results = bench_population(n, args.repeats, args.seed, not args.no_leaf_images)
+        metrics.update(results)
+        print(f"{n:>8} {results[f'update_game[n={n}]_ms']:>12.3f} {results[f'collision[n={n}]_ms']:>12.3f} "
+              f"{results[f'autopilot[n={n}]_ms']:>12.3f} {results[f'render[n={n}]_ms']:>12.3f} {results[f'tk_calls[n={n}]']:>10.0f}")
+
+    print(f"\n{'leaves':>8} {'snap us':>10} {'key us':>10} {'key KB':>9} {'delta us':>10} {'delta KB':>9} {'KB/s':>9}   "
+          f"(spectator: snapshot on the game thread, encode on the publisher loop)")
+    for n in SPECTATOR_LEAF_COUNTS:
+        if n > args.max_leaves:
+            continue
+        results = bench_spectator(n, args.repeats, args.seed)
+        metrics.update(results)
+        print(f"{n:>8} {results[f'spectator_snapshot[n={n}]_us']:>10.0f} {results[f'spectator_keyframe[n={n}]_us']:>10.0f} "
+              f"{results[f'spectator_keyframe[n={n}]_bytes'] / 1024.0:>9.1f} "
+              f"{results[f'spectator_delta[n={n}]_us']:>10.0f} {results[f'spectator_delta[n={n}]_bytes'] / 1024.0:>9.1f} "
+              f"{results[f'spectator_stream[n={n}]_kb_per_s']:>9.0f}")
+
+    headless = bench_headless_run(args.sim_seconds, args.seed)
+    metrics.update(headless)
+    print(f"\nHeadless run ({args.sim_seconds:.0f} s game time): {headless['headless_tick_mean_ms']:.4f} ms/tick, "
+          f"peak {headless['headless_peak_leaves']:.0f} leaves\n")
+
+    return finish("simulation", metrics, args.save, args.compare, args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Startup benchmark: import-time report and time-to-menu.
+
+    python benchmarks/bench_startup.py                 # report only
+    python benchmarks/bench_startup.py --save          # record a baseline
+    python benchmarks/bench_startup.py --compare       # fail on regression
+
+The import report runs `python -X importtime -c "import app"` and lists the
+heaviest direct imports of app. Time-to-menu runs app.main() in a child process,
+with mainloop patched to stop after the first fully drawn menu frame; it
+needs a display and is skipped without one. Both also check that modules only
+optional features need (asyncio, sqlite3, tracemalloc, the audio backends) are
+not loaded on the way, and exit 1 if one is.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from baseline import add_baseline_args, finish  # noqa: E402
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Imported only by the features that use them: --asyncio and --publish (asyncio),
+# --memory-log (tracemalloc), the leaderboard and audio worker threads (sqlite3,
+# yt_dlp, vlc, pygame). `import app` must load none of them.
+DEFERRED_MODULES = ("asyncio", "sqlite3", "tracemalloc", "yt_dlp", "vlc", "pygame")
+# By the first menu frame the worker threads may have started their own imports
+MENU_DEFERRED_MODULES = ("asyncio", "tracemalloc")
+
+# Executed in the child: run the real app.main() but return from mainloop as
+# soon as the menu has been drawn, printing the elapsed time as JSON.
+_TIME_TO_MENU_CHILD = r"""
+import json, time, sys
+t0 = time.perf_counter()
+import tkinter
+try:
+    tkinter.Tk().destroy()
+except tkinter.TclError as e:
+    print(json.dumps({"error": str(e)}))
+    sys.exit(0)
+t_probe = time.perf_counter() - t0
+
+def _first_frame_then_quit(self, n=0):
+    self.update()
+    elapsed = time.perf_counter() - t0 - t_probe
+    loaded = sorted(m for m in MENU_DEFERRED_MODULES if m in sys.modules)
+    print(json.dumps({"time_to_menu_ms": elapsed * 1000.0, "loaded": loaded}))
+    self.destroy()
+
+tkinter.Misc.mainloop = _first_frame_then_quit
+import app
+app.main()
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_report(top: int = 15) -> Tuple[float, List[Tuple[str, float, float]]]:
+    """
+    Return (total_ms, [(module, self_ms, cumulative_ms), ...]) for `import app`:
+    the cumulative cost of importing app and its heaviest direct imports.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=SRC_DIR, env=_child_env(), capture_output=True, text=True,
+    )
+    total_ms = 0.0
+    pending: List[Tuple[str, float, float]] = []
+    rows: List[Tuple[str, float, float]] = []
+    # importtime prints children before their parent, nesting by 2-space indent
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, raw_name = line.split(":", 1)[1].split("|")
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        row = (raw_name.strip(), int(self_us) / 1000.0, int(cum_us) / 1000.0)
+        if depth == 1:
+            pending.append(row)
+        elif depth == 0:
+            if row[0] == "app":
+                total_ms = row[2]
+                rows = pending + [("app (self)", row[1], row[1])]
+            pending = []
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return total_ms, rows[:top]
+
+
+def eager_imports() -> List[str]:
+    """
+    The DEFERRED_MODULES that `import app` loads (should be none).
+    """
+    code = (
+        "import json, sys\n"
+        "import app\n"
+        f"print(json.dumps(sorted(m for m in {DEFERRED_MODULES!r} if m in sys.modules)))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR, env=_child_env(), capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def time_to_menu(runs: int) -> Tuple[Optional[float], List[str]]:
+    """
+    Median time from the start of app imports to the first menu frame, in ms,
+    and the MENU_DEFERRED_MODULES loaded by then. The time is None if no
+    display is available.
+    """
+    samples = []
+    loaded: List[str] = []
+    child = f"MENU_DEFERRED_MODULES = {MENU_DEFERRED_MODULES!r}\n" + _TIME_TO_MENU_CHILD
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", child],
+            cwd=SRC_DIR, env=_child_env(), capture_output=True, text=True, timeout=60,
+        )
+        lines = [ln for ln in proc.stdout.splitlines() if ln.startswith("{")]
+        if not lines:
+            print(proc.stderr.strip())
+            return None, loaded
+        result = json.loads(lines[-1])
+        if "error" in result:
+            print(f"Skipping time-to-menu (no display): {result['error']}")
+            return None, loaded
+        samples.append(result["time_to_menu_ms"])
+        loaded = result["loaded"]
+    return statistics.median(samples), loaded
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="child processes per measurement")
+    parser.add_argument("--top", type=int, default=15, help="number of imports to list")
+    add_baseline_args(parser)
+    args = parser.parse_args(argv)
+
+    metrics: Dict[str, float] = {}
+
+    totals = []
+    rows: List[Tuple[str, float, float]] = []
+    for _ in range(args.runs):
+        total_ms, rows = import_report(args.top)
+        totals.append(total_ms)
+    metrics["import_app_ms"] = statistics.median(totals)
+
+    print(f"Startup imports for `import app` (last run, top {args.top} by cumulative time):")
+    print(f"{'module':<40} {'self ms':>9} {'cum ms':>9}")
+    for name, self_ms, cum_ms in rows:
+        print(f"{name:<40} {self_ms:>9.1f} {cum_ms:>9.1f}")
+    print(f"Median total import time over {args.runs} runs: {metrics['import_app_ms']:.1f} ms")
+    eager = eager_imports()
+    print(f"Deferred modules loaded by `import app`: {', '.join(eager) or 'none'}\n")
+
+    start = time.perf_counter()
+    menu_ms, menu_loaded = time_to_menu(args.runs)
+    if menu_ms is not None:
+        metrics["time_to_menu_ms"] = menu_ms
+        print(f"Median time-to-menu over {args.runs} runs: {menu_ms:.1f} ms "
+              f"(measured in {time.perf_counter() - start:.1f} s)")
+        print(f"Deferred modules loaded by the first menu frame: {', '.join(menu_loaded) or 'none'}\n")
+
+    status = finish("startup", metrics, args.save, args.compare, args.tolerance)
+    if eager or menu_loaded:
+        print("FAIL: startup loads modules that only optional features need")
+        return 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
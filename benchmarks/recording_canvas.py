@@ -0,0 +1,130 @@
+"""
+Display-free stand-ins for the Tk widgets GameView creates.
+
+RecordingCanvas keeps just enough item bookkeeping (ids and tags) for
+GameView's delete-by-tag drawing to behave like the real Canvas, and counts
+every call by method so benchmarks can report Tk commands per frame.
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import DefaultDict, Dict, Iterator, List, Set, Tuple
+
+
+class _RecordingWidget:
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = dict(options)
+        self.calls: Counter = Counter()
+
+    def _record(self, method: str) -> None:
+        self.calls[method] += 1
+
+    # Geometry / events: recorded, otherwise no-ops
+    def pack(self, *args, **kwargs):
+        self._record("pack")
+
+    def place(self, *args, **kwargs):
+        self._record("place")
+
+    def place_forget(self):
+        self._record("place_forget")
+
+    def bind(self, *args, **kwargs):
+        self._record("bind")
+
+    def destroy(self):
+        self._record("destroy")
+
+    def config(self, **options):
+        self._record("config")
+        self.options.update(options)
+
+    configure = config
+
+
+class RecordingLabel(_RecordingWidget):
+    pass
+
+
+class RecordingCanvas(_RecordingWidget):
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self._next_id = 1
+        self._items: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+        self._by_tag: DefaultDict[str, Set[int]] = defaultdict(set)
+
+    def _create(self, kind: str, tags) -> int:
+        self._record(f"create_{kind}")
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = self._next_id
+        self._next_id += 1
+        tags = tuple(tags or ())
+        self._items[item] = (kind, tags)
+        for tag in tags:
+            self._by_tag[tag].add(item)
+        return item
+
+    def create_image(self, *coords, **options) -> int:
+        return self._create("image", options.get("tags"))
+
+    def create_rectangle(self, *coords, **options) -> int:
+        return self._create("rectangle", options.get("tags"))
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._create("oval", options.get("tags"))
+
+    def create_text(self, *coords, **options) -> int:
+        return self._create("text", options.get("tags"))
+
+    def delete(self, *tags_or_ids) -> None:
+        self._record("delete")
+        if "all" in tags_or_ids:
+            self._items.clear()
+            self._by_tag.clear()
+            return
+        for target in tags_or_ids:
+            doomed = self._by_tag.pop(target, set()) if isinstance(target, str) else {target}
+            for item in doomed:
+                _kind, tags = self._items.pop(item, (None, ()))
+                for tag in tags:
+                    if tag != target:
+                        self._by_tag[tag].discard(item)
+
+    def coords(self, item, *coords):
+        self._record("coords")
+
+    def move(self, item, dx, dy):
+        self._record("move")
+
+    def itemconfig(self, item, **options):
+        self._record("itemconfig")
+
+    itemconfigure = itemconfig
+
+    def tag_raise(self, *args):
+        self._record("tag_raise")
+
+    def find_all(self) -> List[int]:
+        self._record("find_all")
+        return list(self._items)
+
+
+@contextmanager
+def recording_widgets(*modules) -> Iterator[None]:
+    """
+    Temporarily replace Canvas and Label in the given view modules with the
+    recording stand-ins, so views can be built without a display.
+    """
+    saved = [(m, m.Canvas, m.Label if hasattr(m, "Label") else None) for m in modules]
+    try:
+        for module in modules:
+            module.Canvas = RecordingCanvas
+            if hasattr(module, "Label"):
+                module.Label = RecordingLabel
+        yield
+    finally:
+        for module, canvas, label in saved:
+            module.Canvas = canvas
+            if label is not None:
+                module.Label = label
@@ -1,51 +1,191 @@
+import time
+_IMPORTS_START = time.perf_counter()
+
+import argparse
 import logging
 from tkinter import Tk
 from controllers.game_controller import GameController
+from controllers.leaf_storm import LeafStorm
+from controllers.autopilot import Autopilot
+from controllers.quality_governor import QualityGovernor
 from models.game_state import GameState
 from views.game_view import GameView
 from views.menu_view import MenuView
 from utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT,
-    STREAM_AUDIO_URL, YOUTUBE_AUDIO_URL, BACKGROUND_MUSIC_PATH
+    STREAM_AUDIO_URL, YOUTUBE_AUDIO_URL, BACKGROUND_MUSIC_PATH,
+    TK_CALL_BUDGET_FIXED, TK_CALL_BUDGET_PER_LEAF, LEADERBOARD_PLAYER,
 )
 from utils.audio import (
     play_stream_url, play_youtube_stream,
     play_youtube_audio, play_local_music_loop,
-    prepare_youtube_stream, play_prepared_stream, get_prepared_stream_url
+    prepare_youtube_stream, prepare_stream_url, get_prepared_stream_url,
+    prepare_youtube_stream_async, shutdown_audio,
 )
+from utils.tracing import tracer, configure_tracing
+from utils.tk_accounting import TkAccounting, TkCallBudget
+from utils.perf_profiles import PROFILES, RENDER_BACKENDS, resolve_profile
+
+_IMPORTS_END = time.perf_counter()
 
 def _looks_like_youtube(url: str) -> bool:
     return any(host in url for host in ("youtube.com", "youtu.be"))
 
-def main():
-    # Basic logging to console
-    logging.basicConfig(
-        level=logging.INFO,
-        format="[%(levelname)s] %(name)s: %(message)s"
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fall Catcher")
+    parser.add_argument(
+        "--trace", metavar="PATH",
+        help="write a Chrome-trace JSON of startup phases to PATH (or set LEAF_CATCHER_TRACE)"
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH",
+        help="collect per-phase timing histograms and export them to PATH (.csv or .json) on exit"
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=0.0, metavar="SECONDS",
+        help="with --profile, also export every SECONDS while playing"
+    )
+    parser.add_argument(
+        "--tk-accounting", action="store_true",
+        help="count canvas/label Tk calls per frame (shown on the F3 overlay, summarized on exit)"
+    )
+    parser.add_argument(
+        "--player", default=LEADERBOARD_PLAYER,
+        help="name recorded on the leaderboard when the game is closed (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--stress", action="store_true",
+        help="skip the menu and run the leaf-storm stress test (also on the menu as STRESS TEST)"
+    )
+    parser.add_argument(
+        "--autopilot", action="store_true",
+        help="attract mode: the basket plays itself (games are not recorded on the leaderboard)"
+    )
+    parser.add_argument(
+        "--threaded-sim", action="store_true",
+        help="run the simulation on its own thread; Tk only draws snapshots and forwards input "
+             "(input-to-photon latency is logged on exit either way)"
+    )
+    parser.add_argument(
+        "--asyncio", action="store_true",
+        help="run Tk from an asyncio loop that paces frames on a timer; yt-dlp resolution and "
+             "the spectator server run as tasks on it and are cancelled on exit"
+    )
+    parser.add_argument(
+        "--publish", nargs="?", const="", metavar="ADDRESS",
+        help="stream game state to spectators (src/spectator.py) on host:port or unix:PATH "
+             "(default 127.0.0.1:47800)"
     )
+    parser.add_argument(
+        "--perf-profile", metavar="NAME",
+        help=f"performance profile: {', '.join(PROFILES)} or one defined in the config file (default: balanced)"
+    )
+    parser.add_argument(
+        "--perf-config", metavar="PATH",
+        help="TOML file with [profiles.NAME] tables and an optional top-level profile = NAME "
+             "(default: leaf_catcher.toml in the project root, if present)"
+    )
+    parser.add_argument("--tick-ms", type=int, help="override the profile: game loop interval (a multiple of 16)")
+    parser.add_argument("--max-leaves", type=int, help="override the profile: cap on live leaves (0 = none)")
+    parser.add_argument("--render-backend", choices=RENDER_BACKENDS, help="override the profile: images or shapes")
+    parser.add_argument("--asset-scale", type=float, help="override the profile: image resolution, 0-1")
+    parser.add_argument(
+        "--no-adaptive-quality", dest="adaptive_quality", action="store_const", const=False,
+        help="override the profile: never lower quality under load"
+    )
+    parser.add_argument(
+        "--memory-log", metavar="PATH",
+        help="sample memory (tracemalloc, RSS, live leaves/images, canvas items) to a rotating log at PATH"
+    )
+    parser.add_argument(
+        "--memory-interval", type=float, default=60.0, metavar="SECONDS",
+        help="with --memory-log, seconds between samples (default 60)"
+    )
+    args = parser.parse_args(argv)
+    overrides = {
+        "tick_ms": args.tick_ms, "max_leaves": args.max_leaves,
+        "render_backend": args.render_backend, "asset_scale": args.asset_scale,
+        "adaptive_quality": args.adaptive_quality,
+    }
+    try:
+        args.perf = resolve_profile(args.perf_profile, args.perf_config, overrides)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    return args
+
+def main(argv=None):
+    args = _parse_args(argv)
+    configure_tracing(args.trace)
+    tracer.complete("imports", _IMPORTS_START, _IMPORTS_END)
+
+    # Basic logging to console
+    with tracer.span("logging_setup"):
+        logging.basicConfig(
+            level=logging.INFO,
+            format="[%(levelname)s] %(name)s: %(message)s"
+        )
     logger = logging.getLogger("leaf_catcher.app")
 
-    root = Tk()
-    root.title("Fall Catcher")
-    root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
-    root.resizable(False, False)
+    with tracer.span("tk_root"):
+        root = Tk()
+        root.title("Fall Catcher")
+        root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+        root.resizable(False, False)
+
+    controllers = []  # the active game controller, for exporting profiles on exit
+    scored_games = []  # controllers of real games (not stress or autopilot runs), recorded on exit
+    game_views = []
+    threaded_games = []
+    # Optional features import their modules (asyncio, sqlite3, tracemalloc) only when used,
+    # so they stay off the time-to-menu path
+    from utils.leaderboard import Leaderboard
+    leaderboard = Leaderboard()
+    aio = None
+    if args.asyncio:
+        from utils.async_tk import AsyncTkLoop
+        aio = AsyncTkLoop(root)
+
+        async def stop_audio():
+            # Before background tasks are cancelled; nothing else runs on the loop meanwhile
+            shutdown_audio()
+
+        aio.add_shutdown(stop_audio)
+    publisher = None
+    if args.publish is not None:
+        from utils.spectator import SpectatorPublisher
+        publisher = SpectatorPublisher(args.publish)
+        if aio is not None:
+            async def start_publisher():
+                try:
+                    await publisher.start_async()
+                except (OSError, ValueError) as e:
+                    logger.warning("Spectator stream disabled: %s", e)
+
+            aio.spawn(start_publisher())
+            aio.add_shutdown(publisher.stop_async)
+        else:
+            try:
+                publisher.start()
+            except (OSError, ValueError) as e:
+                logger.warning("Spectator stream disabled: %s", e)
+                publisher = None
+    tk_accounting = None
+    if args.tk_accounting:
+        tk_accounting = TkAccounting(TkCallBudget(TK_CALL_BUDGET_FIXED, TK_CALL_BUDGET_PER_LEAF))
 
     # Create menu first; prepare audio while user is on the menu
     def on_play_clicked():
-        # Start music only now
+        tracer.instant("play_clicked")
+        # Start music only now. The audio worker reuses (and just unpauses) a
+        # stream prepared on the menu, or resolves/opens it if not ready yet.
         if STREAM_AUDIO_URL:
             if _looks_like_youtube(STREAM_AUDIO_URL):
-                # If already prepared, use it; else resolve+play directly
-                if not play_prepared_stream():
-                    logger.info("Prepared stream not ready; resolving+playing YouTube now...")
-                    play_youtube_stream(STREAM_AUDIO_URL)
+                play_youtube_stream(STREAM_AUDIO_URL)
             else:
                 play_stream_url(STREAM_AUDIO_URL)
         elif YOUTUBE_AUDIO_URL:
             # Prefer streaming from YouTube as well (no download) after click
-            if not play_prepared_stream():
-                logger.info("Prepared stream not ready; resolving+playing YouTube now...")
-                play_youtube_stream(YOUTUBE_AUDIO_URL)
+            play_youtube_stream(YOUTUBE_AUDIO_URL)
         else:
             # Fallback to local file if present
             try:
@@ -58,29 +198,152 @@ def main():
             except Exception as e:
                 logger.warning("Error while attempting to play local music: %s", e)
 
+        game_controller = start_game(threaded=args.threaded_sim)
+        if args.perf.adaptive_quality and not args.threaded_sim:
+            # Not in stress mode, which has to see the full cost of every leaf. Not with the
+            # threaded simulation either: its ticks never include the render the governor weighs.
+            QualityGovernor(game_controller).start()
+        if args.autopilot:
+            Autopilot(game_controller).engage()
+        else:
+            scored_games.append(game_controller)
+
+    def start_game(threaded=False):
         # Remove menu and start game
         menu.destroy()
         game_state = GameState()
-        game_view = GameView(root, game_state)
-        game_controller = GameController(game_state, game_view)
-        game_controller.start_game(root)
+        with tracer.span("game_view_assets"):
+            game_view = GameView(root, game_state, profile=args.perf)
+        if tk_accounting is not None:
+            game_view.attach_tk_accounting(tk_accounting)
+        game_views.append(game_view)
+        if threaded:
+            # The view draws its own copy of the state, refilled from the simulation's snapshots
+            game_controller = GameController(GameState(), profile=args.perf)
+        else:
+            game_controller = GameController(game_state, game_view, profile=args.perf)
+        if args.profile:
+            game_controller.profiler.enable(args.profile, args.profile_interval)
+        controllers.append(game_controller)
+        if publisher is not None:
+            publisher.attach(game_controller)
+        with tracer.span("start_game"):
+            if threaded:
+                from controllers.threaded_sim import ThreadedGame
+                threaded_game = ThreadedGame(game_controller, game_view)
+                threaded_games.append(threaded_game)
+                threaded_game.start(root, schedule_frames=aio is None)
+                frame = threaded_game.render_latest
+            else:
+                game_controller.start_game(root, schedule_ticks=aio is None)
+                frame = game_controller.run_frame
+            if aio is not None:
+                aio.drive(frame, lambda: game_controller.tick_ms)
+        return game_controller
+
+    def on_stress_clicked():
+        # Leaf-storm stress mode: no music, ramp spawning until frames go over budget
+        game_controller = start_game()
+
+        def on_done(result):
+            logger.info("Stress result: %s", result.describe())
+            print(f"[LeafCatcher] {result.describe()}")
+            game_controller.game_view.show_message(result.describe())
+
+        LeafStorm(game_controller, on_done=on_done).start()
 
     # Show menu
-    menu = MenuView(root, on_play=on_play_clicked)
-
-    # Prepare audio stream while on menu (no playback yet)
-    if STREAM_AUDIO_URL and _looks_like_youtube(STREAM_AUDIO_URL):
-        logger.info("Preparing YouTube stream while on menu...")
-        prepare_youtube_stream(STREAM_AUDIO_URL)
-    elif not STREAM_AUDIO_URL and YOUTUBE_AUDIO_URL and _looks_like_youtube(YOUTUBE_AUDIO_URL):
-        logger.info("Preparing YouTube stream while on menu (fallback URL)...")
-        prepare_youtube_stream(YOUTUBE_AUDIO_URL)
-    else:
-        # Non-YouTube streams don't need preparation
-        if STREAM_AUDIO_URL:
-            logger.info("Streaming URL configured (non-YouTube). Will start on Play.")
+    with tracer.span("menu_view"):
+        menu = MenuView(root, on_play=on_play_clicked, on_stress=on_stress_clicked, leaderboard=leaderboard,
+                        profile=args.perf)
+    if args.stress:
+        root.after_idle(on_stress_clicked)
+    if tracer.enabled:
+        # First idle after drawing is when Tk paints the menu
+        root.after_idle(lambda: tracer.instant("menu_shown"))
 
-    root.mainloop()
+    # Prepare audio stream while on menu (no playback yet). This also imports
+    # yt-dlp on the audio worker; it is deferred to idle so the menu paints
+    # before that import starts competing for the GIL.
+    def prepare_audio():
+        with tracer.span("audio_prepare"):
+            _prepare_audio()
+
+    def prepare_youtube(url):
+        if aio is not None:
+            # Resolve off the audio worker, so play/stop are not queued behind yt-dlp
+            aio.spawn(prepare_youtube_stream_async(url))
+        else:
+            prepare_youtube_stream(url)
+
+    def _prepare_audio():
+        if STREAM_AUDIO_URL and _looks_like_youtube(STREAM_AUDIO_URL):
+            logger.info("Preparing YouTube stream while on menu...")
+            prepare_youtube(STREAM_AUDIO_URL)
+        elif not STREAM_AUDIO_URL and YOUTUBE_AUDIO_URL and _looks_like_youtube(YOUTUBE_AUDIO_URL):
+            logger.info("Preparing YouTube stream while on menu (fallback URL)...")
+            prepare_youtube(YOUTUBE_AUDIO_URL)
+        elif STREAM_AUDIO_URL:
+            # Non-YouTube streams need no resolving; just open and buffer them paused
+            logger.info("Pre-rolling stream URL while on menu (non-YouTube)...")
+            prepare_stream_url(STREAM_AUDIO_URL)
+
+    if not args.stress:
+        root.after_idle(prepare_audio)
+
+    monitor = None
+    if args.memory_log:
+        from tkinter import PhotoImage
+        from models.leaf import Leaf
+        from utils.memory import MemoryMonitor
+
+        def canvas_items():
+            if not game_views:
+                return 0
+            return len(game_views[-1].canvas.find_all())
+
+        monitor = MemoryMonitor(count_types=(Leaf, PhotoImage), canvas_items=canvas_items, log_path=args.memory_log)
+        monitor.start()
+        interval_ms = max(1, int(args.memory_interval * 1000))
+
+        def sample_memory():
+            monitor.sample()
+            root.after(interval_ms, sample_memory)
+
+        root.after(interval_ms, sample_memory)
+
+    try:
+        if aio is not None:
+            aio.run()
+        else:
+            root.mainloop()
+    finally:
+        for threaded_game in threaded_games:
+            threaded_game.stop()
+        tracer.write()
+        for controller in controllers:
+            controller.profiler.export_now()
+            latency = controller.input_latency
+            if latency.count:
+                lat = latency.summary()
+                logger.info("Input-to-photon latency (%s): p50 %.1f ms, p99 %.1f ms over %d inputs",
+                            "threaded simulation" if controller.game_view is None else "single thread",
+                            lat["p50"], lat["p99"], latency.count)
+        if monitor is not None:
+            monitor.stop()
+        for game in scored_games:
+            if game.game_state.score > 0:
+                leaderboard.submit(args.player, game.game_state.score)
+        leaderboard.close()
+        if publisher is not None:
+            publisher.stop()
+        shutdown_audio()
+        if tk_accounting is not None and tk_accounting.frames:
+            logger.info(
+                "Tk calls: %d frames, max %d/frame, %d over budget; totals %s",
+                tk_accounting.frames, tk_accounting.max_frame_calls,
+                tk_accounting.over_budget_frames, dict(tk_accounting.totals),
+            )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+import math
+from typing import Dict, Optional
+
+from utils.constants import WINDOW_WIDTH, AUTOPILOT_HORIZON_TICKS, AUTOPILOT_BUCKET_PX
+
+
+class Autopilot:
+    """
+    Plays the game for unattended soak runs, attract mode and load generation.
+
+    Every tick it predicts where each falling leaf meets the basket band
+    (ticks to arrive from its speed and y-distance, sideways position from
+    its drift; sway averages out) and which basket positions would catch it
+    and are reachable in time at the basket's speed. The catch intervals of
+    leaves arriving within the horizon are added to a sparse, bucketed
+    difference array (only the buckets where an interval starts or ends),
+    and the bucket covered by the most intervals (nearest on ties) is the
+    target (leaves are weighted slightly by urgency to break ties). That is
+    O(k log k) per tick for k catchable leaves, so a nearly empty screen
+    costs next to nothing. With nothing catchable inside the horizon it
+    heads for the next leaf to land. The basket moves toward the
+    target by at most its own speed, like a player would.
+    """
+
+    def __init__(self, controller, horizon_ticks: int = AUTOPILOT_HORIZON_TICKS,
+                 bucket_px: int = AUTOPILOT_BUCKET_PX, replan_ticks: int = 1):
+        self.controller = controller
+        self.horizon_ticks = horizon_ticks
+        self.bucket_px = bucket_px
+        self.replan_ticks = replan_ticks  # choose a new target every N ticks; move every tick
+        self._ticks_since_plan = 0
+        self._buckets = WINDOW_WIDTH // bucket_px + 1
+        self._edges: Dict[int, float] = {}  # bucket -> change in coverage
+        self.target_x: Optional[float] = None
+        self._event = None
+
+    @property
+    def engaged(self) -> bool:
+        return self._event is not None
+
+    def engage(self) -> None:
+        """
+        Steer every tick (before leaves move) until disengage().
+        """
+        if self._event is None:
+            self._event = self.controller.scheduler.call_every(1, self.update)
+
+    def disengage(self) -> None:
+        if self._event is not None:
+            self.controller.scheduler.cancel(self._event)
+            self._event = None
+
+    def update(self) -> None:
+        state = self.controller.game_state
+        basket = state.basket
+        self._ticks_since_plan += 1
+        if self.target_x is None or self._ticks_since_plan >= self.replan_ticks:
+            self.target_x = self.choose_target()
+            self._ticks_since_plan = 0
+        if self.target_x is None:
+            return
+        dx = max(-basket.speed, min(basket.speed, self.target_x - basket.x))
+        if dx:
+            state.set_basket_position(int(round(basket.x + dx)))
+
+    def choose_target(self) -> Optional[float]:
+        """
+        Basket x that catches the most reachable leaves arriving within the
+        horizon; if none is reachable, the landing spot of the next leaf.
+        """
+        state = self.controller.game_state
+        basket = state.basket
+        bx, by, bw = basket.x, basket.y, basket.width
+        by2 = by + basket.height
+        max_x = WINDOW_WIDTH - bw
+        step = basket.speed
+        horizon = self.horizon_ticks
+        bucket_px = self.bucket_px
+        last_bucket = self._buckets - 1
+        edges = self._edges
+        edges.clear()
+
+        soonest_t = math.inf
+        soonest_x = None
+        for leaf in state.leaves:
+            bottom = leaf.y + leaf.size
+            if bottom > by2 + leaf.speed:
+                continue  # already below the catch band
+            t = (by - bottom) / leaf.speed if bottom < by else 0.0
+            if t > horizon and t >= soonest_t:
+                continue  # most leaves: neither catchable yet nor the next to land
+            land_x = leaf.x + leaf.drift * t
+            if t < soonest_t:
+                soonest_t = t
+                soonest_x = land_x + (leaf.size - bw) / 2
+            if t > horizon:
+                continue
+            # Basket positions overlapping the leaf, clipped to where the basket can get in time
+            lo = max(land_x - bw, bx - step * t, 0)
+            hi = min(land_x + leaf.size, bx + step * t, max_x)
+            if lo > hi:
+                continue
+            # Every catch counts ~1; sooner leaves count up to 1.5 so ties go to the urgent catch
+            weight = 1.0 + 0.5 * (horizon - t) / horizon
+            first = min(last_bucket, int(lo // bucket_px))
+            after = min(last_bucket, int(hi // bucket_px)) + 1
+            edges[first] = edges.get(first, 0.0) + weight
+            edges[after] = edges.get(after, 0.0) - weight
+
+        if edges:
+            # Coverage is constant between edges; in each run take the bucket nearest the basket
+            nearest = (bx - bucket_px / 2) / bucket_px
+            starts = sorted(edges)
+            best_bucket = -1
+            best_score = 1e-9  # ignore float residue in empty runs
+            best_distance = math.inf
+            running = 0.0
+            for n, start in enumerate(starts):
+                running += edges[start]
+                if running < best_score - 1e-9 or start > last_bucket:
+                    continue
+                end = starts[n + 1] - 1 if n + 1 < len(starts) else last_bucket
+                i = max(start, min(end, math.ceil(nearest - 0.5)))
+                distance = abs(i * bucket_px + bucket_px / 2 - bx)
+                if running > best_score + 1e-9 or distance < best_distance:
+                    best_bucket, best_score, best_distance = i, running, distance
+            if best_bucket >= 0:
+                return max(0, min(max_x, best_bucket * bucket_px + bucket_px / 2))
+        if soonest_x is None:
+            return None
+        return max(0, min(max_x, soonest_x))
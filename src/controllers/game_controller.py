@@ -1,74 +1,140 @@
 import random
-from typing import Optional
+import time
+from typing import Callable, List, Optional
 
 from models.game_state import GameState
 from models.leaf import Leaf
+from models.wind import Wind
 from utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT,
     LEAF_MIN_SPEED, LEAF_MAX_SPEED, LEAF_SIZE, LEAF_COLOR,
-    SCORE_INCREMENT, TICK_MS, SPAWN_INTERVAL_MS
+    SCORE_INCREMENT, TICK_MS, SPAWN_INTERVAL_MS,
+    HUD_TOGGLE_KEY, PERF_WINDOW_FRAMES,
 )
+from utils.perf import FrameStats, InputLatency
+from utils.perf_profiles import PerfProfile, PROFILES
+from utils.profiling import Profiler
+from utils.scheduler import TickScheduler, ms_to_ticks
 
 class GameController:
-    def __init__(self, game_state: GameState, game_view: Optional[object] = None):
+    def __init__(self, game_state: GameState, game_view: Optional[object] = None, seed: Optional[int] = None,
+                 profile: Optional[PerfProfile] = None):
         self.game_state = game_state
         self.game_view = game_view
         self.root = getattr(game_view, "master", None)
-        self._spawn_after_id = None
         self._loop_after_id = None
+        self.profile = profile or PROFILES["balanced"]
+        # The loop runs every tick_ms and catches up tick_ms // TICK_MS simulation steps
+        self.tick_ms = self.profile.tick_ms
+        self.max_leaves = self.profile.max_leaves  # 0 = no cap
+        # Timed game events (spawns, and future gusts/power-ups) run on
+        # simulation ticks inside the single tick loop, identically headless.
+        self.scheduler = TickScheduler()
+        self.spawn_event = self.scheduler.call_every(ms_to_ticks(SPAWN_INTERVAL_MS), self.spawn_leaf)
+        # All game randomness (spawns, wind) comes from one RNG, so a seed reproduces a run
+        self.rng = random.Random(seed)
+        self.wind = Wind(self.rng)
+        self.scheduler.call_later(self.wind.next_gust_delay(), self._start_gust)
+        # Called after every tick with that tick's frame time in ms (e.g. LeafStorm)
+        self.tick_hooks: List[Callable[[float], None]] = []
+        # Per-phase timing hooks. Histograms are off unless enabled (e.g. via
+        # app --profile); the HUD's rolling FrameStats listen to the same hooks
+        # only while the HUD is shown, so otherwise every phase is a no-op.
+        self.profiler = Profiler()
+        self.frame_stats = FrameStats(PERF_WINDOW_FRAMES)
+        # Time from a key/mouse event to the repaint that shows it
+        self.input_latency = InputLatency(PERF_WINDOW_FRAMES)
+        if game_view is not None and hasattr(game_view, "attach_input_latency"):
+            game_view.attach_input_latency(self.input_latency)
+        if game_view is not None and hasattr(game_view, "attach_frame_stats"):
+            game_view.attach_frame_stats(self.frame_stats)
+        if game_view is not None and hasattr(game_view, "attach_profiler"):
+            game_view.attach_profiler(self.profiler)
 
     # -- Game loop management --
 
-    def start_game(self, root: Optional[object] = None):
+    def start_game(self, root: Optional[object] = None, schedule_ticks: bool = True):
+        """
+        Bind input and start the tick loop on root.after(). With
+        schedule_ticks=False the caller drives run_frame() itself (e.g. app --asyncio).
+        """
         # Allow app to pass root explicitly
         if root is not None:
             self.root = root
         # Key bindings if we have a Tk root
         if self.root:
-            self.root.bind("<Left>", lambda _e: self.move_basket('left'))
-            self.root.bind("<Right>", lambda _e: self.move_basket('right'))
+            self.root.bind("<Left>", lambda _e: self._on_key('left'))
+            self.root.bind("<Right>", lambda _e: self._on_key('right'))
+            if self.game_view and hasattr(self.game_view, "toggle_hud"):
+                self.root.bind(HUD_TOGGLE_KEY, lambda _e: self.game_view.toggle_hud())
         # Mouse movement on canvas (move basket with mouse)
         if self.game_view and hasattr(self.game_view, "canvas") and self.game_view.canvas is not None:
             canvas = self.game_view.canvas
             canvas.bind("<Motion>", self._on_mouse_move)
             canvas.bind("<B1-Motion>", self._on_mouse_move)  # also allow dragging
-        # Start loops
-        self._schedule_spawn()
-        self._schedule_tick()
+        # Start the tick loop; spawns are scheduled on its ticks
+        if schedule_ticks:
+            self._schedule_tick()
 
     def _schedule_tick(self):
         if self.root:
-            self._loop_after_id = self.root.after(TICK_MS, self._tick)
-
-    def _schedule_spawn(self):
-        if self.root:
-            self._spawn_after_id = self.root.after(SPAWN_INTERVAL_MS, self._spawn_and_reschedule)
-
-    def _spawn_and_reschedule(self):
-        self.spawn_leaf()
-        self._schedule_spawn()
+            self._loop_after_id = self.root.after(self.tick_ms, self._tick)
 
     def _tick(self):
-        self.update_game()
+        self.run_frame()
         self._schedule_tick()
 
+    def run_frame(self):
+        """
+        One loop iteration (every tick_ms): the simulation steps it covers, rendering the last.
+        """
+        steps = max(1, self.tick_ms // TICK_MS)
+        for i in range(steps):
+            self.step(render=i == steps - 1)
+
+    def step(self, render: bool = True):
+        """
+        Advance the game by one tick: fire due scheduled events, then update.
+        The Tk loop calls this every TICK_MS (several times per loop with a
+        slower profile, rendering only the last); headless drivers may call it directly.
+        """
+        if render:
+            self.frame_stats.mark_tick()
+        start = time.perf_counter()
+        self.scheduler.advance()
+        self.update_game(render)
+        frame_ms = (time.perf_counter() - start) * 1000.0
+        self.profiler.tick()
+        if self.tick_hooks:
+            for hook in tuple(self.tick_hooks):  # hooks may remove themselves
+                hook(frame_ms)
+
     # -- Core logic --
 
     def spawn_leaf(self):
-        x = random.randint(0, max(0, WINDOW_WIDTH - LEAF_SIZE))
-        y = -LEAF_SIZE
-        speed = random.randint(LEAF_MIN_SPEED, LEAF_MAX_SPEED)
-        leaf = Leaf(x=x, y=y, speed=speed, size=LEAF_SIZE, color=LEAF_COLOR)
-        self.game_state.add_leaf(leaf)
+        if self.max_leaves and len(self.game_state.leaves) >= self.max_leaves:
+            return
+        with self.profiler.phase("spawn"):
+            x = self.rng.randint(0, max(0, WINDOW_WIDTH - LEAF_SIZE))
+            y = -LEAF_SIZE
+            speed = self.rng.randint(LEAF_MIN_SPEED, LEAF_MAX_SPEED)
+            leaf = Leaf(x=x, y=y, speed=speed, size=LEAF_SIZE, color=LEAF_COLOR,
+                        drift=self.wind.random_drift(), phase=self.wind.random_phase())
+            self.game_state.add_leaf(leaf)
+
+    def _start_gust(self):
+        self.wind.start_gust()
+        self.scheduler.call_later(self.wind.next_gust_delay(), self._start_gust)
 
     def update_score(self, points):
-        self.game_state.score += points
-        if self.game_view:
-            # Keep both available for compatibility
-            if hasattr(self.game_view, "update_score_display"):
-                self.game_view.update_score_display(self.game_state.score)
-            else:
-                self.game_view.update_score()
+        with self.profiler.phase("score"):
+            self.game_state.score += points
+            if self.game_view:
+                # Keep both available for compatibility
+                if hasattr(self.game_view, "update_score_display"):
+                    self.game_view.update_score_display(self.game_state.score)
+                else:
+                    self.game_view.update_score()
 
     def move_basket(self, direction):
         if direction == 'left':
@@ -78,33 +144,51 @@ class GameController:
         # Keep tests-compatible attribute updated
         self.game_state.basket_position = self.game_state.basket.x
 
+    def _on_key(self, direction):
+        self.input_latency.input()
+        self.move_basket(direction)
+
     def _on_mouse_move(self, event):
+        self.input_latency.input()
+        self.center_basket(event.x)
+
+    def center_basket(self, x):
         """
-        Center the basket on the mouse x-coordinate and clamp to canvas bounds.
+        Center the basket on x (e.g. the mouse x-coordinate), clamped to canvas bounds.
         """
         half_w = self.game_state.basket.width // 2
-        new_x = int(event.x - half_w)
+        new_x = int(x - half_w)
         new_x = max(0, min(WINDOW_WIDTH - self.game_state.basket.width, new_x))
         self.game_state.basket.x = new_x
         self.game_state.basket_position = new_x  # keep tests-compatible attribute updated
 
-    def update_game(self):
-        # Update leaves positions
-        to_remove = []
-        for leaf in self.game_state.leaves:
-            leaf.update()
-            # Remove if off bottom
-            if leaf.y > WINDOW_HEIGHT:
-                to_remove.append(leaf)
+    def update_game(self, render: bool = True):
+        with self.profiler.phase("move"):
+            # Update leaves positions: fall plus this tick's wind field
+            wind = self.wind.advance()
+            leaves = self.game_state.leaves
+            for leaf in leaves:
+                leaf.update(wind)
+            # Remove leaves that fell off the bottom (they are below the basket,
+            # so sweeping before collision detection cannot drop a catch) or
+            # drifted entirely out through a side (the basket never leaves the window)
+            self.game_state.leaves = [
+                leaf for leaf in leaves
+                if leaf.y <= WINDOW_HEIGHT and -leaf.size < leaf.x < WINDOW_WIDTH
+            ]
 
         # Collision detection
-        caught = self.check_collision()
-        for leaf in to_remove:
-            self.game_state.remove_leaf(leaf)
+        with self.profiler.phase("collision"):
+            caught = self.check_collision()
 
         # Update view
-        if self.game_view:
+        if self.game_view and render:
             self.game_view.render()
+            latency = self.input_latency
+            if latency.pending and self.root is not None:
+                # Stamp once Tk has repainted: idle callbacks run in order, after the
+                # redisplay this render queued. Later inputs are not in this frame.
+                self.root.after_idle(latency.presented, latency.seq)
 
         # Update score if any caught
         if caught:
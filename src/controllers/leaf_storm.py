@@ -0,0 +1,145 @@
+import logging
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+from controllers.game_controller import GameController
+from utils.constants import (
+    TICK_MS,
+    STRESS_FRAME_BUDGET_MS, STRESS_START_RATE, STRESS_RATE_GROWTH,
+    STRESS_STEP_MS, STRESS_FRAME_PERCENTILE,
+)
+
+logger = logging.getLogger("leaf_catcher.stress")
+
+
+class StormStep(NamedTuple):
+    spawn_rate: float      # leaves per second
+    max_live_leaves: int
+    frame_ms: float        # STRESS_FRAME_PERCENTILE-th percentile frame time
+
+
+class StormResult(NamedTuple):
+    max_live_leaves: int   # most live leaves seen in a step that stayed within budget
+    spawn_rate: float      # spawn rate of that step
+    budget_ms: float
+    steps: List[StormStep]
+
+    def describe(self) -> str:
+        fps = 1000.0 / self.budget_ms
+        return (f"Sustained {self.max_live_leaves} live leaves at {fps:.0f} FPS "
+                f"(spawn rate {self.spawn_rate:.0f}/s, {len(self.steps)} steps)")
+
+
+class LeafStorm:
+    """
+    Stress mode: ramps the spawn rate of a running GameController, one step
+    every STRESS_STEP_MS of game time, until the frame time percentile of a
+    step exceeds the budget. The result is the largest live leaf count seen
+    in a step that stayed within budget.
+
+    Frame time is GameController.update_game() (simulation and canvas
+    commands) plus spawning for every simulation step of a frame (a profile
+    with tick_ms > TICK_MS runs several per frame) and, with a Tk root,
+    root.update_idletasks() once per frame so the canvas repaint of the same
+    frame is included, as in QualityGovernor. Works headless via
+    run_headless().
+    """
+
+    def __init__(self, controller: GameController, budget_ms: float = STRESS_FRAME_BUDGET_MS,
+                 start_rate: float = STRESS_START_RATE, growth: float = STRESS_RATE_GROWTH,
+                 step_ms: int = STRESS_STEP_MS, max_leaves: int = 200_000,
+                 on_done: Optional[Callable[[StormResult], None]] = None):
+        self.controller = controller
+        self.budget_ms = budget_ms
+        self.growth = growth
+        self.step_ticks = max(1, step_ms // TICK_MS)
+        self.max_leaves = max_leaves
+        self.on_done = on_done
+
+        self.spawn_rate = start_rate
+        self.steps: List[StormStep] = []
+        self.result: Optional[StormResult] = None
+        self._spawn_credit = 0.0
+        self._frame_ms: List[float] = []
+        self._frame_acc = 0.0
+        self._steps_in_frame = 0
+        self._ticks = 0
+        self._max_live = 0
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._running = True
+        # The storm measures how many leaves the machine sustains, so the profile's cap is lifted
+        self.controller.max_leaves = 0
+        self.controller.tick_hooks.append(self._on_tick)
+        logger.info("Leaf storm started: %.1f leaves/s, x%.2f every %d ticks, budget %.2f ms (p%d).",
+                    self.spawn_rate, self.growth, self.step_ticks, self.budget_ms, STRESS_FRAME_PERCENTILE)
+
+    def stop(self) -> None:
+        if self._on_tick in self.controller.tick_hooks:
+            self.controller.tick_hooks.remove(self._on_tick)
+        self._running = False
+
+    def run_headless(self) -> StormResult:
+        """
+        Drive the controller directly (no Tk loop) until the storm finishes.
+        Seed the controller (GameController(..., seed=...)) for repeatable runs.
+        """
+        self.start()
+        while self._running:
+            self.controller.step()
+        return self.result
+
+    # -- Per tick --
+
+    def _on_tick(self, frame_ms: float) -> None:
+        controller = self.controller
+        start = time.perf_counter()
+        self._steps_in_frame += 1
+        last_step = self._steps_in_frame >= max(1, controller.tick_ms // TICK_MS)
+        if last_step and controller.root is not None:
+            # The step that rendered: include the repaint of its frame
+            controller.root.update_idletasks()
+        # Spawn for the next tick at the current rate (may be many per tick)
+        self._spawn_credit += self.spawn_rate * TICK_MS / 1000.0
+        while self._spawn_credit >= 1.0:
+            controller.spawn_leaf()
+            self._spawn_credit -= 1.0
+        self._frame_acc += frame_ms + (time.perf_counter() - start) * 1000.0
+        self._ticks += 1
+        self._max_live = max(self._max_live, len(controller.game_state.leaves))
+        if not last_step:
+            return
+        self._frame_ms.append(self._frame_acc)
+        self._frame_acc = 0.0
+        self._steps_in_frame = 0
+        if self._ticks >= self.step_ticks:
+            self._finish_step()
+
+    def _finish_step(self) -> None:
+        ordered = sorted(self._frame_ms)
+        frame_ms = ordered[min(len(ordered) - 1, int(len(ordered) * STRESS_FRAME_PERCENTILE / 100))]
+        step = StormStep(self.spawn_rate, self._max_live, frame_ms)
+        self.steps.append(step)
+        logger.info("Storm step %d: %.1f leaves/s, up to %d live, p%d frame %.2f ms",
+                    len(self.steps), step.spawn_rate, step.max_live_leaves, STRESS_FRAME_PERCENTILE, frame_ms)
+        self._frame_ms = []
+        self._ticks = 0
+        self._max_live = 0
+        if frame_ms > self.budget_ms or step.max_live_leaves >= self.max_leaves:
+            self._finish()
+        else:
+            self.spawn_rate *= self.growth
+
+    def _finish(self) -> None:
+        self.stop()
+        passing = [s for s in self.steps if s.frame_ms <= self.budget_ms]
+        best = max(passing, key=lambda s: s.max_live_leaves, default=StormStep(0.0, 0, 0.0))
+        self.result = StormResult(best.max_live_leaves, best.spawn_rate, self.budget_ms, list(self.steps))
+        logger.info("Leaf storm finished. %s", self.result.describe())
+        if self.on_done is not None:
+            self.on_done(self.result)
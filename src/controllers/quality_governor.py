@@ -0,0 +1,144 @@
+import logging
+import time
+from typing import List
+
+from controllers.game_controller import GameController
+from utils.constants import (
+    TICK_MS,
+    QUALITY_WINDOW_FRAMES, QUALITY_FRAME_PERCENTILE, QUALITY_UP_FRACTION,
+    QUALITY_UP_WINDOWS, QUALITY_MAX_UP_WINDOWS,
+    QUALITY_LEAF_CAP_FRACTION, QUALITY_MIN_LEAF_CAP,
+)
+
+logger = logging.getLogger("leaf_catcher.quality")
+
+# Each level keeps the savings of the levels before it
+LEVELS = ("full", "leaf cap", "oval leaves", "half frame rate", "no sway")
+
+
+class QualityGovernor:
+    """
+    Adaptive quality: trades detail for a steady frame rate.
+
+    Every QUALITY_WINDOW_FRAMES frames it takes the QUALITY_FRAME_PERCENTILE-th
+    percentile frame time (simulation steps and canvas commands plus, with a
+    Tk root, the repaint via root.update_idletasks(), as in LeafStorm). Over
+    the loop interval it steps down one level at once: cap live leaves in
+    spawn_leaf, draw leaves as ovals, halve the frame rate (two simulation
+    steps per frame), then stop the per-phase sway. It steps back up only
+    after QUALITY_UP_WINDOWS windows in a row under QUALITY_UP_FRACTION of the
+    interval; when a step up has to be undone straight away, that wait
+    doubles (up to QUALITY_MAX_UP_WINDOWS) so it does not oscillate.
+    """
+
+    def __init__(self, controller: GameController, window_frames: int = QUALITY_WINDOW_FRAMES,
+                 up_windows: int = QUALITY_UP_WINDOWS):
+        self.controller = controller
+        self.window_frames = window_frames
+        self.base_up_windows = up_windows
+        self.up_windows = up_windows
+        self.level = 0
+        self.changes = 0
+        self._frame_ms: List[float] = []
+        self._frame_acc = 0.0
+        self._steps_in_frame = 0
+        self._quiet_windows = 0
+        self._windows_since_change = 0
+        self._last_change_up = False
+        self._leaf_cap = 0
+
+    @property
+    def level_name(self) -> str:
+        return LEVELS[self.level]
+
+    def start(self) -> None:
+        self.controller.tick_hooks.append(self._on_tick)
+
+    def stop(self) -> None:
+        """
+        Stop watching and restore full quality.
+        """
+        if self._on_tick in self.controller.tick_hooks:
+            self.controller.tick_hooks.remove(self._on_tick)
+        self._set_level(0)
+
+    # -- Per tick --
+
+    def _on_tick(self, frame_ms: float) -> None:
+        controller = self.controller
+        self._frame_acc += frame_ms
+        self._steps_in_frame += 1
+        if self._steps_in_frame < max(1, controller.tick_ms // TICK_MS):
+            return
+        # Last step of a frame (the one that rendered)
+        if controller.root is not None:
+            start = time.perf_counter()
+            controller.root.update_idletasks()
+            self._frame_acc += (time.perf_counter() - start) * 1000.0
+        self.observe(self._frame_acc)
+        self._frame_acc = 0.0
+        self._steps_in_frame = 0
+
+    def observe(self, frame_ms: float) -> None:
+        """
+        Record one frame's time; decides once per window.
+        """
+        self._frame_ms.append(frame_ms)
+        if len(self._frame_ms) < self.window_frames:
+            return
+        ordered = sorted(self._frame_ms)
+        self._frame_ms = []
+        frame_ms = ordered[min(len(ordered) - 1, int(len(ordered) * QUALITY_FRAME_PERCENTILE / 100))]
+        budget_ms = float(self.controller.tick_ms)
+        self._windows_since_change += 1
+
+        if frame_ms > budget_ms:
+            self._quiet_windows = 0
+            if self.level < len(LEVELS) - 1:
+                if self._last_change_up and self._windows_since_change <= self.up_windows:
+                    # The step up did not hold: wait longer before trying again
+                    self.up_windows = min(QUALITY_MAX_UP_WINDOWS, self.up_windows * 2)
+                self._step(+1, frame_ms, budget_ms)
+            return
+
+        if self._last_change_up and self._windows_since_change > self.up_windows:
+            self.up_windows = self.base_up_windows  # the last step up held
+        if frame_ms < budget_ms * QUALITY_UP_FRACTION and self.level > 0:
+            self._quiet_windows += 1
+            if self._quiet_windows >= self.up_windows:
+                self._step(-1, frame_ms, budget_ms)
+        else:
+            self._quiet_windows = 0
+
+    # -- Levels --
+
+    def _step(self, delta: int, frame_ms: float, budget_ms: float) -> None:
+        self._set_level(self.level + delta)
+        self._last_change_up = delta < 0
+        self._windows_since_change = 0
+        self._quiet_windows = 0
+        self.changes += 1
+        logger.info("Quality %s to %d (%s): p%d frame %.2f ms vs %.2f ms interval",
+                    "down" if delta > 0 else "up", self.level, self.level_name,
+                    QUALITY_FRAME_PERCENTILE, frame_ms, budget_ms)
+
+    def _set_level(self, level: int) -> None:
+        controller = self.controller
+        profile = controller.profile
+        if level >= 1 and self.level == 0:
+            live = len(controller.game_state.leaves)
+            self._leaf_cap = max(QUALITY_MIN_LEAF_CAP, int(live * QUALITY_LEAF_CAP_FRACTION))
+        self.level = level
+        # Every setting is derived from the profile, so stepping up restores it exactly
+        if level >= 1:
+            caps = [c for c in (profile.max_leaves, self._leaf_cap) if c]
+            controller.max_leaves = min(caps)
+        else:
+            controller.max_leaves = profile.max_leaves
+        view = controller.game_view
+        if view is not None and hasattr(view, "leaf_images"):
+            view.leaf_images = level < 2
+        controller.tick_ms = profile.tick_ms * (2 if level >= 3 else 1)
+        controller.wind.sway = level < 4
+        self._frame_acc = 0.0
+        self._steps_in_frame = 0
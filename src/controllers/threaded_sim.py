@@ -0,0 +1,219 @@
+import logging
+import queue
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from controllers.game_controller import GameController
+from models.leaf import Leaf
+from utils.constants import TICK_MS, HUD_TOGGLE_KEY, LEAF_COLOR, LEAF_SIZE, SIM_MAX_LAG_TICKS
+
+logger = logging.getLogger("leaf_catcher.sim")
+
+
+class Snapshot(NamedTuple):
+    """
+    Immutable game state after one simulation tick.
+    """
+    tick: int
+    leaves: Tuple[Tuple[float, float, int], ...]  # (x, y, size)
+    basket_x: int
+    score: int
+    input_seq: int  # newest forwarded input applied before this tick
+
+
+class SnapshotBuffer:
+    """
+    Double buffer of snapshots between one writer and one reader. The
+    writer fills the back slot and then flips which slot is the front; the
+    reader takes the front. Snapshots are immutable, so a reader can keep
+    drawing one while the next two are published.
+    """
+
+    def __init__(self, initial: Snapshot):
+        self._slots = [initial, initial]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot: Snapshot) -> None:
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+
+    def latest(self) -> Snapshot:
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread:
+    """
+    Runs a view-less GameController on its own thread at a fixed TICK_MS
+    rate (deadline based, so a slow tick is made up by the next ones; after
+    SIM_MAX_LAG_TICKS behind it drops the backlog instead of fast-forwarding).
+    Inputs come in through post(); after every tick a Snapshot is published.
+    Everything that runs on the controller (scheduler events, tick hooks such
+    as the autopilot or spectator publisher) runs on this thread.
+    """
+
+    def __init__(self, controller: GameController):
+        if controller.game_view is not None:
+            raise ValueError("the simulated controller must not have a view (Tk is not thread-safe)")
+        self.controller = controller
+        self.buffer = SnapshotBuffer(self._snapshot(0))
+        self.ticks_dropped = 0
+        self._inputs: "queue.SimpleQueue[Tuple[int, str, int]]" = queue.SimpleQueue()
+        self._input_seq = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def post(self, seq: int, command: str, value: int = 0) -> None:
+        """
+        Queue an input for the next tick: "left", "right" or ("center", x).
+        """
+        self._inputs.put((seq, command, value))
+
+    def latest(self) -> Snapshot:
+        return self.buffer.latest()
+
+    # -- Worker thread --
+
+    def _run(self) -> None:
+        period = TICK_MS / 1000.0
+        deadline = time.perf_counter()
+        while not self._stop.is_set():
+            self._apply_inputs()
+            self.controller.step(render=False)
+            self.buffer.publish(self._snapshot(self._input_seq))
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif -delay > SIM_MAX_LAG_TICKS * period:
+                dropped = int(-delay / period)
+                self.ticks_dropped += dropped
+                logger.warning("Simulation %d ticks behind; skipping ahead.", dropped)
+                deadline = time.perf_counter()
+
+    def _apply_inputs(self) -> None:
+        controller = self.controller
+        while True:
+            try:
+                seq, command, value = self._inputs.get_nowait()
+            except queue.Empty:
+                return
+            if command == "center":
+                controller.center_basket(value)
+            else:
+                controller.move_basket(command)
+            self._input_seq = seq
+
+    def _snapshot(self, input_seq: int) -> Snapshot:
+        state = self.controller.game_state
+        return Snapshot(
+            self.controller.scheduler.tick,
+            tuple([(leaf.x, leaf.y, leaf.size) for leaf in state.leaves]),
+            state.basket.x,
+            state.score,
+            input_seq,
+        )
+
+
+class ThreadedGame:
+    """
+    Tk side of a game whose simulation runs on a SimulationThread.
+
+    The view draws a render-only GameState that is refilled from the latest
+    snapshot, once per new tick, polled every controller.tick_ms. Key and
+    mouse events are timestamped for input-to-photon latency
+    (controller.input_latency, as in the single-threaded loop) and forwarded
+    to the simulation.
+    """
+
+    def __init__(self, controller: GameController, game_view):
+        self.controller = controller
+        self.game_view = game_view
+        self.state = game_view.game_state
+        self.sim = SimulationThread(controller)
+        self.root = None
+        self._after_id = None
+        self._last_tick = -1
+        self._pool: List[Leaf] = []  # render-side leaves, reused so their images stay attached
+        for attach, value in (("attach_frame_stats", controller.frame_stats),
+                              ("attach_profiler", controller.profiler),
+                              ("attach_input_latency", controller.input_latency)):
+            if hasattr(game_view, attach):
+                getattr(game_view, attach)(value)
+
+    def start(self, root, schedule_frames: bool = True) -> None:
+        """
+        Bind input, start the simulation and redraw on root.after(); with
+        schedule_frames=False the caller drives render_latest() itself.
+        """
+        self.root = root
+        root.bind("<Left>", lambda _e: self._forward("left"))
+        root.bind("<Right>", lambda _e: self._forward("right"))
+        if hasattr(self.game_view, "toggle_hud"):
+            root.bind(HUD_TOGGLE_KEY, lambda _e: self.game_view.toggle_hud())
+        canvas = self.game_view.canvas
+        canvas.bind("<Motion>", lambda e: self._forward("center", e.x))
+        canvas.bind("<B1-Motion>", lambda e: self._forward("center", e.x))
+        self.sim.start()
+        if schedule_frames:
+            self._schedule()
+
+    def stop(self) -> None:
+        if self._after_id is not None and self.root is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.sim.stop()
+
+    def _forward(self, command: str, value: int = 0) -> None:
+        self.sim.post(self.controller.input_latency.input(), command, value)
+
+    def _schedule(self) -> None:
+        self._after_id = self.root.after(self.controller.tick_ms, self._frame)
+
+    def _frame(self) -> None:
+        self.render_latest()
+        self._schedule()
+
+    def render_latest(self) -> bool:
+        """
+        Draw the newest snapshot if it is newer than the last one drawn.
+        """
+        snapshot = self.sim.latest()
+        if snapshot.tick == self._last_tick:
+            return False
+        self._last_tick = snapshot.tick
+        self.controller.frame_stats.mark_tick()
+        self._apply(snapshot)
+        self.game_view.render()
+        latency = self.controller.input_latency
+        if latency.pending and snapshot.input_seq:
+            # Stamped after the repaint, as in GameController.update_game
+            self.root.after_idle(latency.presented, snapshot.input_seq)
+        return True
+
+    def _apply(self, snapshot: Snapshot) -> None:
+        pool = self._pool
+        leaves = snapshot.leaves
+        while len(pool) < len(leaves):
+            pool.append(Leaf(x=0, y=0, speed=0, size=LEAF_SIZE, color=LEAF_COLOR))
+        for leaf, (x, y, size) in zip(pool, leaves):
+            leaf.x = x
+            leaf.y = y
+            leaf.size = size
+        self.state.leaves = pool[:len(leaves)]
+        self.state.set_basket_position(snapshot.basket_x)
+        self.state.score = snapshot.score
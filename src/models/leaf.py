@@ -1,15 +1,21 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 class Leaf:
-    def __init__(self, x: int, y: int, speed: int, size: int, color: str, image: Optional[object] = None):
+    def __init__(self, x: int, y: int, speed: int, size: int, color: str, image: Optional[object] = None,
+                 drift: float = 0.0, phase: int = 0):
         self.x = x
         self.y = y
         self.speed = speed
         self.size = size
         self.color = color
         self.image = image  # Tk PhotoImage or None
+        self.drift = drift  # constant sideways px/tick
+        self.phase = phase  # sway phase bucket, an index into the wind field
 
-    def update(self):
+    def update(self, wind: Optional[Sequence[float]] = None):
+        # wind: per-phase horizontal velocity for this tick (see models.wind.Wind)
+        if wind is not None:
+            self.x += self.drift + wind[self.phase]
         self.y += self.speed
 
     def bbox(self):
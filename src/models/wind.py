@@ -0,0 +1,88 @@
+import math
+import random
+from typing import List
+
+from utils.constants import (
+    WIND_PHASES, SWAY_AMPLITUDE, SWAY_PERIOD_TICKS, LEAF_MAX_DRIFT,
+    GUST_MAX_SPEED, GUST_MIN_MS, GUST_MAX_MS, GUST_INTERVAL_MIN_MS, GUST_INTERVAL_MAX_MS,
+)
+from utils.scheduler import ms_to_ticks
+
+
+class Wind:
+    """
+    Horizontal wind shared by all leaves.
+
+    Each leaf gets a sway phase bucket (0..phases-1) and a constant drift when
+    it spawns. Once per tick, advance() returns the horizontal velocity of
+    every phase bucket (sinusoidal sway plus the current global gust); a leaf
+    then moves by its drift plus field[leaf.phase], so the cost is per tick,
+    not per leaf. The sway repeats every SWAY_PERIOD_TICKS, so it is
+    tabulated once for a whole period and advance() only adds the gust, if
+    any. All randomness comes from rng, so a seeded rng gives the same wind
+    every run.
+    """
+
+    def __init__(self, rng: random.Random, phases: int = WIND_PHASES):
+        self.rng = rng
+        self.phases = phases
+        self.tick = 0
+        omega = 2.0 * math.pi / SWAY_PERIOD_TICKS
+        offsets = [2.0 * math.pi * k / phases for k in range(phases)]
+        # _sway[t][k]: sway velocity of phase k at tick t of the period
+        self._sway = [[SWAY_AMPLITUDE * math.sin(omega * t + offset) for offset in offsets]
+                      for t in range(SWAY_PERIOD_TICKS)]
+        self._calm = [0.0] * phases
+        self.field: List[float] = [0.0] * phases  # reused every gusty tick
+        self.gust = 0.0
+        self.sway = True  # False leaves drift and gusts only (a cheaper, calmer look)
+        self._gust_strength = 0.0
+        self._gust_ticks = 0
+        self._gust_elapsed = 0
+
+    # -- Spawning --
+
+    def random_phase(self) -> int:
+        return self.rng.randrange(self.phases)
+
+    def random_drift(self) -> float:
+        return self.rng.uniform(-LEAF_MAX_DRIFT, LEAF_MAX_DRIFT)
+
+    # -- Gusts --
+
+    def start_gust(self) -> None:
+        """
+        Begin a gust of random direction and length; it swells and fades
+        along half a sine wave.
+        """
+        self._gust_strength = self.rng.uniform(-GUST_MAX_SPEED, GUST_MAX_SPEED)
+        self._gust_ticks = ms_to_ticks(self.rng.uniform(GUST_MIN_MS, GUST_MAX_MS))
+        self._gust_elapsed = 0
+
+    def next_gust_delay(self) -> int:
+        """
+        Ticks until the next gust should start.
+        """
+        return ms_to_ticks(self.rng.uniform(GUST_INTERVAL_MIN_MS, GUST_INTERVAL_MAX_MS))
+
+    # -- Per tick --
+
+    def advance(self) -> List[float]:
+        """
+        Move to the next tick and return the per-phase horizontal velocity
+        (px/tick). The returned list is shared; do not keep or modify it.
+        """
+        self.tick += 1
+        if self._gust_elapsed < self._gust_ticks:
+            self._gust_elapsed += 1
+            self.gust = self._gust_strength * math.sin(math.pi * self._gust_elapsed / self._gust_ticks)
+        else:
+            self.gust = 0.0
+        gust = self.gust
+        row = self._sway[self.tick % SWAY_PERIOD_TICKS] if self.sway else self._calm
+        if not gust:
+            return row
+        field = self.field
+        for k, sway in enumerate(row):
+            field[k] = sway + gust
+        return field
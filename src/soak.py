@@ -0,0 +1,107 @@
+"""
+Headless soak test: simulate hours of play in minutes and check memory stays flat.
+
+    python src/soak.py --hours 6 [--sample-minutes 10] [--log soak_memory.log] [--render]
+
+Runs the real GameController tick loop (GameController.step(), which fires
+spawns from its scheduler) at the real tick and spawn rates, but as fast
+as possible, with the Autopilot playing and without a window (with
+--render, a hidden Tk window is drawn every tick so canvas items and
+PhotoImages are covered too). Every
+--sample-minutes of game time a MemoryMonitor sample is taken. Exits 1 if
+any memory metric kept growing or traced memory grew by more than
+--tolerance-kb after the first (warm-up) sample.
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import Optional
+
+from controllers.autopilot import Autopilot
+from controllers.game_controller import GameController
+from models.game_state import GameState
+from models.leaf import Leaf
+from utils.constants import TICK_MS, AUTOPILOT_SOAK_REPLAN_TICKS
+from utils.memory import MemoryMonitor
+
+logger = logging.getLogger("leaf_catcher.soak")
+
+
+def run_soak(hours: float, sample_minutes: float = 10.0, seed: int = 1234,
+             log_path: Optional[str] = None, tolerance_kb: float = 1024.0, render: bool = False) -> bool:
+    """
+    Simulate `hours` of play; returns True if memory stayed flat.
+    """
+    root = view = None
+    count_types = [Leaf]
+    if render:
+        from tkinter import Tk, PhotoImage
+        from views.game_view import GameView
+        root = Tk()
+        root.withdraw()
+        count_types.append(PhotoImage)
+
+    state = GameState()
+    if render:
+        view = GameView(root, state)
+    controller = GameController(state, view, seed=seed)
+    monitor = MemoryMonitor(
+        count_types=count_types,
+        canvas_items=(lambda: len(view.canvas.find_all())) if view is not None else None,
+        log_path=log_path,
+    )
+
+    ticks = int(hours * 3600 * 1000 / TICK_MS)
+    sample_every = max(1, int(sample_minutes * 60 * 1000 / TICK_MS))
+    # Play like a player would so catches, misses and scoring are all exercised; under
+    # tracemalloc every float is a traced allocation, so do not replan every tick
+    Autopilot(controller, replan_ticks=AUTOPILOT_SOAK_REPLAN_TICKS).engage()
+
+    monitor.start()
+    started = time.perf_counter()
+    try:
+        for tick in range(ticks):
+            controller.step()
+            if tick % sample_every == 0 or tick == ticks - 1:
+                if root is not None:
+                    root.update_idletasks()
+                sample = monitor.sample(sim_minutes=round(tick * TICK_MS / 60000.0, 1))
+                logger.info("%6.1f min: traced %.0f KB, leaves %d, score %d",
+                            sample["sim_minutes"], sample.get("traced_bytes", 0) / 1024.0,
+                            len(state.leaves), state.score)
+    finally:
+        monitor.stop()
+        if root is not None:
+            root.destroy()
+
+    elapsed = time.perf_counter() - started
+    samples = list(monitor.samples)
+    # The first sample is taken before caches and free lists warm up
+    baseline = samples[1] if len(samples) > 2 else samples[0]
+    growth_kb = (samples[-1].get("traced_bytes", 0) - baseline.get("traced_bytes", 0)) / 1024.0
+    logger.info("Simulated %.1f h in %.1f s; traced memory %+.0f KB since warm-up.", hours, elapsed, growth_kb)
+    ok = not monitor.flagged and growth_kb <= tolerance_kb
+    if not ok:
+        logger.error("Memory did not stay flat: growing=%s, traced growth %.0f KB (tolerance %.0f KB).",
+                     sorted(monitor.flagged), growth_kb, tolerance_kb)
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=6.0, help="game time to simulate")
+    parser.add_argument("--sample-minutes", type=float, default=10.0, help="game minutes between samples")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--log", metavar="PATH", help="rotating JSON-lines log of the samples")
+    parser.add_argument("--tolerance-kb", type=float, default=1024.0,
+                        help="allowed traced-memory growth after warm-up")
+    parser.add_argument("--render", action="store_true", help="also draw every tick to a hidden Tk window")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s")
+    ok = run_soak(args.hours, args.sample_minutes, args.seed, args.log, args.tolerance_kb, args.render)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
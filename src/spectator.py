@@ -0,0 +1,84 @@
+"""
+Reference spectator: renders a game published with `app.py --publish`.
+
+    python src/spectator.py [ADDRESS]
+
+ADDRESS is "host:port" (default 127.0.0.1:47800) or "unix:/path/to.sock",
+matching the publisher. Frames are read on a background thread and applied
+to a local GameState that a regular GameView renders.
+"""
+import argparse
+import logging
+import queue
+import socket
+import sys
+import threading
+from tkinter import Tk
+from typing import Optional
+
+from models.game_state import GameState
+from utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, TICK_MS
+from utils.spectator import StateDecoder, parse_address, read_frames
+from views.game_view import GameView
+
+logger = logging.getLogger("leaf_catcher.spectator")
+
+
+def connect(address: str) -> socket.socket:
+    kind, target = parse_address(address)
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(target)
+        return sock
+    return socket.create_connection(target)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("address", nargs="?", default="", help="publisher address (host:port or unix:PATH)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s")
+
+    try:
+        sock = connect(args.address)
+    except OSError as e:
+        logger.error("Could not connect to %s: %s", args.address or "the default address", e)
+        return 1
+
+    frames: "queue.Queue[Optional[bytes]]" = queue.Queue()
+    threading.Thread(target=read_frames, args=(sock, frames), name="spectator-reader", daemon=True).start()
+
+    root = Tk()
+    root.title("Fall Catcher - Spectator")
+    root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+    root.resizable(False, False)
+    decoder = StateDecoder(GameState())
+    view = GameView(root, decoder.state)
+
+    def pump():
+        changed = False
+        while True:
+            try:
+                payload = frames.get_nowait()
+            except queue.Empty:
+                break
+            if payload is None:
+                logger.info("Publisher closed the stream.")
+                root.destroy()
+                return
+            decoder.apply(payload)
+            changed = True
+        if changed:
+            view.render()
+        root.after(TICK_MS, pump)
+
+    root.after(TICK_MS, pump)
+    try:
+        root.mainloop()
+    finally:
+        sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
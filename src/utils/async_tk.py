@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import TclError
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, Set
+
+from utils.constants import TICK_MS, ASYNC_IO_WORKERS, ASYNC_MAX_LAG_FRAMES
+
+logger = logging.getLogger("leaf_catcher.async")
+
+
+class AsyncTkLoop:
+    """
+    Runs Tk from an asyncio event loop instead of root.mainloop().
+
+    One coroutine paces frames on a deadline timer: each frame it calls the
+    driven frame function (e.g. GameController.run_frame) and then pumps Tk
+    with root.update(), which handles input, after() callbacks and the
+    repaint. Between frames the loop runs background coroutines (spawn())
+    and blocking calls on one small shared executor (run_in_executor()).
+    Closing the window or stop() ends run(): shutdown hooks are awaited,
+    every spawned task is cancelled and awaited, and queued executor work
+    is dropped. Executor work already running is not interrupted and holds
+    up interpreter exit, so calls that can hang belong on a daemon thread.
+    """
+
+    def __init__(self, root, frame_ms: int = TICK_MS, io_workers: int = ASYNC_IO_WORKERS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.executor = ThreadPoolExecutor(io_workers, thread_name_prefix="leaf-io")
+        self.frames = 0
+        self.late_frames = 0
+        self._frame: Optional[Callable[[], Any]] = None
+        self._frame_ms: Optional[Callable[[], int]] = None
+        self._pending: List[Coroutine] = []
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+        self._stopping = False
+
+    # -- Setup (any time before or during run) --
+
+    def drive(self, frame: Callable[[], Any], frame_ms: Optional[Callable[[], int]] = None) -> None:
+        """
+        Call frame() once per frame, every frame_ms() ms (default: self.frame_ms).
+        """
+        self._frame = frame
+        self._frame_ms = frame_ms
+
+    def spawn(self, coro: Coroutine) -> None:
+        """
+        Run coro as a background task, cancelled on exit. Failures are logged.
+        """
+        if self._stopping:
+            coro.close()
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._pending.append(coro)  # started by run()
+            return
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def run_in_executor(self, fn: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        return asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def add_shutdown(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Await hook() on exit, before background tasks are cancelled.
+        """
+        self._shutdown_hooks.append(hook)
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    # -- Running --
+
+    def run(self) -> None:
+        """
+        Block until the window is closed or stop() is called (like mainloop()).
+        """
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        self.root.protocol("WM_DELETE_WINDOW", self.stop)
+        pending, self._pending = self._pending, []
+        for coro in pending:
+            self.spawn(coro)
+        try:
+            await self._pump()
+        finally:
+            await self._shutdown()
+
+    async def _pump(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while not self._stopping:
+            if self._frame is not None:
+                try:
+                    self._frame()
+                except Exception:
+                    # Like an after() loop whose callback raised: stop driving, keep the window
+                    logger.exception("Frame callback failed; no longer driving frames.")
+                    self._frame = None
+            try:
+                self.root.update()
+            except TclError:
+                break  # window destroyed
+            self.frames += 1
+            interval_ms = self._frame_ms() if self._frame_ms is not None else self.frame_ms
+            deadline += interval_ms / 1000.0
+            delay = deadline - loop.time()
+            if delay < -ASYNC_MAX_LAG_FRAMES * interval_ms / 1000.0:
+                # Far behind: drop the backlog instead of running frames back to back
+                self.late_frames += 1
+                deadline = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    async def _shutdown(self) -> None:
+        self._stopping = True
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.warning("Shutdown hook failed: %s", e)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # Python 3.8
+            self.executor.shutdown(wait=False)
+        try:
+            self.root.destroy()
+        except TclError:
+            pass  # already destroyed by closing the window
+        logger.info("Async main loop stopped after %d frames (%d late).", self.frames, self.late_frames)
+
+    def _task_done(self, task: "asyncio.Task[Any]") -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background task failed: %r", task.exception())
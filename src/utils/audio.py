@@ -1,39 +1,90 @@
 import os
+import queue
 import threading
 import tempfile
 import shutil
 import logging
 import traceback
-from typing import Optional
+import importlib
+import time
+from collections import deque
+from contextlib import contextmanager
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from utils.constants import STREAM_NETWORK_CACHING_MS, STREAM_PREROLL_TIMEOUT_S
+from utils.tracing import tracer
+
+if TYPE_CHECKING:
+    import asyncio
 
 logger = logging.getLogger("leaf_catcher.audio")
 
-# pygame for local file playback (downloaded mp3 or local assets)
-try:
-    import pygame  # type: ignore
-except Exception:
-    pygame = None
-
-# yt-dlp to resolve YouTube URLs (for streaming or download)
-try:
-    import yt_dlp  # type: ignore
-except Exception:
-    yt_dlp = None
-
-# python-vlc for streaming URLs (http/https) including YouTube resolved streams
-try:
-    import vlc  # type: ignore
-except Exception:
-    vlc = None
-
-_current_music_path: Optional[str] = None
-_ffmpeg_exe: Optional[str] = None
-_vlc_instance: Optional["vlc.Instance"] = None  # type: ignore
-_vlc_player: Optional["vlc.MediaPlayer"] = None  # type: ignore
+# Audio backends (pygame, yt-dlp, python-vlc) are imported on first use rather
+# than at module load: together they cost hundreds of milliseconds, and the
+# menu should not wait on backends that may never be needed.
+_backends: Dict[str, Optional[ModuleType]] = {}
+_backend_import_ms: Dict[str, float] = {}
+
+
+def _import_backend(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional backend module once and cache it.
+    Returns the module, or None if it is not installed or failed to import.
+    """
+    if name in _backends:
+        return _backends[name]
+    start = time.perf_counter()
+    try:
+        module: Optional[ModuleType] = importlib.import_module(name)
+    except Exception as e:
+        logger.debug("Audio backend %s unavailable: %s", name, e)
+        module = None
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    _backends[name] = module
+    _backend_import_ms[name] = elapsed_ms
+    logger.info("Loaded audio backend %s in %.1f ms (%s).", name, elapsed_ms, "ok" if module else "missing")
+    return module
+
+
+def _pygame() -> Optional[ModuleType]:
+    # pygame for local file playback (downloaded mp3 or local assets)
+    return _import_backend("pygame")
+
+
+def _yt_dlp() -> Optional[ModuleType]:
+    # yt-dlp to resolve YouTube URLs (for streaming or download)
+    return _import_backend("yt_dlp")
+
+
+def _vlc() -> Optional[ModuleType]:
+    # python-vlc for streaming URLs (http/https) including YouTube resolved streams
+    return _import_backend("vlc")
+
+
+def _loaded_backend(name: str) -> Optional[ModuleType]:
+    """
+    Return a backend only if it has already been imported (never triggers an import).
+    """
+    return _backends.get(name)
+
+
+def override_backend(name: str, module: Optional[ModuleType]) -> None:
+    """
+    Replace a backend module (e.g. a stub yt_dlp for offline benchmarks/tests).
+    Passing None marks the backend as unavailable.
+    """
+    _backends[name] = module
+
+
+def get_backend_import_times() -> Dict[str, float]:
+    """
+    Milliseconds spent importing each audio backend so far (for startup reports).
+    """
+    return dict(_backend_import_ms)
 
-# Prepared stream URL (resolved ahead of time while in menu)
-_prepared_stream_url: Optional[str] = None
-_prepare_thread: Optional[threading.Thread] = None
+
+_ffmpeg_exe: Optional[str] = None
 
 
 def _ensure_pygame() -> bool:
@@ -41,6 +92,7 @@ def _ensure_pygame() -> bool:
     Ensure pygame.mixer is initialized.
     Tries default driver, then falls back to SDL_AUDIODRIVER=dummy if needed.
     """
+    pygame = _pygame()
     if pygame is None:
         logger.error("pygame is not installed. Background audio via pygame disabled.")
         return False
@@ -66,38 +118,6 @@ def _ensure_pygame() -> bool:
             return False
 
 
-def _ensure_vlc() -> bool:
-    """
-    Ensure python-vlc (libVLC) is available and ready.
-    On macOS, make sure VLC.app is installed or libvlc is available.
-    """
-    global _vlc_instance, _vlc_player
-    if vlc is None:
-        logger.error("python-vlc is not installed. Install 'python-vlc' and VLC to enable streaming.")
-        return False
-    try:
-        if _vlc_instance is None:
-            logger.info("Creating VLC instance...")
-            _vlc_instance = vlc.Instance()  # can pass custom args if needed
-        if _vlc_player is None:
-            _vlc_player = _vlc_instance.media_player_new()
-        return True
-    except Exception as e:
-        logger.error("Failed to initialize VLC (libvlc). Ensure VLC is installed. Error: %s", e)
-        logger.debug("Traceback:\n%s", traceback.format_exc())
-        return False
-
-
-def _stop_vlc():
-    global _vlc_player
-    try:
-        if _vlc_player is not None:
-            _vlc_player.stop()
-            logger.info("VLC stream stopped.")
-    except Exception as e:
-        logger.debug("Ignoring VLC stop error: %s", e)
-
-
 def _locate_ffmpeg() -> Optional[str]:
     """
     Try to locate an ffmpeg executable.
@@ -159,196 +179,575 @@ def _ffmpeg_location_for_ydl() -> Optional[str]:
     return os.path.dirname(_ffmpeg_exe) or _ffmpeg_exe
 
 
-def stop_music() -> None:
+def _resolve_youtube_stream_url(url: str) -> Optional[str]:
     """
-    Stop any playback (pygame or VLC).
+    Resolve a YouTube URL to a direct audio stream URL via yt-dlp (blocking).
+    Prefers the highest-bitrate audio-only format.
+    """
+    yt_dlp = _yt_dlp()
+    if not yt_dlp:
+        logger.error("yt-dlp is not installed. Cannot resolve YouTube.")
+        return None
+    logger.info("Resolving YouTube stream URL via yt-dlp (no download): %s", url)
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": False,
+        "skip_download": True,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+    stream_url = None
+    formats = info.get("formats") or []
+    audio_formats = [
+        f for f in formats
+        if f.get("vcodec") in (None, "none") and f.get("acodec") not in (None, "none") and f.get("url")
+    ]
+    if audio_formats:
+        audio_formats.sort(key=lambda f: f.get("abr") or 0, reverse=True)
+        stream_url = audio_formats[0]["url"]
+    if not stream_url:
+        stream_url = info.get("url")
+    if not stream_url:
+        logger.error("Failed to resolve a direct audio stream URL for YouTube.")
+    return stream_url
+
+
+class AudioMetrics:
     """
-    if pygame and pygame.mixer.get_init():
+    Rolling timings, in ms, for each stage of starting music. Recorded on the
+    audio worker; snapshot() may be called from any thread.
+
+    Stages:
+    - resolve:         yt-dlp extract_info for a YouTube URL
+    - vlc_init:        creating the libVLC instance and player
+    - media_open:      VLC play() until the input is opened (Buffering/Playing)
+    - first_buffer:    VLC play() until the playback position first advances
+    - preroll:         pre-roll start until the stream is buffered and paused
+    - pygame_init:     initializing the pygame mixer
+    - pygame_load:     pygame load + play of a local file
+    - play_to_audible: play request (on the caller's thread) until audible
+    """
+
+    STAGES = ("resolve", "vlc_init", "media_open", "first_buffer", "preroll", "pygame_init", "pygame_load",
+              "play_to_audible")
+
+    def __init__(self, keep: int = 64):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {stage: deque(maxlen=keep) for stage in self.STAGES}
+
+    def record(self, stage: str, ms: float) -> None:
+        with self._lock:
+            self._samples[stage].append(ms)
+        logger.info("Audio stage %s took %.1f ms.", stage, ms)
+        # Stages always end "now", so they can be placed on the startup trace too
+        end = time.perf_counter()
+        tracer.complete(stage, end - ms / 1000.0, end, cat="audio")
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
         try:
-            pygame.mixer.music.stop()
-            logger.info("Pygame music stopped.")
-        except Exception as e:
-            logger.debug("Ignoring pygame stop error: %s", e)
-    _stop_vlc()
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000.0)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per stage with samples: count, last, mean, min and max (ms).
+        """
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self._samples.items() if values}
+        return {
+            stage: {
+                "count": len(values),
+                "last_ms": values[-1],
+                "mean_ms": sum(values) / len(values),
+                "min_ms": min(values),
+                "max_ms": max(values),
+            }
+            for stage, values in samples.items()
+        }
 
+    def reset(self) -> None:
+        with self._lock:
+            for values in self._samples.values():
+                values.clear()
 
-def play_local_music_loop(path: str) -> None:
+
+class _StartWatch:
     """
-    Play a local audio file in a loop using pygame.
-    Supports common formats supported by pygame (mp3/ogg/wav).
+    A VLC start being observed by the worker loop until it becomes audible.
     """
-    stop_music()
-    if not _ensure_pygame():
-        return
-    if not os.path.exists(path):
-        logger.error("Local music file not found: %s", os.path.abspath(path))
-        return
-    try:
-        logger.info("Loading local music: %s", os.path.abspath(path))
-        pygame.mixer.music.load(path)
-        pygame.mixer.music.play(-1)
-        logger.info("Local music playing in loop.")
-    except Exception as e:
-        logger.error("Failed to play local music: %s", e)
-        logger.debug("Traceback:\n%s", traceback.format_exc())
 
+    def __init__(self, requested_at: float, started_at: float, start_pos: int):
+        self.requested_at = requested_at
+        self.started_at = started_at
+        self.start_pos = start_pos
+        self.opened = False
+        self.deadline = started_at + STREAM_PREROLL_TIMEOUT_S
 
-def play_stream_url(url: str) -> None:
-    """
-    Stream an online audio URL directly via VLC (no download).
-    Supports many formats and live radio streams.
-    """
-    stop_music()
-    if not url:
-        logger.warning("Empty stream URL. Skipping.")
-        return
-    if not _ensure_vlc():
-        logger.error("VLC unavailable. Cannot stream: %s", url)
-        return
-    try:
-        assert _vlc_instance is not None and _vlc_player is not None
-        logger.info("Starting VLC stream: %s", url)
-        media = _vlc_instance.media_new(url)
-        _vlc_player.set_media(media)
-        _vlc_player.play()
-        logger.info("Streaming started (VLC).")
-    except Exception as e:
-        logger.error("Failed to stream URL via VLC: %s", e)
-        logger.debug("Traceback:\n%s", traceback.format_exc())
 
+class _Command(NamedTuple):
+    kind: str
+    args: Tuple[Any, ...]
+    generation: int      # 0 for commands that are never superseded (e.g. volume)
+    requested_at: float  # perf_counter() on the submitting thread
 
-def prepare_youtube_stream(url: str) -> None:
+
+_SHUTDOWN = "shutdown"
+
+
+class AudioWorker:
     """
-    Resolve a YouTube URL to a direct audio stream URL in the background (no playback).
-    Stores the URL for later playback via play_prepared_stream().
+    Single owner of every audio backend object: the pygame mixer and the VLC
+    instance/player live on one daemon thread that executes commands from a
+    queue. yt-dlp resolves, which can take seconds, run on their own daemon
+    threads and post a "resolved" command back, so play/stop/volume commands
+    are handled meanwhile.
+
+    Music commands (play/stop/prepare) carry a generation number and a command
+    older than the newest music request is skipped, so the latest request
+    always wins; a resolve finishing for a superseded command is only cached.
+    Submitting never blocks, so the Tk thread can call the module-level
+    functions freely.
     """
-    global _prepared_stream_url, _prepare_thread
-    if not yt_dlp:
-        logger.error("yt-dlp is not installed. Cannot resolve YouTube.")
-        return
 
-    def worker():
-        global _prepared_stream_url
-        try:
-            logger.info("Resolving YouTube stream URL via yt-dlp (prepare only): %s", url)
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": False,
-                "skip_download": True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-            stream_url = None
-            formats = info.get("formats") or []
-            audio_formats = [
-                f for f in formats
-                if f.get("vcodec") in (None, "none") and f.get("acodec") not in (None, "none") and f.get("url")
-            ]
-            if audio_formats:
-                audio_formats.sort(key=lambda f: f.get("abr") or 0, reverse=True)
-                stream_url = audio_formats[0]["url"]
-            if not stream_url:
-                stream_url = info.get("url")
-            if not stream_url:
-                logger.error("Failed to resolve a direct audio stream URL for YouTube.")
+    POLL_INTERVAL_S = 0.01
+
+    def __init__(self):
+        self._queue: "queue.Queue[_Command]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._thread: Optional[threading.Thread] = None
+
+        # Worker-thread state (never touched from other threads)
+        self._vlc_instance: Optional[Any] = None
+        self._vlc_player: Optional[Any] = None
+        self._volume = 100
+        self._resolved: Dict[str, str] = {}  # YouTube URL -> direct stream URL
+        self._resolving: Dict[str, _Command] = {}  # YouTube URL -> newest command waiting for it
+        self._preroll_url: Optional[str] = None
+        self._preroll_started_at = 0.0
+        self._preroll_deadline = 0.0
+        self._start_watch: Optional[_StartWatch] = None
+        self._playback_started = False
+        self._current_music_path: Optional[str] = None
+        self._download_dir: Optional[str] = None  # temp dir of the playing YouTube download
+
+        # Status published for other threads (read-only outside the worker)
+        self.prepared_stream_url: Optional[str] = None
+        self.network_caching_ms = STREAM_NETWORK_CACHING_MS
+        self.preroll_ready = threading.Event()
+        self.last_play_latency_ms: Optional[float] = None
+        self.play_latency_event = threading.Event()
+        self.metrics = AudioMetrics()
+
+    # ----------------------------
+    # Submitting (any thread)
+    # ----------------------------
+
+    def submit(self, kind: str, *args: Any, music: bool = True) -> None:
+        """
+        Queue a command. Music commands supersede every older music command.
+        """
+        with self._lock:
+            if music:
+                self._generation += 1
+            generation = self._generation if music else 0
+            if kind.startswith("play"):
+                self.play_latency_event.clear()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audio-worker", daemon=True)
+                self._thread.start()
+        self._queue.put(_Command(kind, args, generation, time.perf_counter()))
+
+    def shutdown(self, timeout: Optional[float] = 2.0) -> None:
+        """
+        Stop playback, release backends and end the worker thread.
+        Commands queued before this call are still processed.
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_Command(_SHUTDOWN, (), 0, time.perf_counter()))
+        thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ----------------------------
+    # Worker loop
+    # ----------------------------
+
+    def _superseded(self, cmd: _Command) -> bool:
+        return cmd.generation != 0 and cmd.generation != self._generation
+
+    def _run(self) -> None:
+        while True:
+            polling = (self._preroll_url is not None and not self.preroll_ready.is_set()) or self._start_watch
+            try:
+                cmd = self._queue.get(timeout=self.POLL_INTERVAL_S if polling else None)
+            except queue.Empty:
+                self._poll()
+                continue
+            if cmd.kind == _SHUTDOWN:
+                self._stop_all()
+                self._release()
                 return
-            _prepared_stream_url = stream_url
-            logger.info("YouTube stream prepared.")
+            if self._superseded(cmd):
+                logger.debug("Skipping superseded audio command: %s", cmd.kind)
+                continue
+            try:
+                getattr(self, f"_do_{cmd.kind}")(cmd, *cmd.args)
+            except Exception as e:
+                logger.error("Audio command '%s' failed: %s", cmd.kind, e)
+                logger.debug("Traceback:\n%s", traceback.format_exc())
+            self._poll()
+
+    def _poll(self) -> None:
+        self._poll_preroll()
+        self._poll_start()
+
+    # ----------------------------
+    # Backend helpers (worker thread)
+    # ----------------------------
+
+    def _ensure_vlc(self) -> bool:
+        """
+        Ensure python-vlc (libVLC) is available and ready.
+        On macOS, make sure VLC.app is installed or libvlc is available.
+        """
+        vlc = _vlc()
+        if vlc is None:
+            logger.error("python-vlc is not installed. Install 'python-vlc' and VLC to enable streaming.")
+            return False
+        try:
+            if self._vlc_instance is None or self._vlc_player is None:
+                with self.metrics.span("vlc_init"):
+                    if self._vlc_instance is None:
+                        logger.info("Creating VLC instance...")
+                        self._vlc_instance = vlc.Instance()  # can pass custom args if needed
+                    if self._vlc_player is None:
+                        self._vlc_player = self._vlc_instance.media_player_new()
+            return True
         except Exception as e:
-            logger.error("Failed to resolve YouTube stream: %s", e)
+            logger.error("Failed to initialize VLC (libvlc). Ensure VLC is installed. Error: %s", e)
             logger.debug("Traceback:\n%s", traceback.format_exc())
+            return False
 
-    # Avoid spawning multiple resolve threads
-    if _prepare_thread and _prepare_thread.is_alive():
-        logger.info("YouTube stream resolution already in progress.")
-        return
-    _prepare_thread = threading.Thread(target=worker, daemon=True)
-    _prepare_thread.start()
-
+    def _new_media(self, url: str, start_paused: bool = False):
+        """
+        Create a vlc.Media for url with our network-caching settings applied.
+        """
+        media = self._vlc_instance.media_new(url)
+        media.add_option(f":network-caching={self.network_caching_ms}")
+        if start_paused:
+            # VLC opens the input and fills its buffers, then holds at the first frame
+            media.add_option(":start-paused")
+        return media
+
+    def _stop_vlc(self) -> None:
+        self._preroll_url = None
+        self.preroll_ready.clear()
+        self._start_watch = None
+        try:
+            if self._vlc_player is not None:
+                self._vlc_player.stop()
+                logger.info("VLC stream stopped.")
+        except Exception as e:
+            logger.debug("Ignoring VLC stop error: %s", e)
+
+    def _stop_all(self) -> None:
+        """
+        Stop any playback (pygame or VLC).
+        """
+        # Only touch backends that are already loaded; stopping never imports one.
+        pygame = _loaded_backend("pygame")
+        if pygame and pygame.mixer.get_init():
+            try:
+                pygame.mixer.music.stop()
+                logger.info("Pygame music stopped.")
+            except Exception as e:
+                logger.debug("Ignoring pygame stop error: %s", e)
+        self._remove_download_dir()
+        self._stop_vlc()
+
+    def _remove_download_dir(self) -> None:
+        """
+        Delete the temp dir of the previous YouTube download once it is no
+        longer playing, so long sessions do not accumulate them.
+        """
+        tmpdir, self._download_dir = self._download_dir, None
+        if tmpdir is None:
+            return
+        pygame = _loaded_backend("pygame")
+        if pygame and pygame.mixer.get_init() and hasattr(pygame.mixer.music, "unload"):
+            # Release the file handle first (required on Windows; pygame >= 2.0)
+            try:
+                pygame.mixer.music.unload()
+            except Exception as e:
+                logger.debug("Ignoring pygame unload error: %s", e)
+        if self._current_music_path and self._current_music_path.startswith(tmpdir):
+            self._current_music_path = None
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        logger.debug("Removed temporary download directory: %s", tmpdir)
+
+    def _release(self) -> None:
+        try:
+            if self._vlc_player is not None:
+                self._vlc_player.release()
+            if self._vlc_instance is not None:
+                self._vlc_instance.release()
+        except Exception as e:
+            logger.debug("Ignoring VLC release error: %s", e)
+        self._vlc_player = None
+        self._vlc_instance = None
+
+    def _start_vlc(self, url: str, cmd: _Command) -> None:
+        """
+        Open url on the VLC player and start audible playback now.
+        """
+        if not self._ensure_vlc():
+            logger.error("VLC unavailable. Cannot stream: %s", url)
+            return
+        logger.info("Starting VLC stream: %s", url)
+        self._vlc_player.set_media(self._new_media(url))
+        self._vlc_player.audio_set_mute(False)
+        self._vlc_player.audio_set_volume(self._volume)
+        self._watch_start(cmd.requested_at)
+        self._vlc_player.play()
+        logger.info("Streaming started (VLC).")
 
-def get_prepared_stream_url() -> Optional[str]:
-    return _prepared_stream_url
+    def _unpause_preroll(self, cmd: _Command) -> bool:
+        """
+        Start a pre-rolled stream by unpausing it. Returns False if none is ready.
+        """
+        if not self.preroll_ready.is_set() or self._vlc_player is None:
+            return False
+        self._vlc_player.audio_set_mute(False)
+        self._vlc_player.audio_set_volume(self._volume)
+        self._watch_start(cmd.requested_at, opened=True)
+        self._vlc_player.set_pause(0)
+        self._preroll_url = None
+        self.preroll_ready.clear()
+        logger.info("Pre-rolled stream unpaused.")
+        return True
 
+    # ----------------------------
+    # Pre-roll: the prepared URL is opened on the VLC player, buffered and left
+    # paused+muted while the menu is shown, so PLAY only has to unpause.
+    # ----------------------------
+
+    def _resolve_in_background(self, cmd: _Command, url: str) -> None:
+        """
+        Resolve url on a daemon thread, then run cmd again (unless superseded)
+        once the "resolved" command it posts back has filled the cache.
+        """
+        resolving = url in self._resolving
+        self._resolving[url] = cmd  # a newer command takes over a resolve in flight
+        if resolving:
+            return
 
-def play_prepared_stream() -> bool:
-    """
-    If a stream URL was prepared, start playback via VLC.
-    Returns True if playback started, False otherwise.
-    """
-    url = _prepared_stream_url
-    if not url:
-        logger.warning("No prepared stream URL to play.")
-        return False
-    play_stream_url(url)
-    return True
+        def run() -> None:
+            stream_url = None
+            try:
+                with self.metrics.span("resolve"):
+                    stream_url = _resolve_youtube_stream_url(url)
+            except Exception as e:
+                logger.error("Resolving YouTube stream URL failed: %s", e)
+                logger.debug("Traceback:\n%s", traceback.format_exc())
+            self._queue.put(_Command("resolved", (url, stream_url), 0, time.perf_counter()))
+
+        threading.Thread(target=run, name="yt-dlp-resolve", daemon=True).start()
+
+    def _start_preroll(self, url: str) -> None:
+        if self._playback_started:
+            logger.info("Playback already started; skipping pre-roll.")
+            return
+        if not self._ensure_vlc():
+            return
+        self._stop_vlc()
+        logger.info("Pre-rolling stream (paused, %d ms network caching)...", self.network_caching_ms)
+        self._preroll_url = url
+        self._preroll_started_at = time.perf_counter()
+        self._preroll_deadline = self._preroll_started_at + STREAM_PREROLL_TIMEOUT_S
+        self._vlc_player.set_media(self._new_media(url, start_paused=True))
+        self._vlc_player.audio_set_mute(True)
+        self._vlc_player.play()
+
+    def _poll_preroll(self) -> None:
+        if self._preroll_url is None or self.preroll_ready.is_set():
+            return
+        vlc = _vlc()
+        state = self._vlc_player.get_state()
+        if state == vlc.State.Paused:
+            self.metrics.record("preroll", (time.perf_counter() - self._preroll_started_at) * 1000.0)
+            self.preroll_ready.set()
+            logger.info("Stream pre-rolled and paused; PLAY will only unpause.")
+        elif state == vlc.State.Playing:
+            # Older libVLC ignores :start-paused; hold it here instead
+            self._vlc_player.set_pause(1)
+        elif state in (vlc.State.Error, vlc.State.Ended, vlc.State.Stopped):
+            logger.warning("Pre-roll failed (state=%s).", state)
+            self._stop_vlc()
+        elif time.perf_counter() > self._preroll_deadline:
+            logger.warning("Pre-roll timed out after %.0f s.", STREAM_PREROLL_TIMEOUT_S)
+            self._stop_vlc()
+
+    # ----------------------------
+    # Stream start: from play() until VLC has opened the input (media_open) and
+    # its playback position has advanced (first_buffer); plus the end-to-end
+    # play_to_audible latency measured from the original request.
+    # ----------------------------
+
+    def _watch_start(self, requested_at: float, opened: bool = False) -> None:
+        self.last_play_latency_ms = None
+        self._start_watch = _StartWatch(requested_at, time.perf_counter(), self._vlc_player.get_time())
+        self._start_watch.opened = opened
+
+    def _mark_audible(self, requested_at: float) -> None:
+        self.last_play_latency_ms = (time.perf_counter() - requested_at) * 1000.0
+        self.metrics.record("play_to_audible", self.last_play_latency_ms)
+        self.play_latency_event.set()
+
+    def _poll_start(self) -> None:
+        watch = self._start_watch
+        if watch is None:
+            return
+        vlc = _vlc()
+        state = self._vlc_player.get_state()
+        now = time.perf_counter()
+        if not watch.opened and state in (vlc.State.Buffering, vlc.State.Playing):
+            watch.opened = True
+            self.metrics.record("media_open", (now - watch.started_at) * 1000.0)
+        if state in (vlc.State.Error, vlc.State.Ended, vlc.State.Stopped):
+            logger.warning("Stream did not become audible (state=%s).", state)
+            self._start_watch = None
+        elif state == vlc.State.Playing and self._vlc_player.get_time() > watch.start_pos:
+            self.metrics.record("first_buffer", (now - watch.started_at) * 1000.0)
+            self._mark_audible(watch.requested_at)
+            self._start_watch = None
+        elif now > watch.deadline:
+            logger.warning("Timed out measuring stream start latency.")
+            self._start_watch = None
+
+    # ----------------------------
+    # Command handlers (worker thread). Each receives the command first.
+    # ----------------------------
+
+    def _do_stop(self, cmd: _Command) -> None:
+        self._stop_all()
+        # An explicit stop ends the session; a new menu may prepare again
+        self._playback_started = False
+
+    def _do_set_volume(self, cmd: _Command, volume: int) -> None:
+        self._volume = max(0, min(100, int(volume)))
+        if self._vlc_player is not None and self._preroll_url is None:
+            self._vlc_player.audio_set_volume(self._volume)
+        pygame = _loaded_backend("pygame")
+        if pygame and pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self._volume / 100.0)
+
+    def _do_set_network_caching(self, cmd: _Command, ms: int) -> None:
+        self.network_caching_ms = max(0, int(ms))
+
+    def _do_play_local(self, cmd: _Command, path: str) -> None:
+        self._playback_started = True
+        self._stop_all()
+        self.last_play_latency_ms = None
+        with self.metrics.span("pygame_init"):
+            ok = _ensure_pygame()
+        if not ok:
+            return
+        if not os.path.exists(path):
+            logger.error("Local music file not found: %s", os.path.abspath(path))
+            return
+        logger.info("Loading local music: %s", os.path.abspath(path))
+        pygame = _pygame()
+        with self.metrics.span("pygame_load"):
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self._volume / 100.0)
+            pygame.mixer.music.play(-1)
+        # pygame starts mixing as soon as play() returns
+        self._mark_audible(cmd.requested_at)
+        self._current_music_path = path
+        logger.info("Local music playing in loop.")
 
+    def _do_play_stream(self, cmd: _Command, url: str) -> None:
+        self._playback_started = True
+        if url == self._preroll_url and self._unpause_preroll(cmd):
+            return
+        self._stop_all()
+        self._start_vlc(url, cmd)
 
-def play_youtube_stream(url: str) -> None:
-    """
-    Resolve a YouTube URL to a direct audio stream and play via VLC.
-    Requires yt-dlp. No file is downloaded; playback is from the resolved URL.
-    """
-    stop_music()
-    if not yt_dlp:
-        logger.error("yt-dlp is not installed. Cannot stream YouTube.")
-        return
-    if not _ensure_vlc():
-        logger.error("VLC unavailable. Cannot stream YouTube: %s", url)
-        return
+    def _do_play_youtube_stream(self, cmd: _Command, url: str) -> None:
+        self._playback_started = True
+        stream_url = self._resolved.get(url)
+        if stream_url and stream_url == self._preroll_url and self._unpause_preroll(cmd):
+            return
+        self._stop_all()
+        if not stream_url:
+            self._resolve_in_background(cmd, url)
+            return
+        logger.info("Resolved YouTube audio stream. Handing off to VLC...")
+        self._start_vlc(stream_url, cmd)
 
-    def worker():
-        try:
-            logger.info("Resolving YouTube stream URL via yt-dlp (no download): %s", url)
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": False,
-                "skip_download": True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-            stream_url = None
-            formats = info.get("formats") or []
-            audio_formats = [
-                f for f in formats
-                if f.get("vcodec") in (None, "none") and f.get("acodec") not in (None, "none") and f.get("url")
-            ]
-            if audio_formats:
-                audio_formats.sort(key=lambda f: f.get("abr") or 0, reverse=True)
-                stream_url = audio_formats[0]["url"]
-            if not stream_url:
-                stream_url = info.get("url")
-            if not stream_url:
-                logger.error("Failed to resolve a direct audio stream URL for YouTube.")
-                return
+    def _do_prepare_stream(self, cmd: _Command, url: str) -> None:
+        self.prepared_stream_url = url
+        self._start_preroll(url)
 
-            logger.info("Resolved YouTube audio stream. Handing off to VLC...")
-            play_stream_url(stream_url)
-        except Exception as e:
-            logger.error("Failed to resolve/play YouTube stream: %s", e)
-            logger.debug("Traceback:\n%s", traceback.format_exc())
+    def _do_prepare_youtube(self, cmd: _Command, url: str) -> None:
+        if self._playback_started:
+            return
+        stream_url = self._resolved.get(url)
+        if not stream_url:
+            logger.info("Resolving YouTube stream URL via yt-dlp (prepare only): %s", url)
+            self._resolve_in_background(cmd, url)
+            return
+        self._do_prepare_resolved(cmd, url, stream_url)
 
-    threading.Thread(target=worker, daemon=True).start()
+    def _do_resolved(self, cmd: _Command, url: str, stream_url: Optional[str]) -> None:
+        waiting = self._resolving.pop(url, None)
+        if not stream_url:
+            return
+        # Cache even if superseded: a later play for this URL will reuse it
+        self._resolved[url] = stream_url
+        if waiting is None or self._superseded(waiting):
+            logger.info("YouTube stream resolved, but a newer audio request replaced it.")
+            return
+        getattr(self, f"_do_{waiting.kind}")(waiting, url)  # now served from the cache
 
+    def _do_prepare_resolved(self, cmd: _Command, url: str, stream_url: str) -> None:
+        # Cache even if superseded: a queued play for this URL will reuse it
+        self._resolved[url] = stream_url
+        if self._playback_started:
+            return
+        self.prepared_stream_url = stream_url
+        logger.info("YouTube stream prepared.")
+        if self._superseded(cmd):
+            return
+        self._start_preroll(stream_url)
 
-def play_youtube_audio(url: str) -> None:
-    """
-    Download and play YouTube audio (mp3) in a background thread.
-    Requires yt-dlp and ffmpeg.
-    """
-    stop_music()
-    if not url:
-        logger.warning("No YOUTUBE_AUDIO_URL configured. Skipping YouTube audio.")
-        return
-    if yt_dlp is None:
-        logger.error("yt-dlp is not installed. Install it to enable YouTube audio.")
-        return
-    if not _ffmpeg_available():
-        return
+    def _do_play_prepared(self, cmd: _Command) -> None:
+        url = self.prepared_stream_url
+        if not url:
+            logger.warning("No prepared stream URL to play.")
+            return
+        self._do_play_stream(cmd, url)
 
-    def worker():
-        global _current_music_path
+    def _do_play_youtube_audio(self, cmd: _Command, url: str) -> None:
+        self._playback_started = True
+        self._stop_all()
+        if not _ffmpeg_available():
+            return
+        yt_dlp = _yt_dlp()
+        if yt_dlp is None:
+            logger.error("yt-dlp is not installed. Install it to enable YouTube audio.")
+            return
         if not _ensure_pygame():
             return
+        pygame = _pygame()
         tmpdir = None
         try:
             tmpdir = tempfile.mkdtemp(prefix="leaf_catcher_")
@@ -374,6 +773,9 @@ def play_youtube_audio(url: str) -> None:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
             logger.info("YouTube download complete. Searching for extracted mp3...")
+            if self._superseded(cmd):
+                logger.info("YouTube audio downloaded, but a newer audio request replaced it.")
+                return
 
             mp3_path = None
             for name in os.listdir(tmpdir):
@@ -385,14 +787,211 @@ def play_youtube_audio(url: str) -> None:
                 return
 
             logger.info("Playing downloaded mp3: %s", os.path.abspath(mp3_path))
-            _current_music_path = mp3_path
+            self._current_music_path = mp3_path
             pygame.mixer.music.load(mp3_path)
+            pygame.mixer.music.set_volume(self._volume / 100.0)
             pygame.mixer.music.play(-1)
+            # Kept while playing; removed by the next stop or play
+            self._download_dir = tmpdir
             logger.info("YouTube audio playing in loop.")
-        except Exception as e:
-            logger.error("Failed to download/play YouTube audio: %s", e)
-            logger.debug("Traceback:\n%s", traceback.format_exc())
         finally:
-            if tmpdir:
-                logger.debug("Temporary download directory: %s", tmpdir)
-    threading.Thread(target=worker, daemon=True).start()
\ No newline at end of file
+            if tmpdir and tmpdir != self._download_dir:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+_worker = AudioWorker()
+
+
+# ----------------------------
+# Public API: every call only enqueues a command for the audio worker.
+# ----------------------------
+
+def stop_music() -> None:
+    """
+    Stop any playback (pygame or VLC).
+    """
+    _worker.submit("stop")
+
+
+def set_music_volume(volume: int) -> None:
+    """
+    Set music volume, 0-100, for the current and future playback.
+    """
+    _worker.submit("set_volume", volume, music=False)
+
+
+def set_network_caching(ms: int) -> None:
+    """
+    Set VLC network buffering (ms) for streams opened from now on.
+    """
+    _worker.submit("set_network_caching", ms, music=False)
+
+
+def get_network_caching() -> int:
+    return _worker.network_caching_ms
+
+
+def play_local_music_loop(path: str) -> None:
+    """
+    Play a local audio file in a loop using pygame.
+    Supports common formats supported by pygame (mp3/ogg/wav).
+    """
+    _worker.submit("play_local", path)
+
+
+def play_stream_url(url: str) -> None:
+    """
+    Stream an online audio URL directly via VLC (no download).
+    Supports many formats and live radio streams. If url was pre-rolled by
+    prepare_stream_url(), it is simply unpaused.
+    """
+    if not url:
+        logger.warning("Empty stream URL. Skipping.")
+        return
+    _worker.submit("play_stream", url)
+
+
+def prepare_stream_url(url: str) -> None:
+    """
+    Pre-roll a direct (non-YouTube) stream URL in the background (no audible playback).
+    Stores the URL for later playback via play_stream_url() or play_prepared_stream().
+    """
+    if url:
+        _worker.submit("prepare_stream", url)
+
+
+def prepare_youtube_stream(url: str) -> None:
+    """
+    Resolve a YouTube URL to a direct audio stream URL in the background and
+    pre-roll it (no audible playback). Later playback via play_youtube_stream()
+    or play_prepared_stream() reuses the resolution.
+    """
+    _worker.submit("prepare_youtube", url)
+
+
+def _in_daemon_thread(fn, *args: Any) -> "asyncio.Future[Any]":
+    """
+    Run a blocking call on a daemon thread and return a future for the
+    running loop. Unlike executor workers, which are joined at interpreter
+    exit, a call that hangs cannot keep the process alive.
+    """
+    import asyncio  # only the --asyncio loop gets here; keep it off the startup path
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return  # cancelled meanwhile
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run() -> None:
+        result, error = None, None
+        try:
+            result = fn(*args)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # the loop has closed; nobody is waiting
+
+    threading.Thread(target=run, name="yt-dlp-resolve", daemon=True).start()
+    return future
+
+
+async def prepare_youtube_stream_async(url: str) -> None:
+    """
+    Like prepare_youtube_stream(), for an asyncio main loop: the loop awaits
+    the yt-dlp resolve on a daemon thread, and cancelling the task discards
+    the result (a resolve already running finishes in the background, or
+    dies with the process).
+    The resolved URL is then pre-rolled.
+    """
+    start = time.perf_counter()
+    stream_url = await _in_daemon_thread(_resolve_youtube_stream_url, url)
+    _worker.metrics.record("resolve", (time.perf_counter() - start) * 1000.0)
+    if stream_url:
+        # Not a music request: it must not supersede a PLAY submitted meanwhile
+        _worker.submit("prepare_resolved", url, stream_url, music=False)
+
+
+def get_prepared_stream_url() -> Optional[str]:
+    return _worker.prepared_stream_url
+
+
+def is_prepared_stream_ready() -> bool:
+    """
+    True once the prepared stream is buffered and paused, so PLAY is instant.
+    """
+    return _worker.preroll_ready.is_set()
+
+
+def play_prepared_stream() -> bool:
+    """
+    If a stream URL was prepared, start playback via VLC.
+    A pre-rolled stream is simply unpaused; otherwise the URL is opened now.
+    Returns True if playback was requested, False if nothing is prepared yet.
+    """
+    if not _worker.prepared_stream_url:
+        logger.warning("No prepared stream URL to play.")
+        return False
+    _worker.submit("play_prepared")
+    return True
+
+
+def play_youtube_stream(url: str) -> None:
+    """
+    Resolve a YouTube URL to a direct audio stream and play via VLC.
+    Requires yt-dlp. No file is downloaded; playback is from the resolved URL.
+    Reuses (and unpauses) a stream prepared for the same URL.
+    """
+    _worker.submit("play_youtube_stream", url)
+
+
+def play_youtube_audio(url: str) -> None:
+    """
+    Download and play YouTube audio (mp3) on the audio worker.
+    Requires yt-dlp and ffmpeg.
+    """
+    if not url:
+        logger.warning("No YOUTUBE_AUDIO_URL configured. Skipping YouTube audio.")
+        stop_music()
+        return
+    _worker.submit("play_youtube_audio", url)
+
+
+def get_audio_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    Timings of the music start stages recorded so far (see AudioMetrics).
+    """
+    return _worker.metrics.snapshot()
+
+
+def reset_audio_metrics() -> None:
+    _worker.metrics.reset()
+
+
+def get_last_play_latency_ms() -> Optional[float]:
+    """
+    PLAY-to-audible latency of the most recent stream start, in ms (None until measured).
+    """
+    return _worker.last_play_latency_ms
+
+
+def wait_for_play_latency(timeout: Optional[float] = None) -> Optional[float]:
+    """
+    Block until the latency of the current stream start is known (for benchmarks).
+    """
+    _worker.play_latency_event.wait(timeout)
+    return _worker.last_play_latency_ms
+
+
+def shutdown_audio(timeout: Optional[float] = 2.0) -> None:
+    """
+    Stop playback and end the audio worker thread (e.g. on application exit).
+    """
+    _worker.shutdown(timeout)
@@ -30,6 +30,17 @@ LEAF_MIN_SPEED = 2
 LEAF_MAX_SPEED = 6
 LEAF_SIZE = 40  # bigger leaves
 
+# Wind: per-leaf sway and drift plus global gusts (horizontal speeds in px/tick)
+WIND_PHASES = 64            # sway phase buckets; the wind field is computed once per bucket per tick
+SWAY_AMPLITUDE = 1.2        # peak sway speed (~23 px side to side)
+SWAY_PERIOD_TICKS = 120     # ~2 s per sway cycle
+LEAF_MAX_DRIFT = 0.6        # constant sideways drift, random per leaf
+GUST_MAX_SPEED = 3.0
+GUST_MIN_MS = 1500
+GUST_MAX_MS = 4000
+GUST_INTERVAL_MIN_MS = 6000
+GUST_INTERVAL_MAX_MS = 15000
+
 # Basket properties
 BASKET_WIDTH = 100
 BASKET_HEIGHT = 20
@@ -42,15 +53,76 @@ SCORE_INCREMENT = 1
 TICK_MS = 16                # ~60 FPS
 SPAWN_INTERVAL_MS = 700     # one leaf roughly every 0.7s
 
+# Threaded simulation (app --threaded-sim): ticks behind before the backlog is dropped
+SIM_MAX_LAG_TICKS = 5
+
+# asyncio main loop (app --asyncio)
+ASYNC_IO_WORKERS = 2         # executor threads for blocking I/O (yt-dlp, files)
+ASYNC_MAX_LAG_FRAMES = 5     # frames behind before the pacing deadline resets
+
+# Performance profiles (low/balanced/high; see utils/perf_profiles.py)
+PERF_PROFILE_DEFAULT = "balanced"
+
+# Performance HUD (toggle in game with F3)
+HUD_TOGGLE_KEY = "<F3>"
+HUD_REFRESH_MS = 250        # redraw the overlay at 4 Hz, not every frame
+PERF_WINDOW_FRAMES = 240    # rolling window for FPS and p50/p99 (~4 s at 60 FPS)
+HUD_TEXT_COLOR = "#F6F1E7"
+HUD_BG_COLOR = "#2B1D12"
+
+# Tk call budget per steady-state frame (--tk-accounting): leaves + basket + score
+TK_CALL_BUDGET_FIXED = 8
+TK_CALL_BUDGET_PER_LEAF = 1
+
+# Leaf-storm stress mode: ramp the spawn rate until frames exceed the budget
+STRESS_FRAME_BUDGET_MS = 1000.0 / 60.0
+STRESS_START_RATE = 5.0      # leaves per second in the first step
+STRESS_RATE_GROWTH = 1.25    # spawn rate multiplier per step
+STRESS_STEP_MS = 3000        # game time per step
+STRESS_FRAME_PERCENTILE = 95
+
+# Adaptive quality: step down when frames run over the loop interval, back up with headroom
+QUALITY_WINDOW_FRAMES = 30       # frames per decision (~0.5 s at 60 FPS)
+QUALITY_FRAME_PERCENTILE = 90
+QUALITY_UP_FRACTION = 0.6        # step up only when frames use under 60% of the interval...
+QUALITY_UP_WINDOWS = 4           # ...for this many windows in a row (doubled after each bounce)
+QUALITY_MAX_UP_WINDOWS = 32
+QUALITY_LEAF_CAP_FRACTION = 0.75 # leaf cap on the first step down, relative to the live count
+QUALITY_MIN_LEAF_CAP = 20
+
+# Autopilot (attract mode, soak runs)
+AUTOPILOT_HORIZON_TICKS = 60    # plan for leaves arriving within ~1 s
+AUTOPILOT_BUCKET_PX = 5         # resolution of candidate basket positions
+AUTOPILOT_SOAK_REPLAN_TICKS = 4 # soak runs replan less often (~3% fewer catches, far less traced work)
+
+# Leaderboard (shown on the menu)
+LEADERBOARD_TOP_N = 5
+LEADERBOARD_PLAYER = "Player"   # default name; set with app --player
+LEADERBOARD_POLL_MS = 50        # menu checks for the background query at this rate
+
+# Spectator streaming (app --publish, src/spectator.py)
+SPECTATOR_HOST = "127.0.0.1"
+SPECTATOR_PORT = 47800
+SPECTATOR_KEYFRAME_TICKS = 60   # full state about once a second
+SPECTATOR_QUEUE_FRAMES = 30     # per-subscriber backlog before it is dropped to resync
+
 # File paths for assets (absolute paths)
 LEAF_IMAGE_PATH = str(IMAGES_DIR / "leaf.png")
 BACKGROUND_IMAGE_PATH = str(IMAGES_DIR / "background.png")
 BASKET_IMAGE_PATH = str(IMAGES_DIR / "basket.png")          # optional, may not exist
 BACKGROUND_MUSIC_PATH = str(SOUNDS_DIR / "background.mp3")  # Optional local fallback
+LEADERBOARD_PATH = str(PROJECT_ROOT / "leaderboard.sqlite3")  # created on first use
+PERF_CONFIG_PATH = str(PROJECT_ROOT / "leaf_catcher.toml")    # optional profile overrides
 CATCH_SOUND_PATH = str(SOUNDS_DIR / "catch.wav")            # Optional
 
 # Streaming music URL (preferred). Example: an online mp3/ogg stream, internet radio, or a direct file URL.
 STREAM_AUDIO_URL = "https://www.youtube.com/watch?v=M0lVOhvJajc"  # e.g., "https://stream.example.com/radio.mp3" or a YouTube link (we'll stream via VLC)
 
+# VLC network buffering for streams, in milliseconds. Larger values ride out a
+# jittery connection but take longer to fill before audio can start.
+STREAM_NETWORK_CACHING_MS = 1500
+# How long to wait for a stream to open and buffer while pre-rolling on the menu
+STREAM_PREROLL_TIMEOUT_S = 20.0
+
 # Optional YouTube background music URL. If STREAM_AUDIO_URL is empty, this is used (download+play by default).
 YOUTUBE_AUDIO_URL = "https://www.youtube.com/watch?v=M0lVOhvJajc"
\ No newline at end of file
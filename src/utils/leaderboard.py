@@ -0,0 +1,161 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional
+
+from utils.constants import LEADERBOARD_PATH
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger("leaf_catcher.leaderboard")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS scores (
+        id INTEGER PRIMARY KEY,
+        player TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        played_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_scores_player_score ON scores (player, score DESC)",
+)
+
+_SHUTDOWN = object()
+
+
+class ScoreEntry(NamedTuple):
+    player: str
+    score: int
+    played_at: float  # Unix time
+
+
+class Leaderboard:
+    """
+    High scores in a local SQLite database (WAL mode, indexed by score).
+
+    A single background thread owns the connection and runs every query in
+    submission order, so the Tk thread never blocks on disk I/O: submit() just
+    queues an insert, and queries return a concurrent.futures.Future that the
+    menu polls. Top-N reads walk the score index; a rank is one index range count.
+    """
+
+    def __init__(self, path: str = LEADERBOARD_PATH):
+        self.path = path
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional["sqlite3.Connection"] = None  # worker thread only
+
+    # ----------------------------
+    # Public API (any thread)
+    # ----------------------------
+
+    def submit(self, player: str, score: int, played_at: Optional[float] = None) -> None:
+        """
+        Record a finished game in the background.
+        """
+        self._call(self._insert, player, int(score), time.time() if played_at is None else played_at)
+
+    def top_async(self, n: int = 10) -> "Future[List[ScoreEntry]]":
+        return self._call(self._top, n)
+
+    def rank_async(self, score: int) -> "Future[int]":
+        """
+        1-based position a game with `score` has (or would have) on the board.
+        """
+        return self._call(self._rank, int(score))
+
+    def player_best_async(self, player: str) -> "Future[Optional[ScoreEntry]]":
+        return self._call(self._player_best, player)
+
+    def top(self, n: int = 10, timeout: Optional[float] = None) -> List[ScoreEntry]:
+        return self.top_async(n).result(timeout)
+
+    def rank(self, score: int, timeout: Optional[float] = None) -> int:
+        return self.rank_async(score).result(timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until everything queued so far has been written.
+        """
+        self._call(lambda: None).result(timeout)
+
+    def close(self, timeout: Optional[float] = 2.0) -> None:
+        """
+        Finish queued work, close the database and stop the worker thread.
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_SHUTDOWN)
+        thread.join(timeout)
+
+    # ----------------------------
+    # Worker thread
+    # ----------------------------
+
+    def _call(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+                self._thread.start()
+        self._queue.put((future, fn, args))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _SHUTDOWN:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                logger.warning("Leaderboard operation failed: %s", e)
+                future.set_exception(e)
+
+    def _db(self) -> "sqlite3.Connection":
+        if self._conn is None:
+            import sqlite3  # here, on the worker thread, rather than on the Tk thread at startup
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; may lose the last commit on power loss
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _insert(self, player: str, score: int, played_at: float) -> None:
+        db = self._db()
+        db.execute("INSERT INTO scores (player, score, played_at) VALUES (?, ?, ?)", (player, score, played_at))
+        db.commit()
+        logger.info("Recorded score %d for %s.", score, player)
+
+    def _top(self, n: int) -> List[ScoreEntry]:
+        rows = self._db().execute(
+            "SELECT player, score, played_at FROM scores ORDER BY score DESC, played_at ASC LIMIT ?", (n,)
+        ).fetchall()
+        return [ScoreEntry(*row) for row in rows]
+
+    def _rank(self, score: int) -> int:
+        (higher,) = self._db().execute("SELECT COUNT(*) FROM scores WHERE score > ?", (score,)).fetchone()
+        return higher + 1
+
+    def _player_best(self, player: str) -> Optional[ScoreEntry]:
+        row = self._db().execute(
+            "SELECT player, score, played_at FROM scores WHERE player = ? ORDER BY score DESC LIMIT 1", (player,)
+        ).fetchone()
+        return ScoreEntry(*row) if row else None
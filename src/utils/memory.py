@@ -0,0 +1,175 @@
+import gc
+import json
+import logging
+import logging.handlers
+import os
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("leaf_catcher.memory")
+# Samples go only to the rotating log, not to the console
+sample_logger = logging.getLogger("leaf_catcher.memory.samples")
+sample_logger.propagate = False
+
+# Growth smaller than this over a whole detection window is ignored (noise)
+DEFAULT_MIN_GROWTH = {
+    "traced_bytes": 256 * 1024,
+    "rss_bytes": 4 * 1024 * 1024,
+    "canvas_items": 50,
+}
+DEFAULT_MIN_GROWTH_COUNT = 50  # live_<Type> instance counts
+
+
+def read_rss_bytes() -> Optional[int]:
+    """
+    Current resident set size of this process, or None if it cannot be read.
+    Uses /proc on Linux and psutil (if installed) elsewhere.
+    """
+    try:
+        with open("/proc/self/statm", "r") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def count_instances(types: Sequence[type]) -> Dict[str, int]:
+    """
+    Live instances of each type (exact type match), found through the GC.
+    Walks every tracked object, so call it at sampling rate, not per frame.
+    """
+    counts = {cls: 0 for cls in types}
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if cls in counts:
+            counts[cls] += 1
+    return {f"live_{cls.__name__}": n for cls, n in counts.items()}
+
+
+class GrowthDetector:
+    """
+    Flags metrics that grew monotonically over the last `window` samples by
+    more than their minimum growth. Flat or sawtooth series are not flagged.
+    """
+
+    def __init__(self, window: int = 6, min_growth: Optional[Dict[str, float]] = None,
+                 default_min_growth: float = DEFAULT_MIN_GROWTH_COUNT):
+        self.window = window
+        self.min_growth = dict(DEFAULT_MIN_GROWTH if min_growth is None else min_growth)
+        self.default_min_growth = default_min_growth
+        self._series: Dict[str, Deque[float]] = {}
+
+    def add(self, name: str, value: float) -> bool:
+        """
+        Record a sample; returns True if the metric is now growing.
+        """
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = deque(maxlen=self.window)
+        series.append(value)
+        return self.growing(name)
+
+    def growing(self, name: str) -> bool:
+        series = self._series.get(name)
+        if series is None or len(series) < self.window:
+            return False
+        values = list(series)
+        if any(b < a for a, b in zip(values, values[1:])):
+            return False
+        return values[-1] - values[0] > self.min_growth.get(name, self.default_min_growth)
+
+
+class MemoryMonitor:
+    """
+    Periodic memory sampling for long-running sessions.
+
+    Each sample() records tracemalloc's traced size and top allocators, the
+    process RSS, live instance counts of `count_types` (e.g. Leaf, PhotoImage)
+    and, if given, the canvas item count. Samples are written as JSON lines to
+    a rotating log, and metrics that keep growing are flagged with a warning.
+    """
+
+    def __init__(self, count_types: Sequence[type] = (), canvas_items: Optional[Callable[[], int]] = None,
+                 log_path: Optional[str] = None, window: int = 6, top_n: int = 5,
+                 max_log_bytes: int = 1024 * 1024, log_backups: int = 3,
+                 clock: Callable[[], float] = time.monotonic):
+        self.count_types = tuple(count_types)
+        self.canvas_items = canvas_items
+        self.log_path = log_path
+        self.top_n = top_n
+        self.clock = clock
+        self.detector = GrowthDetector(window)
+        self.flagged: Dict[str, float] = {}  # metric -> value when first flagged
+        self.samples: Deque[dict] = deque(maxlen=1000)  # most recent samples
+        self._max_log_bytes = max_log_bytes
+        self._log_backups = log_backups
+        self._handler: Optional[logging.Handler] = None
+        self._started_tracemalloc = False
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.log_path and self._handler is None:
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.log_path, maxBytes=self._max_log_bytes, backupCount=self._log_backups, encoding="utf-8"
+            )
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+            sample_logger.addHandler(self._handler)
+            sample_logger.setLevel(logging.INFO)
+        self._started_at = self.clock()
+
+    def stop(self) -> None:
+        if self._handler is not None:
+            sample_logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def sample(self, **extra) -> dict:
+        """
+        Take one sample; extra keyword values (e.g. sim_minutes) are logged with it.
+        Returns the sample, whose "growing" lists the metrics flagged so far.
+        """
+        sample = {"t": round(self.clock() - self._started_at, 3)}
+        sample.update(extra)
+        top: List[List] = []
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            sample["traced_bytes"], sample["traced_peak_bytes"] = tracemalloc.get_traced_memory()
+            for stat in snapshot.statistics("lineno")[:self.top_n]:
+                frame = stat.traceback[0]
+                top.append([f"{frame.filename}:{frame.lineno}", stat.size, stat.count])
+        rss = read_rss_bytes()
+        if rss is not None:
+            sample["rss_bytes"] = rss
+        if self.count_types:
+            sample.update(count_instances(self.count_types))
+        if self.canvas_items is not None:
+            try:
+                sample["canvas_items"] = self.canvas_items()
+            except Exception as e:  # e.g. the window is being torn down
+                logger.debug("Could not count canvas items: %s", e)
+
+        for name, value in sample.items():
+            if name in ("t", "traced_peak_bytes") or name in extra or not isinstance(value, (int, float)):
+                continue
+            if self.detector.add(name, value) and name not in self.flagged:
+                self.flagged[name] = value
+                logger.warning("Memory metric %s grew over the last %d samples (now %s).",
+                               name, self.detector.window, value)
+        sample["growing"] = sorted(self.flagged)
+        sample["top"] = top
+        self.samples.append(sample)
+        if self._handler is not None:
+            sample_logger.info(json.dumps(sample))
+        return sample
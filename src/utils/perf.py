@@ -0,0 +1,144 @@
+import time
+from typing import Dict, List, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-size buffer of floats. append() overwrites the oldest sample and
+    never allocates, so it is safe to call every frame.
+    """
+
+    def __init__(self, size: int):
+        self._data: List[float] = [0.0] * size
+        self._size = size
+        self._index = 0
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def values(self) -> List[float]:
+        """
+        Samples oldest to newest (a copy).
+        """
+        if self._count < self._size:
+            return self._data[:self._count]
+        return self._data[self._index:] + self._data[:self._index]
+
+    def percentile(self, pct: float) -> float:
+        """
+        Nearest-rank percentile (0-100) of the buffered samples; 0.0 if empty.
+        """
+        if not self._count:
+            return 0.0
+        ordered = sorted(self._data[:self._count])
+        rank = int(round(pct / 100.0 * (len(ordered) - 1)))
+        return ordered[rank]
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+
+
+class FrameStats:
+    """
+    Rolling per-frame timings for the performance HUD.
+
+    Fed by the game's Profiler through on_phase() while the HUD is shown
+    (leaf movement is shown as "update") and by mark_tick() from
+    GameController._tick for FPS. Readers (the HUD) summarize at a few Hz
+    with summary().
+    """
+
+    PHASES = ("update", "collision", "render")
+    # Profiler phase -> HUD phase; other profiler phases are not shown
+    _FROM_PROFILER = {"move": "update", "collision": "collision", "render": "render"}
+
+    def __init__(self, window: int = 240):
+        self.phases: Dict[str, RingBuffer] = {name: RingBuffer(window) for name in self.PHASES}
+        self._tick_times = RingBuffer(window)
+
+    def record(self, phase: str, ms: float) -> None:
+        self.phases[phase].append(ms)
+
+    def on_phase(self, phase: str, ms: float) -> None:
+        """
+        Profiler listener.
+        """
+        name = self._FROM_PROFILER.get(phase)
+        if name is not None:
+            self.phases[name].append(ms)
+
+    def mark_tick(self, now: Optional[float] = None) -> None:
+        self._tick_times.append(time.perf_counter() if now is None else now)
+
+    def fps(self) -> float:
+        ticks = self._tick_times.values()
+        if len(ticks) < 2 or ticks[-1] <= ticks[0]:
+            return 0.0
+        return (len(ticks) - 1) / (ticks[-1] - ticks[0])
+
+    def summary(self) -> Dict[str, float]:
+        """
+        fps plus <phase>_p50 / <phase>_p99 in milliseconds for every phase.
+        """
+        result = {"fps": self.fps()}
+        for name, samples in self.phases.items():
+            result[f"{name}_p50"] = samples.percentile(50)
+            result[f"{name}_p99"] = samples.percentile(99)
+        return result
+
+    def clear(self) -> None:
+        for samples in self.phases.values():
+            samples.clear()
+        self._tick_times.clear()
+
+
+class InputLatency:
+    """
+    Input-to-photon latency: from an input event to the end of the repaint
+    of the first frame that reflects it.
+
+    input() is called from the Tk event handler and returns the input's
+    sequence number. presented(applied_seq) is called once a frame has been
+    drawn and repainted (from a root.after_idle() callback queued after the
+    render, so measuring adds no extra flush); it completes the oldest timed
+    input if that frame includes it (applied_seq is the newest input the
+    frame's state contains; None means every input so far). Only one input
+    is timed at a time, so a burst of mouse motion is one sample.
+    """
+
+    def __init__(self, window: int = 240):
+        self.samples = RingBuffer(window)
+        self.count = 0
+        self.seq = 0
+        self._pending_seq = 0
+        self._pending_at = 0.0
+
+    @property
+    def pending(self) -> bool:
+        return self._pending_seq != 0
+
+    def input(self, now: Optional[float] = None) -> int:
+        self.seq += 1
+        if not self._pending_seq:
+            self._pending_seq = self.seq
+            self._pending_at = time.perf_counter() if now is None else now
+        return self.seq
+
+    def presented(self, applied_seq: Optional[int] = None, now: Optional[float] = None) -> None:
+        if not self._pending_seq or (applied_seq is not None and applied_seq < self._pending_seq):
+            return
+        now = time.perf_counter() if now is None else now
+        self.samples.append((now - self._pending_at) * 1000.0)
+        self.count += 1
+        self._pending_seq = 0
+
+    def summary(self) -> Dict[str, float]:
+        return {"p50": self.samples.percentile(50), "p99": self.samples.percentile(99), "count": float(self.count)}
@@ -0,0 +1,153 @@
+import logging
+import os
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from utils.constants import (
+    TICK_MS, BACKGROUND_STEPS, PERF_CONFIG_PATH, PERF_PROFILE_DEFAULT,
+)
+
+logger = logging.getLogger("leaf_catcher.perf_profiles")
+
+RENDER_BACKENDS = ("images", "shapes")
+
+
+class PerfProfile(NamedTuple):
+    """
+    Runtime performance settings, passed to GameController, GameView and
+    MenuView when they are constructed.
+
+    tick_ms is how often the game loop runs and draws a frame. The simulation
+    itself always steps every TICK_MS (leaf speeds are per step), so a loop of
+    2 * TICK_MS runs two steps and renders once: half the drawing, same game
+    speed. max_leaves caps live leaves (0 = no cap). The "shapes" backend
+    draws ovals and rectangles instead of images; asset_scale is the
+    resolution images are resampled at, relative to their display size.
+    adaptive_quality lets a QualityGovernor step below these settings under load.
+    """
+    name: str = "balanced"
+    tick_ms: int = TICK_MS
+    max_leaves: int = 0
+    render_backend: str = "images"
+    asset_scale: float = 1.0
+    background_steps: int = BACKGROUND_STEPS
+    adaptive_quality: bool = True
+
+
+PROFILES: Dict[str, PerfProfile] = {
+    # Slow kiosks: 30 FPS, few leaves, no per-pixel alpha blending
+    "low": PerfProfile("low", tick_ms=2 * TICK_MS, max_leaves=60, render_backend="shapes",
+                       asset_scale=0.5, background_steps=12),
+    "balanced": PerfProfile("balanced"),
+    "high": PerfProfile("high", background_steps=64),
+}
+
+# Settable from a config file or the command line, with their types
+_FIELDS: Dict[str, type] = {
+    "tick_ms": int,
+    "max_leaves": int,
+    "render_backend": str,
+    "asset_scale": float,
+    "background_steps": int,
+    "adaptive_quality": bool,
+}
+
+
+def validate(profile: PerfProfile) -> PerfProfile:
+    """
+    Return profile unchanged, or raise ValueError naming the bad setting.
+    """
+    if profile.tick_ms < TICK_MS or profile.tick_ms % TICK_MS:
+        raise ValueError(f"profile {profile.name!r}: tick_ms must be a multiple of {TICK_MS}, got {profile.tick_ms}")
+    if profile.max_leaves < 0:
+        raise ValueError(f"profile {profile.name!r}: max_leaves must be >= 0 (0 = no cap)")
+    if profile.render_backend not in RENDER_BACKENDS:
+        raise ValueError(f"profile {profile.name!r}: render_backend must be one of {', '.join(RENDER_BACKENDS)}")
+    if not 0.0 < profile.asset_scale <= 1.0:
+        raise ValueError(f"profile {profile.name!r}: asset_scale must be in (0, 1]")
+    if profile.background_steps < 1:
+        raise ValueError(f"profile {profile.name!r}: background_steps must be >= 1")
+    return profile
+
+
+def apply_overrides(profile: PerfProfile, overrides: Mapping[str, Any]) -> PerfProfile:
+    """
+    Profile with the given fields replaced (None values are ignored).
+    """
+    changes = {}
+    for key, value in overrides.items():
+        if value is None:
+            continue
+        if key not in _FIELDS:
+            raise ValueError(f"unknown profile setting {key!r} (known: {', '.join(_FIELDS)})")
+        try:
+            if _FIELDS[key] is bool and not isinstance(value, bool):
+                raise TypeError(key)
+            changes[key] = _FIELDS[key](value)
+        except (TypeError, ValueError):
+            raise ValueError(f"profile setting {key!r}: expected {_FIELDS[key].__name__}, got {value!r}") from None
+    return validate(profile._replace(**changes))
+
+
+def _read_toml(path: str) -> Dict[str, Any]:
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        try:
+            import tomli as tomllib  # type: ignore
+        except ImportError:
+            raise ValueError(f"cannot read {path}: TOML support needs Python 3.11+ or the tomli package") from None
+    with open(path, "rb") as f:
+        try:
+            return tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"{path}: {e}") from None
+
+
+def load_profiles(path: Optional[str]) -> Tuple[Dict[str, PerfProfile], Optional[str]]:
+    """
+    Built-in profiles merged with the [profiles.<name>] tables of the TOML
+    file at path, and the file's top-level `profile` choice (or None).
+    A table for a built-in name overrides just the settings it lists; a new
+    name starts from "balanced", or from the profile named by its `base` key.
+    """
+    profiles = dict(PROFILES)
+    if not path:
+        return profiles, None
+    data = _read_toml(path)
+    tables = data.get("profiles", {})
+    if not isinstance(tables, dict):
+        raise ValueError(f"{path}: [profiles] must be a table of profile tables")
+    for name, table in tables.items():
+        if not isinstance(table, dict):
+            raise ValueError(f"{path}: profiles.{name} must be a table")
+        table = dict(table)
+        base_name = table.pop("base", name if name in profiles else PERF_PROFILE_DEFAULT)
+        if base_name not in profiles:
+            raise ValueError(f"{path}: profiles.{name} is based on unknown profile {base_name!r}")
+        try:
+            profiles[name] = apply_overrides(profiles[base_name]._replace(name=name), table)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+    selected = data.get("profile")
+    if selected is not None and not isinstance(selected, str):
+        raise ValueError(f"{path}: profile must be a profile name")
+    return profiles, selected
+
+
+def resolve_profile(name: Optional[str] = None, config_path: Optional[str] = None,
+                    overrides: Optional[Mapping[str, Any]] = None) -> PerfProfile:
+    """
+    The profile to run with: `name` (else the config file's choice, else
+    PERF_PROFILE_DEFAULT), with any individual overrides (e.g. CLI flags)
+    applied on top. Without an explicit config_path, PERF_CONFIG_PATH is
+    read if it exists. Raises ValueError for unknown names or bad settings.
+    """
+    if config_path is None and os.path.exists(PERF_CONFIG_PATH):
+        config_path = PERF_CONFIG_PATH
+    profiles, selected = load_profiles(config_path)
+    name = name or selected or PERF_PROFILE_DEFAULT
+    if name not in profiles:
+        raise ValueError(f"unknown performance profile {name!r} (known: {', '.join(sorted(profiles))})")
+    profile = apply_overrides(profiles[name], overrides or {})
+    logger.info("Performance profile: %s", profile)
+    return profile
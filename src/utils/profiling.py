@@ -0,0 +1,252 @@
+import csv
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("leaf_catcher.profiling")
+
+# Phases timed by GameController / GameView
+PHASES = ("spawn", "move", "collision", "render", "score")
+
+# Histogram bucket upper bounds in ms: sqrt(2) steps from 1 us to ~12 s.
+# Fixed at import so recording a sample never allocates.
+BUCKET_BOUNDS_MS = tuple(0.001 * 2 ** (i / 2) for i in range(48))
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram. add() only increments preallocated
+    counters; percentiles are estimated from bucket upper bounds.
+    """
+
+    __slots__ = ("counts", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)  # last bucket: overflow
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pct: float) -> float:
+        """
+        Upper bound (ms) of the bucket holding the pct-th percentile sample.
+        """
+        if not self.count:
+            return 0.0
+        target = pct / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "min_ms": self.min_ms if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+        }
+
+    def reset(self) -> None:
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+
+class _PhaseTimer:
+    """
+    Reusable context manager for one phase; preallocated so timing a phase
+    creates no objects.
+    """
+
+    __slots__ = ("_profiler", "_phase", "_start")
+
+    def __init__(self, profiler: "Profiler", phase: str):
+        self._profiler = profiler
+        self._phase = phase
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = self._profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.record(self._phase, (self._profiler.clock() - self._start) * 1000.0)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Profiler:
+    """
+    Per-phase timing hooks for the game loop.
+
+    Call sites wrap a phase with `with profiler.phase("collision"): ...`.
+    Samples go to fixed-size histograms (when enabled) and to any listeners
+    added with add_listener(), e.g. the HUD's FrameStats. With histograms
+    disabled and no listeners, phase() returns a shared no-op timer, so the
+    hooks can stay in production code.
+    """
+
+    def __init__(self, phases: Sequence[str] = PHASES, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.histograms: Dict[str, Histogram] = {name: Histogram() for name in phases}
+        self._timers = {name: _PhaseTimer(self, name) for name in phases}
+        self._listeners: List[Callable[[str, float], None]] = []
+        self._histograms_enabled = False
+        self.active = False
+
+        self._export_path: Optional[str] = None
+        self._export_interval_s = 0.0
+        self._next_export = 0.0
+
+    # -- Configuration --
+
+    def _update_active(self) -> None:
+        self.active = self._histograms_enabled or bool(self._listeners)
+
+    def enable(self, export_path: Optional[str] = None, export_interval_s: float = 0.0) -> None:
+        """
+        Start collecting histograms. If export_path is given, export_now()
+        writes there; with export_interval_s > 0 tick() also exports periodically.
+        The format follows the extension: .csv or JSON otherwise.
+        """
+        self._histograms_enabled = True
+        self._export_path = export_path
+        self._export_interval_s = export_interval_s
+        self._next_export = time.monotonic() + export_interval_s
+        self._update_active()
+
+    def disable(self) -> None:
+        self._histograms_enabled = False
+        self._update_active()
+
+    @property
+    def enabled(self) -> bool:
+        return self._histograms_enabled
+
+    def add_listener(self, listener: Callable[[str, float], None]) -> None:
+        """
+        Call listener(phase, ms) for every timed phase.
+        """
+        self._listeners.append(listener)
+        self._update_active()
+
+    def remove_listener(self, listener: Callable[[str, float], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+        self._update_active()
+
+    # -- Hot path --
+
+    def phase(self, name: str):
+        """
+        Context manager timing one phase (a shared no-op when inactive).
+        """
+        return self._timers[name] if self.active else _NULL_TIMER
+
+    def record(self, phase: str, ms: float) -> None:
+        if self._histograms_enabled:
+            self.histograms[phase].add(ms)
+        for listener in self._listeners:
+            listener(phase, ms)
+
+    def tick(self) -> None:
+        """
+        Called once per game tick; performs periodic export when configured.
+        """
+        if self._export_interval_s > 0 and self._histograms_enabled:
+            now = time.monotonic()
+            if now >= self._next_export:
+                self._next_export = now + self._export_interval_s
+                self.export_now()
+
+    # -- Export --
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: hist.summary() for name, hist in self.histograms.items()}
+
+    def reset(self) -> None:
+        for hist in self.histograms.values():
+            hist.reset()
+
+    def export_json(self, path: str) -> None:
+        payload = {
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "phases": {
+                name: dict(hist.summary(), buckets=list(hist.counts))
+                for name, hist in self.histograms.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+
+    def export_csv(self, path: str) -> None:
+        """
+        Long format: one row per non-empty bucket, with the phase summary repeated.
+        """
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["phase", "bucket_le_ms", "bucket_count",
+                             "count", "mean_ms", "p50_ms", "p99_ms", "max_ms"])
+            for name, hist in self.histograms.items():
+                s = hist.summary()
+                for i, n in enumerate(hist.counts):
+                    if not n:
+                        continue
+                    bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else float("inf")
+                    writer.writerow([name, f"{bound:.6g}", n, s["count"],
+                                     f"{s['mean_ms']:.6g}", f"{s['p50_ms']:.6g}",
+                                     f"{s['p99_ms']:.6g}", f"{s['max_ms']:.6g}"])
+
+    def export(self, path: str) -> None:
+        if os.path.splitext(path)[1].lower() == ".csv":
+            self.export_csv(path)
+        else:
+            self.export_json(path)
+
+    def export_now(self) -> Optional[str]:
+        """
+        Export to the configured path (if any). Returns the path written.
+        """
+        if not self._export_path:
+            return None
+        try:
+            self.export(self._export_path)
+        except OSError as e:
+            logger.warning("Could not export profile to %s: %s", self._export_path, e)
+            return None
+        logger.info("Exported phase timings to %s", os.path.abspath(self._export_path))
+        return self._export_path
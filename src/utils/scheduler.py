@@ -0,0 +1,94 @@
+import heapq
+from itertools import count
+from typing import Any, Callable, List, Optional, Tuple
+
+from utils.constants import TICK_MS
+
+
+def ms_to_ticks(ms: float) -> int:
+    """
+    Whole simulation ticks for a duration in ms (at least one).
+    """
+    return max(1, int(round(ms / TICK_MS)))
+
+
+class ScheduledEvent:
+    """
+    Handle returned by TickScheduler; pass it to cancel().
+    """
+
+    __slots__ = ("due", "interval", "fn", "args", "cancelled")
+
+    def __init__(self, due: int, interval: int, fn: Callable[..., Any], args: Tuple[Any, ...]):
+        self.due = due
+        self.interval = interval  # 0 for one-shot events
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+
+
+class TickScheduler:
+    """
+    Timed events driven by simulation ticks instead of wall-clock timers.
+
+    Events sit in a heap keyed by (due tick, insertion order), so events due
+    on the same tick always fire in the order they were scheduled. advance()
+    only looks at the head of the heap: a tick with nothing due costs O(1) no
+    matter how many events are pending, and each fired event O(log n).
+    Cancelled events are dropped lazily when they reach the head.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self._heap: List[Tuple[int, int, ScheduledEvent]] = []
+        self._seq = count()
+
+    def call_at(self, tick: int, fn: Callable[..., Any], *args: Any) -> ScheduledEvent:
+        """
+        Run fn(*args) on the given tick (or the next advance() if already past).
+        """
+        event = ScheduledEvent(tick, 0, fn, args)
+        heapq.heappush(self._heap, (tick, next(self._seq), event))
+        return event
+
+    def call_later(self, ticks: int, fn: Callable[..., Any], *args: Any) -> ScheduledEvent:
+        return self.call_at(self.tick + ticks, fn, *args)
+
+    def call_every(self, interval: int, fn: Callable[..., Any], *args: Any,
+                   first: Optional[int] = None) -> ScheduledEvent:
+        """
+        Run fn(*args) every `interval` ticks, first after `first` ticks
+        (default: one interval from now).
+        """
+        if interval < 1:
+            raise ValueError("interval must be at least one tick")
+        event = ScheduledEvent(self.tick + (interval if first is None else first), interval, fn, args)
+        heapq.heappush(self._heap, (event.due, next(self._seq), event))
+        return event
+
+    def cancel(self, event: ScheduledEvent) -> None:
+        event.cancelled = True
+
+    def advance(self) -> int:
+        """
+        Move to the next tick and fire everything due. Returns the number fired.
+        """
+        self.tick += 1
+        heap = self._heap
+        fired = 0
+        while heap and heap[0][0] <= self.tick:
+            _due, _seq, event = heapq.heappop(heap)
+            if event.cancelled:
+                continue
+            if event.interval:
+                event.due += event.interval
+                heapq.heappush(heap, (event.due, next(self._seq), event))
+            event.fn(*event.args)
+            fired += 1
+        return fired
+
+    def pending(self) -> int:
+        return sum(1 for _due, _seq, event in self._heap if not event.cancelled)
+
+    def clear(self) -> None:
+        self._heap.clear()
@@ -0,0 +1,443 @@
+"""
+Spectator streaming: game state published per tick over a local socket.
+
+Wire format (little endian). Every frame is length-prefixed:
+
+    frame    := u32 length | header | body
+    header   := u8 kind | u32 tick | f32 basket_x | u32 score
+    keyframe := leaves                            (kind 1: the full leaf set)
+    delta    := leaves                            (kind 2: spawned leaves)
+                u32 n | n * u32 id                (removed leaves)
+                u32 n | n * u32 id | n * i16 dx | n * i16 dy   (moved leaves)
+    leaves   := u32 n | n * u32 id | n * i32 x | n * i32 y | n * u16 size
+
+Records are stored column by column, so each column is packed and unpacked
+with one struct call. Positions are fixed point (1/16 px). Moves are deltas
+from the last sent position, so rounding never accumulates. A keyframe is
+sent every SPECTATOR_KEYFRAME_TICKS and whenever a subscriber joins or has
+to resync.
+"""
+import asyncio
+import itertools
+import logging
+import queue
+import struct
+import threading
+from collections import deque
+from operator import attrgetter
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from models.game_state import GameState
+from models.leaf import Leaf
+from utils.constants import (
+    LEAF_COLOR,
+    SPECTATOR_HOST, SPECTATOR_PORT, SPECTATOR_KEYFRAME_TICKS, SPECTATOR_QUEUE_FRAMES,
+)
+
+logger = logging.getLogger("leaf_catcher.spectator")
+
+KEYFRAME = 1
+DELTA = 2
+_SCALE = 16  # fixed point: 1/16 px
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<BIfI")
+_COUNT = struct.Struct("<I")
+_MOVE_MAX = 32767
+_X = attrgetter("x")
+_Y = attrgetter("y")
+
+
+def _pack(code: str, values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{code}", *values)
+
+
+def _unpack(code: str, count: int, payload: bytes, offset: int) -> Tuple[Tuple[int, ...], int]:
+    fmt = f"<{count}{code}"
+    return struct.unpack_from(fmt, payload, offset), offset + struct.calcsize(fmt)
+
+
+class StateSnapshot(NamedTuple):
+    """
+    What a frame needs from a GameState, copied on the game thread so the
+    encoder can run on another one.
+    """
+    basket_x: float
+    score: int
+    leaves: Tuple[Leaf, ...]  # identity and size (fixed at spawn)
+    xs: Tuple[float, ...]
+    ys: Tuple[float, ...]
+
+
+def snapshot_state(state: GameState) -> StateSnapshot:
+    leaves = tuple(state.leaves)
+    return StateSnapshot(state.basket.x, state.score, leaves, tuple(map(_X, leaves)), tuple(map(_Y, leaves)))
+
+
+def parse_address(address: str) -> Tuple[str, object]:
+    """
+    "unix:/path/to.sock" -> ("unix", path); "host:port", ":port" or "" -> ("tcp", (host, port)).
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return "tcp", (host or SPECTATOR_HOST, int(port) if port else SPECTATOR_PORT)
+
+
+class StateEncoder:
+    """
+    Turns successive GameStates into keyframe/delta frames. Leaves are
+    identified by object identity; the encoder keeps the leaves of the last
+    frame (and their last sent positions) to compute the next delta.
+    """
+
+    def __init__(self, keyframe_ticks: int = SPECTATOR_KEYFRAME_TICKS):
+        self.keyframe_ticks = keyframe_ticks
+        self.tick = 0
+        self._next_id = 1
+        self._sent: Dict[Leaf, Tuple[int, int, int]] = {}  # leaf -> (id, qx, qy)
+        # Keyframe requests may come from another thread than encode(): each
+        # one takes a new number, and encode() keyframes while the newest
+        # number differs from the one it last served, so none is lost
+        self._request_numbers = itertools.count(1)
+        self._keyframe_requested = next(self._request_numbers)  # the first frame is a keyframe
+        self._keyframe_served = 0
+
+    def request_keyframe(self) -> None:
+        self._keyframe_requested = next(self._request_numbers)
+
+    def encode(self, state: GameState) -> Tuple[bytes, bool]:
+        """
+        Frame for the current state and whether it is a keyframe.
+        """
+        return self.encode_snapshot(snapshot_state(state))
+
+    def encode_snapshot(self, snapshot: StateSnapshot) -> Tuple[bytes, bool]:
+        self.tick += 1
+        requested = self._keyframe_requested
+        keyframe = requested != self._keyframe_served or self.tick % self.keyframe_ticks == 0
+        self._keyframe_served = requested
+        previous = self._sent
+        sent: Dict[Leaf, Tuple[int, int, int]] = {}
+        spawn_ids: List[int] = []
+        spawn_xs: List[int] = []
+        spawn_ys: List[int] = []
+        spawn_sizes: List[int] = []
+        move_ids: List[int] = []
+        move_dxs: List[int] = []
+        move_dys: List[int] = []
+        next_id = self._next_id
+        for leaf, x, y in zip(snapshot.leaves, snapshot.xs, snapshot.ys):
+            qx = round(x * _SCALE)
+            qy = round(y * _SCALE)
+            known = previous.get(leaf)
+            if known is None or keyframe:
+                if known is None:
+                    leaf_id = next_id
+                    next_id += 1
+                else:
+                    leaf_id = known[0]
+                spawn_ids.append(leaf_id)
+                spawn_xs.append(qx)
+                spawn_ys.append(qy)
+                spawn_sizes.append(leaf.size)
+                sent[leaf] = (leaf_id, qx, qy)
+                continue
+            leaf_id, sent_x, sent_y = known
+            dx = qx - sent_x
+            dy = qy - sent_y
+            if dx or dy:
+                if not (-_MOVE_MAX <= dx <= _MOVE_MAX and -_MOVE_MAX <= dy <= _MOVE_MAX):
+                    dx = max(-_MOVE_MAX, min(_MOVE_MAX, dx))
+                    dy = max(-_MOVE_MAX, min(_MOVE_MAX, dy))
+                move_ids.append(leaf_id)
+                move_dxs.append(dx)
+                move_dys.append(dy)
+                sent[leaf] = (leaf_id, sent_x + dx, sent_y + dy)
+            else:
+                sent[leaf] = known
+        self._next_id = next_id
+        parts: List[bytes] = [
+            _HEADER.pack(KEYFRAME if keyframe else DELTA, self.tick, float(snapshot.basket_x), snapshot.score),
+            _COUNT.pack(len(spawn_ids)),
+            _pack("I", spawn_ids), _pack("i", spawn_xs), _pack("i", spawn_ys), _pack("H", spawn_sizes),
+        ]
+        if not keyframe:
+            removed = [info[0] for leaf, info in previous.items() if leaf not in sent]
+            parts += [
+                _COUNT.pack(len(removed)), _pack("I", removed),
+                _COUNT.pack(len(move_ids)), _pack("I", move_ids), _pack("h", move_dxs), _pack("h", move_dys),
+            ]
+        self._sent = sent
+        payload = b"".join(parts)
+        return _LENGTH.pack(len(payload)) + payload, keyframe
+
+
+class StateDecoder:
+    """
+    Applies frames to a local GameState (e.g. one rendered by a GameView).
+    Deltas are ignored until the first keyframe.
+    """
+
+    def __init__(self, state: Optional[GameState] = None):
+        self.state = state if state is not None else GameState()
+        self.tick = 0
+        self.synced = False
+        self._leaves: Dict[int, Leaf] = {}
+
+    def apply(self, payload: bytes) -> None:
+        """
+        Apply one frame payload (without its length prefix).
+        """
+        kind, tick, basket_x, score = _HEADER.unpack_from(payload, 0)
+        offset = _HEADER.size
+        if kind == DELTA and not self.synced:
+            return
+        self.tick = tick
+        self.state.set_basket_position(int(round(basket_x)))
+        self.state.score = score
+        if kind == KEYFRAME:
+            self._leaves = {}
+            self.synced = True
+        leaves = self._leaves
+        (count,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        ids, offset = _unpack("I", count, payload, offset)
+        xs, offset = _unpack("i", count, payload, offset)
+        ys, offset = _unpack("i", count, payload, offset)
+        sizes, offset = _unpack("H", count, payload, offset)
+        for leaf_id, qx, qy, size in zip(ids, xs, ys, sizes):
+            leaves[leaf_id] = Leaf(x=qx / _SCALE, y=qy / _SCALE, speed=0, size=size, color=LEAF_COLOR)
+        if kind == DELTA:
+            (count,) = _COUNT.unpack_from(payload, offset)
+            offset += _COUNT.size
+            ids, offset = _unpack("I", count, payload, offset)
+            for leaf_id in ids:
+                leaves.pop(leaf_id, None)
+            (count,) = _COUNT.unpack_from(payload, offset)
+            offset += _COUNT.size
+            ids, offset = _unpack("I", count, payload, offset)
+            dxs, offset = _unpack("h", count, payload, offset)
+            dys, offset = _unpack("h", count, payload, offset)
+            for leaf_id, dx, dy in zip(ids, dxs, dys):
+                leaf = leaves.get(leaf_id)
+                if leaf is not None:
+                    leaf.x += dx / _SCALE
+                    leaf.y += dy / _SCALE
+        self.state.leaves = list(leaves.values())
+
+
+class _Subscriber:
+    __slots__ = ("writer", "task", "frames", "waiting_for_keyframe")
+
+    def __init__(self, writer: asyncio.StreamWriter, max_frames: int):
+        self.writer = writer
+        self.task = asyncio.current_task()
+        self.frames: "asyncio.Queue[bytes]" = asyncio.Queue(max_frames)
+        self.waiting_for_keyframe = True
+
+
+class SpectatorPublisher:
+    """
+    Publishes a GameController's state every tick to any number of local
+    subscribers.
+
+    The socket server runs on an asyncio loop in its own thread (start()),
+    or on an already running loop such as the app's --asyncio main loop
+    (start_async()). The game thread only copies positions into a
+    StateSnapshot (skipped entirely with no subscribers) and hands it over;
+    the loop encodes the newest snapshot, so when encoding falls behind the
+    ticks in between are folded into one delta instead of queueing up. Each
+    subscriber has a bounded frame queue drained by its own writer task. A
+    subscriber that falls behind has its queue emptied and resumes from the
+    next keyframe, so it never stalls the game loop.
+    """
+
+    def __init__(self, address: str = "", max_queued_frames: int = SPECTATOR_QUEUE_FRAMES):
+        self.address = address
+        self.max_queued_frames = max_queued_frames
+        self.encoder = StateEncoder()
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self._subscribers: List[_Subscriber] = []
+        self._subscriber_count = 0  # read by the game thread
+        self._latest: Deque[StateSnapshot] = deque(maxlen=1)  # game thread -> loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    # -- Game thread --
+
+    def attach(self, controller) -> None:
+        """
+        Publish controller.game_state after every tick.
+        """
+        controller.tick_hooks.append(lambda _frame_ms: self.publish(controller.game_state))
+
+    def publish(self, state: GameState) -> None:
+        if not self._subscriber_count or self._loop is None:
+            # Nobody to send deltas to; the next subscriber starts from a keyframe
+            self.encoder.request_keyframe()
+            return
+        self._latest.append(snapshot_state(state))  # replaces one not encoded yet
+        self._loop.call_soon_threadsafe(self._encode_latest)
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._subscriber_count
+
+    # -- Lifecycle --
+
+    def start(self, timeout: float = 5.0) -> None:
+        """
+        Start the server thread; raises if the address cannot be bound.
+        """
+        self._thread = threading.Thread(target=self._run, name="spectator", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout)
+        if self._error is not None:
+            raise self._error
+
+    async def start_async(self) -> None:
+        """
+        Serve from the running event loop instead of a thread; raises if the
+        address cannot be bound. Stop with stop_async().
+        """
+        await self._open_server()
+        self._loop = asyncio.get_running_loop()
+        logger.info("Spectator stream listening on %s", self.bound_address)
+
+    async def stop_async(self) -> None:
+        if self._loop is None:
+            return
+        self._loop = None
+        await self._close()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        loop = self._loop
+        if loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._loop = None
+
+    @property
+    def bound_address(self) -> Optional[object]:
+        """
+        (host, port) or socket path actually bound (useful with port 0).
+        """
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()
+
+    # -- Server loop thread --
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._open_server())
+        except (OSError, ValueError) as e:
+            self._error = e
+            self._started.set()
+            loop.close()
+            return
+        self._loop = loop
+        logger.info("Spectator stream listening on %s", self.bound_address)
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _open_server(self) -> None:
+        kind, target = parse_address(self.address)
+        if kind == "unix":
+            self._server = await asyncio.start_unix_server(self._serve, path=target)
+        else:
+            host, port = target
+            self._server = await asyncio.start_server(self._serve, host, port)
+
+    async def _close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        tasks = [subscriber.task for subscriber in self._subscribers if subscriber.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _shutdown(self) -> None:
+        await self._close()
+        asyncio.get_running_loop().stop()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        subscriber = _Subscriber(writer, self.max_queued_frames)
+        self._subscribers.append(subscriber)
+        self._subscriber_count = len(self._subscribers)
+        self.encoder.request_keyframe()
+        logger.info("Spectator connected: %s", writer.get_extra_info("peername"))
+        try:
+            while True:
+                frame = await subscriber.frames.get()
+                writer.write(frame)
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._subscribers.remove(subscriber)
+            self._subscriber_count = len(self._subscribers)
+            writer.close()
+            logger.info("Spectator disconnected.")
+
+    def _encode_latest(self) -> None:
+        try:
+            snapshot = self._latest.pop()
+        except IndexError:
+            return  # already encoded by an earlier call
+        frame, keyframe = self.encoder.encode_snapshot(snapshot)
+        self._broadcast(frame, keyframe)
+
+    def _broadcast(self, frame: bytes, keyframe: bool) -> None:
+        for subscriber in self._subscribers:
+            if subscriber.waiting_for_keyframe:
+                if not keyframe:
+                    continue
+                subscriber.waiting_for_keyframe = False
+            try:
+                subscriber.frames.put_nowait(frame)
+                self.frames_sent += 1
+            except asyncio.QueueFull:
+                # Too slow: drop its backlog and resume at the next keyframe
+                while not subscriber.frames.empty():
+                    subscriber.frames.get_nowait()
+                    self.frames_dropped += 1
+                subscriber.waiting_for_keyframe = True
+                self.encoder.request_keyframe()
+
+
+def read_frames(sock, out: "queue.Queue[Optional[bytes]]") -> None:
+    """
+    Read length-prefixed frames from a connected blocking socket into out
+    until the connection closes; then put None.
+    """
+    buffer = bytearray()
+    try:
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            while len(buffer) >= _LENGTH.size:
+                (length,) = _LENGTH.unpack_from(buffer, 0)
+                end = _LENGTH.size + length
+                if len(buffer) < end:
+                    break
+                out.put(bytes(buffer[_LENGTH.size:end]))
+                del buffer[:end]
+    except OSError as e:
+        logger.info("Spectator connection lost: %s", e)
+    finally:
+        out.put(None)
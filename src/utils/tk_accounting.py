@@ -0,0 +1,177 @@
+import logging
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("leaf_catcher.tk_accounting")
+
+
+class TkBudgetExceeded(AssertionError):
+    """
+    Raised by TkAccounting.assert_within_budget() when a frame issued more
+    Tk calls than its TkCallBudget allows.
+    """
+
+
+class TkCallBudget:
+    """
+    Allowed Tk calls per frame: a fixed allowance plus an allowance per live leaf.
+    E.g. TkCallBudget(fixed=8, per_leaf=1) permits one call per leaf on top
+    of the per-frame overhead, so adding a second per-leaf call fails.
+    """
+
+    def __init__(self, fixed: int, per_leaf: float = 0.0):
+        self.fixed = fixed
+        self.per_leaf = per_leaf
+
+    def limit(self, leaves: int) -> int:
+        return int(self.fixed + self.per_leaf * leaves)
+
+
+class _CountingProxy:
+    """
+    Stands in for a Tk widget: every method call is forwarded, counted and
+    timed under "<name>.<method>". Attributes that are not callable pass through.
+    """
+
+    def __init__(self, widget: Any, name: str, accounting: "TkAccounting"):
+        object.__setattr__(self, "_widget", widget)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_accounting", accounting)
+        object.__setattr__(self, "_wrapped", {})
+
+    def __getattr__(self, attr: str):
+        wrapped = self._wrapped.get(attr)
+        if wrapped is not None:
+            return wrapped
+        target = getattr(self._widget, attr)
+        if not callable(target):
+            return target
+        key = f"{self._name}.{attr}"
+        accounting = self._accounting
+        clock = accounting.clock
+
+        def counted(*args, **kwargs):
+            start = clock()
+            try:
+                return target(*args, **kwargs)
+            finally:
+                accounting.add(key, clock() - start)
+
+        self._wrapped[attr] = counted
+        return counted
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._widget, attr, value)
+
+    @property
+    def widget(self) -> Any:
+        """
+        The real widget, e.g. to pass as a parent to other Tk calls.
+        """
+        return self._widget
+
+
+class TkAccounting:
+    """
+    Optional accounting of the Tk commands GameView issues.
+
+    Wrap widgets with wrap(); GameView calls start_frame() at the start of
+    every render, so a "frame" covers one render plus whatever else touches
+    the widgets before the next one (e.g. the score label update).
+    After each frame, last_frame_counts/last_frame_ms hold calls and Tcl time
+    by "<widget>.<method>", and the frame is checked against the budget.
+    """
+
+    def __init__(self, budget: Optional[TkCallBudget] = None, clock: Callable[[], float] = time.perf_counter):
+        self.budget = budget
+        self.clock = clock
+        self.frames = 0
+        self.over_budget_frames = 0
+        self.max_frame_calls = 0
+        self.totals: Counter = Counter()
+        self.total_ms: Dict[str, float] = {}
+        self.last_frame_counts: Counter = Counter()
+        self.last_frame_ms: Dict[str, float] = {}
+        self.last_frame_leaves = 0
+        self._counts: Counter = Counter()
+        self._ms: Dict[str, float] = {}
+        self.last_frame_checked = False
+        self._leaves = 0
+        self._check = False
+        self._in_frame = False
+
+    def wrap(self, widget: Any, name: str) -> Any:
+        return _CountingProxy(widget, name, self)
+
+    def add(self, key: str, seconds: float) -> None:
+        ms = seconds * 1000.0
+        self._counts[key] += 1
+        self._ms[key] = self._ms.get(key, 0.0) + ms
+        self.totals[key] += 1
+        self.total_ms[key] = self.total_ms.get(key, 0.0) + ms
+
+    def start_frame(self, leaves: int = 0, check: bool = True) -> None:
+        """
+        Close the current frame (if any) and start counting a new one.
+        leaves is the live leaf count the new frame is drawn for; frames
+        started with check=False (e.g. full background redraws) are counted
+        but not held to the budget. Calls made outside any frame (widget
+        setup) are dropped.
+        """
+        if self._in_frame:
+            self._finish_frame()
+        else:
+            self._counts.clear()
+            self._ms.clear()
+        self._in_frame = True
+        self._leaves = leaves
+        self._check = check
+
+    def _finish_frame(self) -> None:
+        self.frames += 1
+        self.last_frame_counts = self._counts
+        self.last_frame_ms = self._ms
+        self.last_frame_leaves = self._leaves
+        self.last_frame_checked = self._check
+        self._counts = Counter()
+        self._ms = {}
+        calls = self.last_frame_calls
+        self.max_frame_calls = max(self.max_frame_calls, calls)
+        if self._check and self.budget is not None and calls > self.budget.limit(self.last_frame_leaves):
+            self.over_budget_frames += 1
+            if self.over_budget_frames == 1:
+                logger.warning(
+                    "Frame used %d Tk calls for %d leaves (budget %d): %s",
+                    calls, self.last_frame_leaves, self.budget.limit(self.last_frame_leaves),
+                    dict(self.last_frame_counts),
+                )
+
+    def end_frame(self) -> None:
+        """
+        Close the current frame without starting another (e.g. before asserting).
+        """
+        if self._in_frame:
+            self._finish_frame()
+            self._in_frame = False
+
+    @property
+    def last_frame_calls(self) -> int:
+        return sum(self.last_frame_counts.values())
+
+    @property
+    def last_frame_tcl_ms(self) -> float:
+        return sum(self.last_frame_ms.values())
+
+    def assert_within_budget(self) -> None:
+        """
+        Raise TkBudgetExceeded if the last completed frame was over budget.
+        """
+        if self.budget is None or not self.last_frame_checked:
+            return
+        limit = self.budget.limit(self.last_frame_leaves)
+        if self.last_frame_calls > limit:
+            raise TkBudgetExceeded(
+                f"{self.last_frame_calls} Tk calls for {self.last_frame_leaves} leaves "
+                f"exceeds budget of {limit}: {dict(self.last_frame_counts)}"
+            )
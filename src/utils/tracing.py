@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("leaf_catcher.tracing")
+
+# Setting this to a file path enables tracing without a CLI flag
+TRACE_ENV_VAR = "LEAF_CATCHER_TRACE"
+
+
+class Tracer:
+    """
+    Records startup phases as monotonic timestamps and writes them in Chrome
+    trace-event format (open in chrome://tracing or https://ui.perfetto.dev).
+
+    Disabled by default; while disabled every call is a cheap no-op, so the
+    hooks can stay in place in production.
+    """
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._threads: Dict[int, str] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def enable(self, path: str) -> None:
+        self.path = path
+        logger.info("Tracing enabled; trace will be written to %s", os.path.abspath(path))
+
+    def _event(self, event: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        event["pid"] = self._pid
+        event["tid"] = thread.ident
+        with self._lock:
+            self._threads.setdefault(thread.ident, thread.name)
+            self._events.append(event)
+
+    def complete(self, name: str, start: float, end: float, cat: str = "startup", **args: Any) -> None:
+        """
+        Record a phase that ran from start to end (time.perf_counter() values).
+        """
+        if not self.enabled:
+            return
+        self._event({"name": name, "cat": cat, "ph": "X",
+                     "ts": start * 1e6, "dur": (end - start) * 1e6, "args": args})
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: Dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, start, time.perf_counter(), cat, **args)
+
+    def span(self, name: str, cat: str = "startup", **args: Any):
+        """
+        Context manager recording the enclosed block as one phase.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, cat, args)
+
+    def instant(self, name: str, cat: str = "startup", **args: Any) -> None:
+        """
+        Record a point in time, e.g. the first rendered frame.
+        """
+        if not self.enabled:
+            return
+        self._event({"name": name, "cat": cat, "ph": "i", "s": "g",
+                     "ts": time.perf_counter() * 1e6, "args": args})
+
+    def write(self) -> Optional[str]:
+        """
+        Write all events recorded so far. Returns the path, or None if disabled.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        try:
+            with open(self.path, "w", encoding="utf-8") as fh:
+                json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, fh)
+        except OSError as e:
+            logger.warning("Could not write trace to %s: %s", self.path, e)
+            return None
+        logger.info("Wrote %d trace events to %s", len(events), os.path.abspath(self.path))
+        return self.path
+
+
+# Process-wide tracer used by app, views and controllers
+tracer = Tracer()
+
+
+def configure_tracing(path: Optional[str] = None) -> bool:
+    """
+    Enable tracing to path, or to $LEAF_CATCHER_TRACE if path is not given.
+    Returns True if tracing is enabled.
+    """
+    path = path or os.environ.get(TRACE_ENV_VAR)
+    if path:
+        tracer.enable(path)
+    return tracer.enabled
@@ -1,6 +1,7 @@
 from tkinter import Canvas, Label
 from typing import Optional, Tuple
 import os
+import time
 
 # Pillow is optional; images will gracefully fall back if not available
 try:
@@ -13,11 +14,17 @@ except Exception:
 
 from utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT,
-    BACKGROUND_GRADIENT_TOP, BACKGROUND_GRADIENT_BOTTOM, BACKGROUND_STEPS,
+    BACKGROUND_GRADIENT_TOP, BACKGROUND_GRADIENT_BOTTOM,
     BASKET_COLOR, SCORE_TEXT_COLOR, LEAF_COLOR, LEAF_SIZE,
     LEAF_IMAGE_PATH, BACKGROUND_IMAGE_PATH, BASKET_IMAGE_PATH,
     BACKGROUND_DARKEN_FACTOR,
+    HUD_REFRESH_MS, HUD_TEXT_COLOR, HUD_BG_COLOR,
 )
+from utils.perf import FrameStats, InputLatency
+from utils.perf_profiles import PerfProfile, PROFILES
+from utils.profiling import Profiler
+from utils.tk_accounting import TkAccounting
+from utils.tracing import tracer
 
 
 class GameView:
@@ -27,11 +34,15 @@ class GameView:
     - Renders basket (image if available, else rectangle)
     - Renders leaves (image if available, else oval)
     - Shows a real-time score label at the top-left
+    - Optional performance HUD (FPS, phase timings, leaf/item counts) at the top-right
+    The performance profile picks the render backend ("shapes" skips the
+    images), the image resolution and the number of gradient bands.
     """
 
-    def __init__(self, master, game_state):
+    def __init__(self, master, game_state, profile: Optional[PerfProfile] = None):
         self.master = master
         self.game_state = game_state
+        self.profile = profile or PROFILES["balanced"]
 
         # Main canvas for drawing the game
         self.canvas = Canvas(master, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, highlightthickness=0)
@@ -51,9 +62,31 @@ class GameView:
         self._basket_photo: Optional[object] = None
         self._background_photo: Optional[object] = None
         self._load_images()
+        # Cleared at runtime (e.g. by the quality governor) to draw leaves as ovals
+        self.leaf_images = True
 
         # Track whether background is drawn to avoid redundant redraws
         self._bg_drawn = False
+        self._first_frame_done = False
+
+        # Performance HUD: a separate Label so it stays above the canvas items
+        # and costs nothing per frame; its text is refreshed at HUD_REFRESH_MS.
+        self._frame_stats: Optional[FrameStats] = None
+        self._profiler = Profiler()  # inactive until the controller attaches its own
+        self._tk_accounting: Optional[TkAccounting] = None
+        self._input_latency: Optional[InputLatency] = None
+        self._message_label: Optional[Label] = None
+        self._hud_visible = False
+        self._hud_refreshed_at = 0.0
+        self.hud_label = Label(
+            master,
+            text="",
+            font=("Courier New", 11),
+            fg=HUD_TEXT_COLOR,
+            bg=HUD_BG_COLOR,
+            justify="left",
+            anchor="nw",
+        )
 
     # ----------------------------
     # Image loading helpers
@@ -64,6 +97,8 @@ class GameView:
         Log and load a single image. Prints the absolute path, existence, and
         success/failure messages. Returns a Tk PhotoImage or None.
         Applies optional brightness adjustment (for background darkening).
+        Below asset_scale 1.0 the image is filtered at that fraction of its
+        display size and blown up with nearest-neighbour (faster, blockier).
         """
         abs_path = os.path.abspath(path)
         print(f"[LeafCatcher] {label} image path: {abs_path}")
@@ -79,7 +114,11 @@ class GameView:
         try:
             img = Image.open(abs_path).convert("RGBA")
             original_size = img.size
-            if size:
+            scale = self.profile.asset_scale
+            if size and scale < 1.0:
+                small = (max(1, int(size[0] * scale)), max(1, int(size[1] * scale)))
+                img = img.resize(small, Image.BILINEAR).resize(size, Image.NEAREST)
+            elif size:
                 img = img.resize(size, Image.LANCZOS)
             # Apply darkening if requested
             if brightness != 1.0 and ImageEnhance is not None:
@@ -97,7 +136,11 @@ class GameView:
         Load all assets. Missing images will simply result in None,
         and draw fallbacks will be used instead.
         Always logs absolute paths and outcomes.
+        The "shapes" render backend loads nothing.
         """
+        if self.profile.render_backend == "shapes":
+            print(f"[LeafCatcher] Render backend 'shapes' ({self.profile.name} profile); not loading images.")
+            return
         # Background image: scaled to full window size and darkened by 20%
         self._background_photo = self._load_single_image(
             "Background", BACKGROUND_IMAGE_PATH, (WINDOW_WIDTH, WINDOW_HEIGHT), brightness=BACKGROUND_DARKEN_FACTOR
@@ -132,8 +175,9 @@ class GameView:
         r1, g1, b1 = hex_to_rgb(BACKGROUND_GRADIENT_TOP)
         r2, g2, b2 = hex_to_rgb(BACKGROUND_GRADIENT_BOTTOM)
 
-        for i in range(BACKGROUND_STEPS):
-            t = i / max(1, BACKGROUND_STEPS - 1)
+        steps = self.profile.background_steps
+        for i in range(steps):
+            t = i / max(1, steps - 1)
             r = int(r1 + (r2 - r1) * t)
             g = int(g1 + (g2 - g1) * t)
             b = int(b1 + (b2 - b1) * t)
@@ -142,8 +186,8 @@ class GameView:
             g = max(0, min(255, int(g * BACKGROUND_DARKEN_FACTOR)))
             b = max(0, min(255, int(b * BACKGROUND_DARKEN_FACTOR)))
             color = rgb_to_hex(r, g, b)
-            y0 = int((WINDOW_HEIGHT / BACKGROUND_STEPS) * i)
-            y1 = int((WINDOW_HEIGHT / BACKGROUND_STEPS) * (i + 1))
+            y0 = int((WINDOW_HEIGHT / steps) * i)
+            y1 = int((WINDOW_HEIGHT / steps) * (i + 1))
             self.canvas.create_rectangle(0, y0, WINDOW_WIDTH, y1, fill=color, outline=color, tags="bg")
 
     def draw_background(self) -> None:
@@ -175,14 +219,16 @@ class GameView:
 
     def draw_leaves(self) -> None:
         """
-        Draw all leaves. If a leaf image is available, use it; otherwise draw a colored oval.
+        Draw all leaves. If a leaf image is available (and leaf_images is on), use it;
+        otherwise draw a colored oval.
         """
         self.canvas.delete("leaves")
+        use_images = self.leaf_images
         for leaf in self.game_state.leaves:
             # Attach the shared leaf image to each leaf if not set
             if self._leaf_photo and leaf.image is None:
                 leaf.image = self._leaf_photo
-            if leaf.image:
+            if leaf.image and use_images:
                 self.canvas.create_image(leaf.x, leaf.y, image=leaf.image, anchor="nw", tags="leaves")
             else:
                 # Fallback: simple oval
@@ -202,16 +248,115 @@ class GameView:
     def update_score_display(self, _score) -> None:
         self.update_score()
 
+    def show_message(self, text: str) -> None:
+        """
+        Show a centered message over the game (e.g. the stress test result).
+        """
+        if self._message_label is None:
+            self._message_label = Label(
+                self.master, font=("Courier New", 16, "bold"),
+                fg=HUD_TEXT_COLOR, bg=HUD_BG_COLOR, padx=12, pady=8,
+            )
+        self._message_label.config(text=text)
+        self._message_label.place(relx=0.5, rely=0.4, anchor="center")
+
+    # ----------------------------
+    # Performance HUD
+    # ----------------------------
+
+    def attach_frame_stats(self, stats: FrameStats) -> None:
+        """
+        Use stats (shared with the controller) for render timing and the HUD.
+        """
+        self._listen_for_hud(False)
+        self._frame_stats = stats
+        self._listen_for_hud(self._hud_visible)
+
+    def attach_profiler(self, profiler: Profiler) -> None:
+        """
+        Time render() with the controller's phase profiler.
+        """
+        self._listen_for_hud(False)
+        self._profiler = profiler
+        self._listen_for_hud(self._hud_visible)
+
+    def _listen_for_hud(self, listen: bool) -> None:
+        # The frame stats are fed by the profiler only while the HUD shows
+        # them; with the HUD hidden (and no --profile) phases cost nothing.
+        if self._frame_stats is None:
+            return
+        self._profiler.remove_listener(self._frame_stats.on_phase)
+        if listen:
+            self._profiler.add_listener(self._frame_stats.on_phase)
+
+    def attach_input_latency(self, latency: InputLatency) -> None:
+        """
+        Show input-to-photon latency on the HUD.
+        """
+        self._input_latency = latency
+
+    def attach_tk_accounting(self, accounting: TkAccounting) -> None:
+        """
+        Route the canvas and score label through accounting, which then counts
+        and times their Tk calls per frame (one frame per render()).
+        """
+        self._tk_accounting = accounting
+        self.canvas = accounting.wrap(self.canvas, "canvas")
+        self.score_label = accounting.wrap(self.score_label, "score_label")
+
+    def toggle_hud(self) -> None:
+        self._hud_visible = not self._hud_visible
+        self._listen_for_hud(self._hud_visible)
+        if self._hud_visible:
+            self.hud_label.place(relx=1.0, x=-10, y=8, anchor="ne")
+            self._refresh_hud()
+        else:
+            self.hud_label.place_forget()
+
+    def _refresh_hud(self) -> None:
+        self._hud_refreshed_at = time.perf_counter()
+        if self._frame_stats is None:
+            return
+        s = self._frame_stats.summary()
+        extra_lines = ""
+        if self._input_latency is not None and self._input_latency.count:
+            lat = self._input_latency.summary()
+            extra_lines += f"\ninp  {lat['p50']:6.2f} {lat['p99']:6.2f}"
+        if self._tk_accounting is not None:
+            acc = self._tk_accounting
+            extra_lines += f"\ntk/frm {acc.last_frame_calls:5d} {acc.last_frame_tcl_ms:6.2f} ms"
+        self.hud_label.config(text=(
+            f"FPS {s['fps']:5.1f}\n"
+            f"        p50    p99 ms\n"
+            f"upd  {s['update_p50']:6.2f} {s['update_p99']:6.2f}\n"
+            f"col  {s['collision_p50']:6.2f} {s['collision_p99']:6.2f}\n"
+            f"rnd  {s['render_p50']:6.2f} {s['render_p99']:6.2f}\n"
+            f"leaves {len(self.game_state.leaves):5d}\n"
+            f"items  {len(self.canvas.find_all()):5d}"
+            f"{extra_lines}"
+        ))
+
     def render(self) -> None:
         """
         Render the full frame: background (first time), leaves, basket, and score.
         Called every tick by the controller.
         """
-        if not self._bg_drawn:
-            self.draw_background()
-        self.draw_leaves()
-        self.draw_basket()
-        self.update_score()
+        if self._tk_accounting is not None:
+            # Background redraws are counted but exempt from the call budget
+            self._tk_accounting.start_frame(len(self.game_state.leaves), check=self._bg_drawn)
+        with self._profiler.phase("render"):
+            if not self._bg_drawn:
+                self.draw_background()
+            self.draw_leaves()
+            self.draw_basket()
+            self.update_score()
+        if self._hud_visible and (time.perf_counter() - self._hud_refreshed_at) * 1000.0 >= HUD_REFRESH_MS:
+            self._refresh_hud()
+        if not self._first_frame_done:
+            self._first_frame_done = True
+            tracer.instant("first_frame")
+            # Boot is complete; flush now in case the kiosk never exits cleanly
+            tracer.write()
 
     def reset_display(self) -> None:
         """
@@ -3,18 +3,28 @@ from typing import Callable, Optional
 
 from utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT,
-    BACKGROUND_GRADIENT_TOP, BACKGROUND_GRADIENT_BOTTOM, BACKGROUND_STEPS,
+    BACKGROUND_GRADIENT_TOP, BACKGROUND_GRADIENT_BOTTOM,
+    LEADERBOARD_TOP_N, LEADERBOARD_POLL_MS,
 )
+from utils.perf_profiles import PerfProfile, PROFILES
 
 class MenuView:
     """
     Pixel-art styled start menu with a warm fall gradient, title, and a 'PLAY' button.
-    Calls on_play when the button is clicked.
+    Calls on_play when the button is clicked. If on_stress is given, a smaller
+    'STRESS TEST' button below starts the leaf-storm stress mode instead.
+    With a leaderboard, the top scores appear once they have loaded in the
+    background (the menu is drawn first and never waits for the database).
     """
 
-    def __init__(self, master, on_play: Callable[[], None]):
+    def __init__(self, master, on_play: Callable[[], None], on_stress: Optional[Callable[[], None]] = None,
+                 leaderboard=None, profile: Optional[PerfProfile] = None):
         self.master = master
+        self.profile = profile or PROFILES["balanced"]
         self.on_play = on_play
+        self.on_stress = on_stress
+        self._scores_future = None
+        self._scores_after_id = None
 
         self.canvas = Canvas(master, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, highlightthickness=0)
         self.canvas.pack(fill="both", expand=False)
@@ -23,11 +33,19 @@ class MenuView:
         self._draw_title()
         self._draw_pixel_leaf_art(x=WINDOW_WIDTH - 140, y=60, scale=6)
         self._play_btn_bbox = self._draw_play_button()
+        self._stress_btn_bbox = self._draw_stress_button() if on_stress is not None else None
 
         # Mouse bindings for button
         self.canvas.bind("<Button-1>", self._on_click)
 
+        if leaderboard is not None:
+            # Query after the first paint; the answer is polled for, not awaited
+            self._scores_after_id = self.canvas.after_idle(self._request_scores, leaderboard)
+
     def destroy(self):
+        if self._scores_after_id is not None:
+            self.canvas.after_cancel(self._scores_after_id)
+            self._scores_after_id = None
         self.canvas.destroy()
 
     # ----------------------------
@@ -49,14 +67,15 @@ class MenuView:
         r1, g1, b1 = hex_to_rgb(BACKGROUND_GRADIENT_TOP)
         r2, g2, b2 = hex_to_rgb(BACKGROUND_GRADIENT_BOTTOM)
 
-        for i in range(BACKGROUND_STEPS):
-            t = i / max(1, BACKGROUND_STEPS - 1)
+        steps = self.profile.background_steps
+        for i in range(steps):
+            t = i / max(1, steps - 1)
             r = int(r1 + (r2 - r1) * t)
             g = int(g1 + (g2 - g1) * t)
             b = int(b1 + (b2 - b1) * t)
             color = rgb_to_hex(r, g, b)
-            y0 = int((WINDOW_HEIGHT / BACKGROUND_STEPS) * i)
-            y1 = int((WINDOW_HEIGHT / BACKGROUND_STEPS) * (i + 1))
+            y0 = int((WINDOW_HEIGHT / steps) * i)
+            y1 = int((WINDOW_HEIGHT / steps) * (i + 1))
             self.canvas.create_rectangle(0, y0, WINDOW_WIDTH, y1, fill=color, outline=color)
 
     def _draw_title(self):
@@ -108,6 +127,55 @@ class MenuView:
         )
         return (x, y, x + btn_w, y + btn_h)
 
+    def _draw_stress_button(self):
+        """
+        Draw a small, plain 'STRESS TEST' button under PLAY. Returns its bbox.
+        """
+        btn_w, btn_h = 160, 36
+        x = (WINDOW_WIDTH - btn_w) // 2
+        y = WINDOW_HEIGHT // 2 + 130
+        self.canvas.create_rectangle(x, y, x + btn_w, y + btn_h, fill="#8b4f1f", outline="#5a3110", width=3)
+        self.canvas.create_text(
+            x + btn_w // 2, y + btn_h // 2 + 1,
+            text="STRESS TEST",
+            fill="#f6e0c0",
+            font=("Courier New", 12, "bold"),
+            anchor="c"
+        )
+        return (x, y, x + btn_w, y + btn_h)
+
+    def _request_scores(self, leaderboard):
+        self._scores_future = leaderboard.top_async(LEADERBOARD_TOP_N)
+        self._poll_scores()
+
+    def _poll_scores(self):
+        if not self._scores_future.done():
+            self._scores_after_id = self.canvas.after(LEADERBOARD_POLL_MS, self._poll_scores)
+            return
+        self._scores_after_id = None
+        if self._scores_future.exception() is None:
+            self._draw_scores(self._scores_future.result())
+
+    def _draw_scores(self, entries):
+        """
+        Draw the top scores between the subtitle and the PLAY button.
+        """
+        if not entries:
+            return
+        x = WINDOW_WIDTH // 2
+        y = 300
+        self.canvas.create_text(x, y, text="TOP SCORES", fill="#7a4014",
+                                font=("Courier New", 16, "bold"), anchor="c", tags="scores")
+        for i, entry in enumerate(entries, start=1):
+            self.canvas.create_text(
+                x, y + 8 + i * 28,
+                text=f"{i}. {entry.player[:12]:<12} {entry.score:>6}",
+                fill="#5a3110",
+                font=("Courier New", 14, "bold"),
+                anchor="c",
+                tags="scores"
+            )
+
     def _draw_pixel_leaf_art(self, x: int, y: int, scale: int = 5):
         """
         Draw a simple pixel-art leaf made of colored squares.
@@ -137,4 +205,9 @@ class MenuView:
         x1, y1, x2, y2 = self._play_btn_bbox
         if x1 <= event.x <= x2 and y1 <= event.y <= y2:
             if callable(self.on_play):
-                self.on_play()
\ No newline at end of file
+                self.on_play()
+            return
+        if self._stress_btn_bbox is not None:
+            x1, y1, x2, y2 = self._stress_btn_bbox
+            if x1 <= event.x <= x2 and y1 <= event.y <= y2 and callable(self.on_stress):
+                self.on_stress()
\ No newline at end of file
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import unittest
+
+from src.utils.async_tk import AsyncTkLoop
+from src.utils.spectator import SpectatorPublisher
+
+
+class _Root:
+    def __init__(self):
+        self.updates = 0
+        self.destroyed = False
+        self.protocols = {}
+
+    def update(self):
+        self.updates += 1
+
+    def protocol(self, name, handler):
+        self.protocols[name] = handler
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class TestAsyncTkLoop(unittest.TestCase):
+    def setUp(self):
+        self.root = _Root()
+        self.aio = AsyncTkLoop(self.root, frame_ms=1)
+
+    def test_drives_frames_and_pumps_tk_until_stopped(self):
+        frames = []
+
+        def frame():
+            frames.append(self.root.updates)
+            if len(frames) == 5:
+                self.root.protocols["WM_DELETE_WINDOW"]()  # like closing the window
+
+        self.aio.drive(frame)
+        self.aio.run()
+        self.assertEqual(frames, [0, 1, 2, 3, 4])  # each frame runs before its update()
+        self.assertEqual(self.aio.frames, 5)
+        self.assertTrue(self.root.destroyed)
+
+    def test_stop_runs_hooks_then_cancels_tasks(self):
+        events = []
+
+        async def background():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+
+        async def hook():
+            events.append("hook")
+
+        self.aio.spawn(background())  # queued until run()
+        self.aio.add_shutdown(hook)
+        self.aio.drive(lambda: self.aio.stop() if self.root.updates >= 2 else None)
+        self.aio.run()
+        self.assertEqual(events, ["hook", "cancelled"])
+
+    def test_failing_frame_stops_driving_but_keeps_pumping(self):
+        def frame():
+            raise RuntimeError("boom")
+
+        async def stop_later():
+            while self.root.updates < 3:
+                await asyncio.sleep(0)
+            self.aio.stop()
+
+        self.aio.drive(frame)
+        self.aio.spawn(stop_later())
+        with self.assertLogs("leaf_catcher.async", level="ERROR"):
+            self.aio.run()
+        self.assertGreaterEqual(self.root.updates, 3)
+
+    def test_blocking_work_runs_on_the_executor(self):
+        result = []
+
+        async def work():
+            result.append(await self.aio.run_in_executor(lambda: threading.current_thread().name))
+            self.aio.stop()
+
+        self.aio.spawn(work())
+        self.aio.run()
+        self.assertTrue(result[0].startswith("leaf-io"))
+
+    def test_publisher_runs_on_the_loop_without_a_thread(self):
+        publisher = SpectatorPublisher("127.0.0.1:0")
+        ports = []
+
+        async def start():
+            await publisher.start_async()
+            ports.append(publisher.bound_address)
+            self.aio.stop()
+
+        self.aio.spawn(start())
+        self.aio.add_shutdown(publisher.stop_async)
+        self.aio.run()
+        self.assertTrue(ports[0])
+        self.assertIsNone(publisher._thread)
+        publisher.stop()  # the sync stop is a no-op afterwards
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+from src.utils import audio
+from src.utils.audio import AudioMetrics, AudioWorker
+
+
+class _RecordingWorker(AudioWorker):
+    """AudioWorker with test-only commands; no audio backend is touched."""
+
+    def __init__(self):
+        super().__init__()
+        self.handled = []
+        self.release = threading.Event()
+
+    def _do_block(self, cmd):
+        self.release.wait(5)
+
+    def _do_record(self, cmd, value):
+        self.handled.append(value)
+
+
+class TestAudioWorker(unittest.TestCase):
+    def test_newest_music_command_supersedes_queued_ones(self):
+        worker = _RecordingWorker()
+        worker.submit("block")
+        for value in range(5):
+            worker.submit("record", value)
+        worker.submit("record", "volume", music=False)
+        worker.release.set()
+        worker.shutdown(timeout=5)
+        self.assertEqual(worker.handled, [4, "volume"])
+
+    def test_commands_share_one_thread(self):
+        worker = _RecordingWorker()
+        worker.release.set()
+        before = threading.active_count()
+        for value in range(50):
+            worker.submit("record", value)
+        self.assertLessEqual(threading.active_count(), before + 1)
+        worker.shutdown(timeout=5)
+        self.assertFalse(worker.is_running())
+
+
+class TestBackgroundResolve(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.resolving = threading.Event()
+        self.threads = []
+
+        def resolve(url):
+            self.threads.append(threading.current_thread())
+            self.resolving.set()
+            self.release.wait(5)
+            return "http://stream"
+
+        self.original = audio._resolve_youtube_stream_url
+        audio._resolve_youtube_stream_url = resolve
+        self.original_backends = dict(audio._backends)
+        audio.override_backend("vlc", None)  # pre-roll and play stop at "VLC unavailable"
+        self.worker = _RecordingWorker()
+        self.worker.release.set()
+
+    def tearDown(self):
+        self.release.set()
+        self.worker.shutdown(timeout=5)
+        audio._resolve_youtube_stream_url = self.original
+        audio._backends.clear()
+        audio._backends.update(self.original_backends)
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return condition()
+
+    def test_worker_handles_commands_while_a_resolve_blocks(self):
+        self.worker.submit("play_youtube_stream", "https://youtu.be/x")
+        self.assertTrue(self.resolving.wait(5))
+        self.worker.submit("record", "volume", music=False)
+        self.assertTrue(self._wait_for(lambda: self.worker.handled == ["volume"]))
+        self.assertTrue(self.threads[0].daemon)
+        self.assertIsNot(self.threads[0], self.worker._thread)
+
+        self.worker.submit("stop")  # supersedes the play
+        self.release.set()
+        self.assertTrue(self._wait_for(lambda: "https://youtu.be/x" in self.worker._resolved))
+        self.assertIsNone(self.worker._vlc_player)  # stale result only cached, not played
+
+    def test_resolved_url_resumes_the_waiting_prepare(self):
+        self.worker.submit("prepare_youtube", "https://youtu.be/x")
+        self.worker.submit("prepare_youtube", "https://youtu.be/x")  # joins the resolve in flight
+        self.assertTrue(self.resolving.wait(5))
+        self.release.set()
+        self.assertTrue(self._wait_for(lambda: self.worker.prepared_stream_url == "http://stream"))
+        self.assertEqual(len(self.threads), 1)
+
+
+class TestAudioMetrics(unittest.TestCase):
+    def test_span_records_stage(self):
+        metrics = AudioMetrics()
+        with metrics.span("resolve"):
+            pass
+        metrics.record("resolve", 5.0)
+        stats = metrics.snapshot()["resolve"]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["last_ms"], 5.0)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_resolve_uses_stub_extractor(self):
+        class YoutubeDL:
+            def __init__(self, opts):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def extract_info(self, url, download=False):
+                return {"formats": [
+                    {"url": "http://video", "vcodec": "h264", "acodec": "aac", "abr": 256},
+                    {"url": "http://low", "vcodec": "none", "acodec": "opus", "abr": 64},
+                    {"url": "http://high", "vcodec": "none", "acodec": "opus", "abr": 160},
+                ]}
+
+        stub = types.ModuleType("yt_dlp")
+        stub.YoutubeDL = YoutubeDL
+        audio.override_backend("yt_dlp", stub)
+        try:
+            self.assertEqual(audio._resolve_youtube_stream_url("https://youtu.be/x"), "http://high")
+        finally:
+            audio._backends.pop("yt_dlp", None)
+
+
+class TestPrepareAsync(unittest.TestCase):
+    def test_cancelling_leaves_a_hung_resolve_on_a_daemon_thread(self):
+        release = threading.Event()
+        threads = []
+        submitted = []
+
+        def resolve(url):
+            threads.append(threading.current_thread())
+            release.wait(5)
+            return "http://stream"
+
+        async def main():
+            task = asyncio.ensure_future(audio.prepare_youtube_stream_async("https://youtu.be/x"))
+            while not threads:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        original = audio._resolve_youtube_stream_url
+        audio._resolve_youtube_stream_url = resolve
+        original_submit = audio._worker.submit
+        audio._worker.submit = lambda *a, **k: submitted.append(a)
+        try:
+            asyncio.run(main())
+            self.assertTrue(threads[0].daemon)
+            release.set()  # finishes after the loop has closed
+            threads[0].join(2)
+            self.assertFalse(threads[0].is_alive())
+            self.assertEqual(submitted, [])
+        finally:
+            audio._resolve_youtube_stream_url = original
+            audio._worker.submit = original_submit
+
+
+class TestAudioLazyImports(unittest.TestCase):
+    def test_import_and_stop_do_not_load_backends_or_asyncio(self):
+        code = (
+            "import sys\n"
+            "from utils import audio\n"
+            "audio.stop_music()\n"
+            "audio.shutdown_audio()\n"
+            "print(sorted(m for m in ('pygame', 'yt_dlp', 'vlc', 'asyncio') if m in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from src.controllers.autopilot import Autopilot
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.models.leaf import Leaf
+
+
+def _leaf(x, ticks_away, state, speed=4):
+    # A leaf whose bottom reaches the basket top in `ticks_away` ticks
+    size = 40
+    y = state.basket.y - size - speed * ticks_away
+    return Leaf(x=x, y=y, speed=speed, size=size, color="#fff")
+
+
+def _score(seed, ticks, autopilot):
+    controller = GameController(GameState(), seed=seed)
+    if autopilot:
+        Autopilot(controller).engage()
+    for _ in range(ticks):
+        controller.step()
+    return controller.game_state.score
+
+
+class TestAutopilot(unittest.TestCase):
+    def test_targets_the_larger_cluster(self):
+        state = GameState()
+        controller = GameController(state, seed=0)
+        bx = state.basket.x
+        state.leaves = [
+            _leaf(bx - 250, 40, state),
+            _leaf(bx + 250, 40, state),
+            _leaf(bx + 270, 42, state),
+        ]
+        target = Autopilot(controller).choose_target()
+        self.assertGreater(target, bx + 150)
+
+    def test_skips_unreachable_leaves(self):
+        state = GameState()
+        controller = GameController(state, seed=0)
+        bx = state.basket.x
+        # Two leaves about to land far away cannot be reached; the lone one later can
+        state.leaves = [
+            _leaf(bx + 350, 2, state),
+            _leaf(bx + 370, 2, state),
+            _leaf(bx - 200, 30, state),
+        ]
+        target = Autopilot(controller).choose_target()
+        self.assertLess(target, bx)
+
+    def test_moves_at_basket_speed(self):
+        state = GameState()
+        controller = GameController(state, seed=0)
+        bx = state.basket.x
+        state.leaves = [_leaf(bx - 300, 50, state)]
+        autopilot = Autopilot(controller)
+        autopilot.engage()
+        controller.step()
+        self.assertEqual(state.basket.x, bx - state.basket.speed)
+        self.assertEqual(state.basket_position, state.basket.x)
+        autopilot.disengage()
+        self.assertFalse(autopilot.engaged)
+        controller.step()
+        self.assertEqual(state.basket.x, bx - state.basket.speed)
+
+    def test_replans_every_n_ticks(self):
+        state = GameState()
+        controller = GameController(state, seed=0)
+        bx = state.basket.x
+        state.leaves = [_leaf(bx - 300, 50, state)]
+        autopilot = Autopilot(controller, replan_ticks=4)
+        plans = []
+        choose = autopilot.choose_target
+        autopilot.choose_target = lambda: plans.append(1) or choose()
+        autopilot.engage()
+        for _ in range(8):
+            controller.step()
+        self.assertEqual(len(plans), 2)  # ticks 1 and 5
+        self.assertEqual(state.basket.x, bx - 8 * state.basket.speed)  # still moves every tick
+
+    def test_catches_far_more_than_an_idle_basket(self):
+        ticks = 3600
+        idle = _score(seed=5, ticks=ticks, autopilot=False)
+        played = _score(seed=5, ticks=ticks, autopilot=True)
+        self.assertGreater(played, 2 * idle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.utils.leaderboard import Leaderboard
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "scores.sqlite3")
+        self.board = Leaderboard(self.path)
+
+    def tearDown(self):
+        self.board.close()
+        self._tmp.cleanup()
+
+    def test_top_and_rank(self):
+        for player, score, at in (("ann", 30, 1.0), ("bob", 50, 2.0), ("cy", 10, 3.0), ("dee", 30, 4.0)):
+            self.board.submit(player, score, played_at=at)
+        top = self.board.top(3, timeout=5)
+        self.assertEqual([(e.player, e.score) for e in top], [("bob", 50), ("ann", 30), ("dee", 30)])
+        self.assertEqual(self.board.rank(50, timeout=5), 1)
+        self.assertEqual(self.board.rank(30, timeout=5), 2)
+        self.assertEqual(self.board.rank(5, timeout=5), 5)
+        self.assertEqual(self.board.player_best_async("ann").result(5).score, 30)
+        self.assertIsNone(self.board.player_best_async("zed").result(5))
+
+    def test_persists_in_wal_mode_with_score_index(self):
+        self.board.submit("ann", 12)
+        self.board.close()
+        conn = sqlite3.connect(self.path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            plan = " ".join(str(row) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT player, score FROM scores ORDER BY score DESC LIMIT 5"))
+            self.assertIn("idx_scores_score", plan)
+        finally:
+            conn.close()
+        reopened = Leaderboard(self.path)
+        try:
+            self.assertEqual([e.score for e in reopened.top(timeout=5)], [12])
+        finally:
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
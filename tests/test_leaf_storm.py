@@ -0,0 +1,48 @@
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.controllers.leaf_storm import LeafStorm
+from src.models.game_state import GameState
+from src.utils.constants import TICK_MS
+from src.utils.perf_profiles import PROFILES
+
+
+class TestLeafStorm(unittest.TestCase):
+    def test_ramps_until_leaf_cap(self):
+        controller = GameController(GameState(), seed=7)
+        results = []
+        storm = LeafStorm(controller, budget_ms=1000.0, step_ms=500, max_leaves=200, on_done=results.append)
+        result = storm.run_headless()
+        self.assertEqual(results, [result])
+        self.assertGreaterEqual(result.max_live_leaves, 200)
+        rates = [step.spawn_rate for step in result.steps]
+        self.assertEqual(rates, sorted(rates))
+        self.assertGreater(rates[-1], rates[0])
+        self.assertEqual(controller.tick_hooks, [])
+
+    def test_first_step_over_budget(self):
+        controller = GameController(GameState(), seed=7)
+        result = LeafStorm(controller, budget_ms=1e-9, step_ms=160).run_headless()
+        self.assertEqual(len(result.steps), 1)
+        self.assertEqual(result.max_live_leaves, 0)
+
+    def test_times_whole_frames_when_a_frame_runs_several_steps(self):
+        class _Root:
+            flushes = 0
+
+            def update_idletasks(self):
+                self.flushes += 1
+
+        controller = GameController(GameState(), seed=7, profile=PROFILES["low"])
+        self.assertEqual(controller.tick_ms // TICK_MS, 2)
+        controller.root = root = _Root()
+        storm = LeafStorm(controller, budget_ms=1e-9, step_ms=160)
+        result = storm.run_headless()
+        ticks = controller.scheduler.tick
+        self.assertEqual(ticks, 10)
+        self.assertEqual(root.flushes, ticks // 2)  # once per rendered frame
+        self.assertEqual(len(result.steps), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.utils.memory import GrowthDetector, MemoryMonitor
+
+
+class _Tracked:
+    pass
+
+
+class TestGrowthDetector(unittest.TestCase):
+    def test_flags_only_monotonic_growth(self):
+        detector = GrowthDetector(window=4, min_growth={"items": 10})
+        for value in (100, 120, 110, 130):  # sawtooth
+            detector.add("items", value)
+        self.assertFalse(detector.growing("items"))
+        for value in (140, 150, 160):
+            detector.add("items", value)
+        self.assertTrue(detector.growing("items"))  # 130 -> 160, never dropping
+
+    def test_small_growth_is_noise(self):
+        detector = GrowthDetector(window=3, min_growth={"items": 10})
+        for value in (100, 101, 102):
+            detector.add("items", value)
+        self.assertFalse(detector.growing("items"))
+
+
+class TestMemoryMonitor(unittest.TestCase):
+    def test_samples_and_flags_leak(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memory.log")
+            leaked = []
+            monitor = MemoryMonitor(count_types=(_Tracked,), canvas_items=lambda: 0, log_path=path, window=3)
+            monitor.start()
+            try:
+                for _ in range(4):
+                    leaked.extend(_Tracked() for _ in range(100))
+                    sample = monitor.sample()
+            finally:
+                monitor.stop()
+            self.assertEqual(sample["live__Tracked"], 400)
+            self.assertIn("live__Tracked", monitor.flagged)
+            self.assertNotIn("canvas_items", monitor.flagged)
+            with open(path, encoding="utf-8") as fh:
+                lines = [json.loads(line) for line in fh]
+            self.assertEqual(len(lines), 4)
+            self.assertIn("traced_bytes", lines[0])
+
+
+class TestSoak(unittest.TestCase):
+    def test_short_soak_stays_flat(self):
+        from soak import run_soak
+        self.assertTrue(run_soak(hours=0.1, sample_minutes=1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
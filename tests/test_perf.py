@@ -0,0 +1,62 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.utils.perf import FrameStats, RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_overwrites_oldest(self):
+        ring = RingBuffer(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            ring.append(value)
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.values(), [2.0, 3.0, 4.0])
+
+    def test_percentiles(self):
+        ring = RingBuffer(100)
+        for value in range(1, 101):
+            ring.append(float(value))
+        self.assertEqual(ring.percentile(50), 51.0)
+        self.assertEqual(ring.percentile(99), 99.0)
+        self.assertEqual(RingBuffer(4).percentile(50), 0.0)
+
+
+class TestFrameStats(unittest.TestCase):
+    def test_fps_from_tick_times(self):
+        stats = FrameStats(window=10)
+        for i in range(10):
+            stats.mark_tick(now=i / 50.0)
+        self.assertAlmostEqual(stats.fps(), 50.0)
+
+    def test_summary_has_all_phases(self):
+        stats = FrameStats()
+        stats.record("render", 2.0)
+        summary = stats.summary()
+        self.assertEqual(summary["render_p50"], 2.0)
+        self.assertIn("collision_p99", summary)
+
+
+class TestHudListener(unittest.TestCase):
+    def test_profiler_is_idle_unless_the_hud_is_shown(self):
+        from views import game_view
+
+        state = GameState()
+        with mock.patch.object(game_view, "Canvas"), mock.patch.object(game_view, "Label"), \
+                redirect_stdout(io.StringIO()):
+            view = game_view.GameView(master=None, game_state=state)
+        controller = GameController(state, view)
+        self.assertFalse(controller.profiler.active)
+        view.toggle_hud()
+        self.assertTrue(controller.profiler.active)
+        controller.step()
+        self.assertEqual(len(controller.frame_stats.phases["update"]), 1)
+        view.toggle_hud()
+        self.assertFalse(controller.profiler.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.utils.constants import TICK_MS
+from src.utils.perf_profiles import PROFILES, load_profiles, resolve_profile
+
+
+class _Root:
+    # Records after() calls instead of scheduling them
+    def __init__(self):
+        self.delays = []
+
+    def after(self, delay, _callback):
+        self.delays.append(delay)
+        return len(self.delays)
+
+
+class _View:
+    def __init__(self):
+        self.frames = 0
+
+    def render(self):
+        self.frames += 1
+
+
+class TestPerfProfiles(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.config = os.path.join(self._tmp.name, "leaf_catcher.toml")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.config, "w") as f:
+            f.write(text)
+
+    def test_builtin_profiles(self):
+        self.assertEqual(set(PROFILES), {"low", "balanced", "high"})
+        self.assertEqual(resolve_profile(config_path="").name, "balanced")
+        low = resolve_profile("low", config_path="")
+        self.assertEqual(low.render_backend, "shapes")
+        self.assertGreater(low.tick_ms, TICK_MS)
+
+    def test_config_file_overrides_and_adds_profiles(self):
+        self._write(
+            'profile = "kiosk"\n'
+            "[profiles.low]\nmax_leaves = 30\n"
+            '[profiles.kiosk]\nbase = "low"\nasset_scale = 0.25\n'
+        )
+        profiles, selected = load_profiles(self.config)
+        self.assertEqual(selected, "kiosk")
+        self.assertEqual(profiles["low"].max_leaves, 30)
+        self.assertEqual(profiles["low"].render_backend, "shapes")
+        kiosk = resolve_profile(config_path=self.config)
+        self.assertEqual((kiosk.name, kiosk.max_leaves, kiosk.asset_scale), ("kiosk", 30, 0.25))
+        # Command-line flags win over the file
+        self.assertEqual(resolve_profile(config_path=self.config, overrides={"max_leaves": 5}).max_leaves, 5)
+
+    def test_rejects_bad_settings(self):
+        with self.assertRaises(ValueError):
+            resolve_profile("turbo", config_path="")
+        with self.assertRaises(ValueError):
+            resolve_profile(config_path="", overrides={"tick_ms": TICK_MS + 1})
+        with self.assertRaises(ValueError):
+            resolve_profile(config_path="", overrides={"render_backend": "opengl"})
+        self._write("[profiles.high]\nleaves = 10\n")
+        with self.assertRaises(ValueError):
+            load_profiles(self.config)
+
+    def test_controller_caps_live_leaves(self):
+        profile = PROFILES["balanced"]._replace(max_leaves=3)
+        controller = GameController(GameState(), seed=1, profile=profile)
+        for _ in range(10):
+            controller.spawn_leaf()
+        self.assertEqual(len(controller.game_state.leaves), 3)
+
+    def test_slow_tick_catches_up_and_renders_once(self):
+        view = _View()
+        controller = GameController(GameState(), view, seed=1, profile=PROFILES["low"])
+        controller.root = _Root()
+        controller._tick()
+        self.assertEqual(controller.scheduler.tick, PROFILES["low"].tick_ms // TICK_MS)
+        self.assertEqual(view.frames, 1)
+        self.assertEqual(controller.root.delays, [PROFILES["low"].tick_ms])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from src.utils.profiling import Histogram, Profiler
+
+
+class TestHistogram(unittest.TestCase):
+    def test_summary_and_percentiles(self):
+        hist = Histogram()
+        for ms in (0.5, 1.0, 1.0, 2.0, 40.0):
+            hist.add(ms)
+        summary = hist.summary()
+        self.assertEqual(summary["count"], 5)
+        self.assertEqual(summary["max_ms"], 40.0)
+        self.assertGreaterEqual(summary["p50_ms"], 1.0)
+        self.assertLess(summary["p50_ms"], 1.5)
+        self.assertGreaterEqual(summary["p99_ms"], 40.0)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_inactive_profiler_records_nothing(self):
+        profiler = Profiler()
+        with profiler.phase("collision"):
+            pass
+        self.assertEqual(profiler.histograms["collision"].count, 0)
+
+    def test_fake_clock_and_listener(self):
+        ticks = iter([1.0, 1.004])
+        profiler = Profiler(clock=lambda: next(ticks))
+        seen = []
+        profiler.add_listener(lambda phase, ms: seen.append((phase, round(ms, 3))))
+        profiler.enable()
+        with profiler.phase("render"):
+            pass
+        self.assertEqual(seen, [("render", 4.0)])
+        self.assertEqual(profiler.histograms["render"].count, 1)
+
+    def test_export_csv_and_json(self):
+        profiler = Profiler()
+        profiler.enable()
+        profiler.record("move", 0.25)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = os.path.join(tmpdir, "p.json")
+            csv_path = os.path.join(tmpdir, "p.csv")
+            profiler.export(json_path)
+            profiler.export(csv_path)
+            with open(json_path) as fh:
+                self.assertEqual(json.load(fh)["phases"]["move"]["count"], 1)
+            with open(csv_path) as fh:
+                rows = list(csv.DictReader(fh))
+        self.assertEqual([r["phase"] for r in rows], ["move"])
+
+
+if __name__ == '__main__':
+    unittest.main()
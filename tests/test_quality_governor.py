@@ -0,0 +1,87 @@
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.controllers.quality_governor import LEVELS, QualityGovernor
+from src.models.game_state import GameState
+from src.utils.constants import TICK_MS, QUALITY_MIN_LEAF_CAP
+
+
+class _View:
+    leaf_images = True
+
+    def render(self):
+        pass
+
+
+def _window(governor, frame_ms):
+    for _ in range(governor.window_frames):
+        governor.observe(frame_ms)
+
+
+class TestQualityGovernor(unittest.TestCase):
+    def setUp(self):
+        self.controller = GameController(GameState(), _View(), seed=3)
+        self.governor = QualityGovernor(self.controller, window_frames=10, up_windows=2)
+        self.slow = TICK_MS * 3.0
+        self.fast = TICK_MS * 0.1
+
+    def test_steps_down_one_level_per_slow_window(self):
+        for level in range(1, len(LEVELS)):
+            _window(self.governor, self.slow)
+            self.assertEqual(self.governor.level, level)
+        _window(self.governor, self.slow)
+        self.assertEqual(self.governor.level, len(LEVELS) - 1)
+
+        controller = self.controller
+        self.assertEqual(controller.max_leaves, QUALITY_MIN_LEAF_CAP)
+        self.assertFalse(controller.game_view.leaf_images)
+        self.assertEqual(controller.tick_ms, 2 * TICK_MS)
+        self.assertFalse(controller.wind.sway)
+
+    def test_steps_back_up_and_restores_the_profile(self):
+        _window(self.governor, self.slow)
+        _window(self.governor, self.slow)
+        self.assertEqual(self.governor.level, 2)
+        _window(self.governor, self.fast)
+        self.assertEqual(self.governor.level, 2)  # one quiet window is not enough
+        for _ in range(3):
+            _window(self.governor, self.fast)
+        self.assertEqual(self.governor.level, 0)
+        self.assertEqual(self.controller.max_leaves, 0)
+        self.assertTrue(self.controller.game_view.leaf_images)
+
+    def test_no_change_inside_the_hysteresis_band(self):
+        _window(self.governor, self.slow)
+        for _ in range(10):
+            _window(self.governor, TICK_MS * 0.8)
+        self.assertEqual(self.governor.level, 1)
+        self.assertEqual(self.governor.changes, 1)
+
+    def test_bouncing_back_down_doubles_the_wait(self):
+        _window(self.governor, self.slow)
+        _window(self.governor, self.fast)
+        _window(self.governor, self.fast)
+        self.assertEqual(self.governor.level, 0)
+        _window(self.governor, self.slow)
+        self.assertEqual(self.governor.level, 1)
+        self.assertEqual(self.governor.up_windows, 4)
+
+    def test_frames_span_all_steps_of_a_slow_loop(self):
+        self.governor.start()
+        for _ in range(3):
+            _window(self.governor, self.slow)
+        self.assertEqual(self.controller.tick_ms, 2 * TICK_MS)
+        # Two simulation steps now make one frame
+        for _ in range(2 * self.governor.window_frames - 1):
+            self.governor._on_tick(TICK_MS * 0.9)
+        self.assertEqual(self.governor.level, 3)
+        self.governor._on_tick(TICK_MS * 0.9)
+        self.assertEqual(self.governor.level, 3)  # 1.8 ticks of work fits the doubled interval
+        self.governor.stop()
+        self.assertEqual(self.governor.level, 0)
+        self.assertEqual(self.controller.tick_ms, TICK_MS)
+        self.assertEqual(self.controller.tick_hooks, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
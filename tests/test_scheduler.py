@@ -0,0 +1,52 @@
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.utils.constants import SPAWN_INTERVAL_MS
+from src.utils.scheduler import TickScheduler, ms_to_ticks
+
+
+class TestTickScheduler(unittest.TestCase):
+    def test_fires_in_tick_then_insertion_order(self):
+        scheduler = TickScheduler()
+        fired = []
+        scheduler.call_later(2, fired.append, "b")
+        scheduler.call_later(1, fired.append, "a")
+        scheduler.call_later(2, fired.append, "c")
+        self.assertEqual(scheduler.advance(), 1)
+        self.assertEqual(scheduler.advance(), 2)
+        self.assertEqual(fired, ["a", "b", "c"])
+        self.assertEqual(scheduler.pending(), 0)
+
+    def test_repeating_and_cancel(self):
+        scheduler = TickScheduler()
+        ticks = []
+        event = scheduler.call_every(3, lambda: ticks.append(scheduler.tick))
+        for _ in range(9):
+            scheduler.advance()
+        scheduler.cancel(event)
+        for _ in range(6):
+            scheduler.advance()
+        self.assertEqual(ticks, [3, 6, 9])
+        self.assertEqual(scheduler.pending(), 0)
+
+    def test_idle_tick_ignores_far_future_events(self):
+        scheduler = TickScheduler()
+        for i in range(1000):
+            scheduler.call_later(10_000 + i, lambda: None)
+        self.assertEqual(scheduler.advance(), 0)
+        self.assertEqual(scheduler.pending(), 1000)
+
+
+class TestControllerScheduling(unittest.TestCase):
+    def test_headless_steps_spawn_on_schedule(self):
+        controller = GameController(GameState(), seed=1)
+        interval = ms_to_ticks(SPAWN_INTERVAL_MS)
+        for _ in range(interval * 3):
+            controller.step()
+        # Spawned every interval ticks; none can have fallen off screen yet
+        self.assertEqual(len(controller.game_state.leaves), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import queue
+import socket
+import struct
+import threading
+import time
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.models.leaf import Leaf
+from src.utils.spectator import SpectatorPublisher, StateDecoder, StateEncoder, read_frames
+
+
+def _assert_same_state(test, decoded, actual):
+    test.assertEqual((decoded.score, decoded.basket.x), (actual.score, actual.basket.x))
+    test.assertEqual(len(decoded.leaves), len(actual.leaves))
+    for got, want in zip(sorted(decoded.leaves, key=lambda l: (l.y, l.x)),
+                         sorted(actual.leaves, key=lambda l: (l.y, l.x))):
+        test.assertAlmostEqual(got.x, want.x, delta=1 / 16)  # positions are sent in 1/16 px
+        test.assertAlmostEqual(got.y, want.y, delta=1 / 16)
+
+
+class TestCodec(unittest.TestCase):
+    def test_deltas_track_the_game(self):
+        controller = GameController(GameState(), seed=3)
+        encoder = StateEncoder(keyframe_ticks=1000)
+        decoder = StateDecoder()
+        kinds = []
+        for tick in range(400):
+            controller.step()
+            if tick % 50 == 0:
+                controller.update_score(1)
+                controller.move_basket("left")
+            frame, keyframe = encoder.encode(controller.game_state)
+            kinds.append(keyframe)
+            (length,) = struct.unpack_from("<I", frame)
+            self.assertEqual(length, len(frame) - 4)
+            decoder.apply(frame[4:])
+            _assert_same_state(self, decoder.state, controller.game_state)
+        self.assertEqual(kinds.count(True), 1)  # only the first frame
+
+    def test_deltas_before_first_keyframe_are_ignored(self):
+        controller = GameController(GameState(), seed=3)
+        encoder = StateEncoder()
+        encoder.encode(controller.game_state)  # keyframe the decoder never sees
+        controller.spawn_leaf()
+        frame, keyframe = encoder.encode(controller.game_state)
+        self.assertFalse(keyframe)
+        decoder = StateDecoder()
+        decoder.apply(frame[4:])
+        self.assertFalse(decoder.synced)
+        self.assertEqual(decoder.state.leaves, [])
+
+    def test_keyframe_requested_during_an_encode_is_not_lost(self):
+        encoder = StateEncoder(keyframe_ticks=1000)
+        state = GameState()
+
+        class _Leaf(Leaf):
+            armed = False
+
+            def __hash__(self):
+                if _Leaf.armed:  # another thread asks for a keyframe mid-encode
+                    _Leaf.armed = False
+                    encoder.request_keyframe()
+                return id(self)
+
+        state.leaves = [_Leaf(x=10, y=10, speed=2, size=40, color="#fff")]
+        self.assertTrue(encoder.encode(state)[1])
+        _Leaf.armed = True
+        self.assertFalse(encoder.encode(state)[1])
+        self.assertTrue(encoder.encode(state)[1])
+        self.assertFalse(encoder.encode(state)[1])
+
+    def test_publish_hands_over_a_snapshot_and_folds_pending_ticks(self):
+        class _Loop:
+            def __init__(self):
+                self.calls = []
+
+            def call_soon_threadsafe(self, fn, *args):
+                self.calls.append((fn, args))
+
+        publisher = SpectatorPublisher()
+        publisher._loop = loop = _Loop()
+        publisher._subscriber_count = 1
+        frames = []
+        publisher._broadcast = lambda frame, keyframe: frames.append(frame)
+        controller = GameController(GameState(), seed=3)
+        for _ in range(3):
+            controller.spawn_leaf()
+        state = controller.game_state
+        publisher.publish(state)
+        controller.step()
+        publisher.publish(state)
+        expected = [(leaf.x, leaf.y) for leaf in state.leaves]
+        self.assertTrue(expected)
+        controller.step()  # moves the leaves after the last publish
+        for fn, args in loop.calls:
+            fn(*args)
+        self.assertEqual(len(frames), 1)  # two ticks, one frame
+        decoder = StateDecoder()
+        decoder.apply(frames[0][4:])
+        got = sorted((leaf.x, leaf.y) for leaf in decoder.state.leaves)
+        for (gx, gy), (wx, wy) in zip(got, sorted(expected)):
+            self.assertAlmostEqual(gx, wx, delta=1 / 16)
+            self.assertAlmostEqual(gy, wy, delta=1 / 16)
+
+
+class TestPublisher(unittest.TestCase):
+    def setUp(self):
+        self.publisher = SpectatorPublisher("127.0.0.1:0", max_queued_frames=4)
+        self.publisher.start()
+        self.address = self.publisher.bound_address
+
+    def tearDown(self):
+        self.publisher.stop()
+
+    def _wait_for_subscribers(self, n):
+        deadline = time.monotonic() + 5
+        while self.publisher.subscriber_count < n and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.publisher.subscriber_count, n)
+
+    def test_subscriber_receives_state(self):
+        sock = socket.create_connection(self.address)
+        try:
+            self._wait_for_subscribers(1)
+            frames = queue.Queue()
+            threading.Thread(target=read_frames, args=(sock, frames), daemon=True).start()
+            controller = GameController(GameState(), seed=5)
+            for _ in range(120):
+                controller.step()
+                self.publisher.publish(controller.game_state)
+            decoder = StateDecoder()
+            # Encoding runs on the publisher's loop and may fold ticks together: read until caught up
+            while True:
+                decoder.apply(frames.get(timeout=5))
+                try:
+                    _assert_same_state(self, decoder.state, controller.game_state)
+                    break
+                except AssertionError:
+                    continue
+        finally:
+            sock.close()
+
+    def test_stalled_subscriber_does_not_block_publishing(self):
+        sock = socket.create_connection(self.address)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        try:
+            self._wait_for_subscribers(1)
+            state = GameState()
+            controller = GameController(state, seed=5)
+            for _ in range(2000):
+                controller.spawn_leaf()
+            self.publisher.encoder.keyframe_ticks = 1  # ~28 KB per frame fills socket buffers quickly
+            start = time.perf_counter()
+            for _ in range(400):
+                controller.update_game()
+                self.publisher.publish(state)  # the subscriber never reads
+            elapsed = time.perf_counter() - start
+            deadline = time.monotonic() + 5
+            while not self.publisher.frames_dropped and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertGreater(self.publisher.frames_dropped, 0)
+            self.assertLess(elapsed, 10.0)
+        finally:
+            sock.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
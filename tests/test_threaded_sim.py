@@ -0,0 +1,124 @@
+import time
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.controllers.threaded_sim import Snapshot, SimulationThread, SnapshotBuffer, ThreadedGame
+from src.models.game_state import GameState
+from src.utils.perf import InputLatency
+
+
+class _View:
+    def __init__(self, state):
+        self.game_state = state
+        self.frames = 0
+
+    def render(self):
+        self.frames += 1
+
+
+class _Root:
+    def after_idle(self, fn, *args):
+        fn(*args)  # as if Tk went idle right after the frame
+
+
+class _DeferredRoot:
+    def __init__(self):
+        self.idle = []
+
+    def after_idle(self, fn, *args):
+        self.idle.append((fn, args))
+
+    def go_idle(self):
+        idle, self.idle = self.idle, []
+        for fn, args in idle:
+            fn(*args)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestInputLatency(unittest.TestCase):
+    def test_times_the_first_input_until_a_frame_includes_it(self):
+        latency = InputLatency()
+        first = latency.input(now=1.0)
+        latency.input(now=1.005)  # burst: still timing the first
+        latency.presented(applied_seq=first - 1, now=1.010)
+        self.assertTrue(latency.pending)
+        latency.presented(applied_seq=first, now=1.020)
+        self.assertFalse(latency.pending)
+        self.assertEqual(latency.count, 1)
+        self.assertAlmostEqual(latency.summary()["p50"], 20.0)
+
+    def test_single_thread_frame_is_stamped_when_tk_goes_idle(self):
+        state = GameState()
+        controller = GameController(state, _View(state), seed=2)
+        controller.root = _DeferredRoot()
+        controller._on_key("left")
+        controller.step(render=True)
+        self.assertTrue(controller.input_latency.pending)  # no synchronous flush
+        controller.root.go_idle()
+        self.assertFalse(controller.input_latency.pending)
+        self.assertEqual(controller.input_latency.count, 1)
+
+
+class TestThreadedSimulation(unittest.TestCase):
+    def test_snapshot_buffer_returns_the_newest(self):
+        buffer = SnapshotBuffer(Snapshot(0, (), 0, 0, 0))
+        for tick in range(1, 4):
+            buffer.publish(Snapshot(tick, ((1.0, 2.0, 40),), 5, 0, 0))
+        self.assertEqual(buffer.latest().tick, 3)
+
+    def test_runs_at_tick_rate_and_applies_inputs(self):
+        controller = GameController(GameState(), seed=2)
+        sim = SimulationThread(controller)
+        start_x = controller.game_state.basket.x
+        sim.start()
+        try:
+            self.assertTrue(_wait_for(lambda: sim.latest().tick >= 5))
+            sim.post(1, "left")
+            sim.post(2, "center", 100)
+            self.assertTrue(_wait_for(lambda: sim.latest().input_seq == 2))
+            snapshot = sim.latest()
+            self.assertNotEqual(snapshot.basket_x, start_x)
+            self.assertEqual(snapshot.basket_x, 100 - controller.game_state.basket.width // 2)
+        finally:
+            sim.stop()
+        # Snapshots are copies: the state keeps its own leaf objects
+        self.assertIsInstance(snapshot.leaves, tuple)
+
+    def test_rejects_a_controller_with_a_view(self):
+        state = GameState()
+        with self.assertRaises(ValueError):
+            SimulationThread(GameController(state, _View(state)))
+
+    def test_renders_each_new_snapshot_once(self):
+        controller = GameController(GameState(), seed=2)
+        view = _View(GameState())
+        game = ThreadedGame(controller, view)
+        game.root = _Root()
+        buffer = game.sim.buffer
+
+        seq = controller.input_latency.input()
+        buffer.publish(Snapshot(1, ((10.0, 20.0, 40), (30.0, 40.0, 40)), 50, 3, 0))
+        self.assertTrue(game.render_latest())
+        self.assertFalse(game.render_latest())  # nothing new
+        self.assertEqual(view.frames, 1)
+        self.assertEqual([(leaf.x, leaf.y) for leaf in view.game_state.leaves], [(10.0, 20.0), (30.0, 40.0)])
+        self.assertEqual((view.game_state.basket.x, view.game_state.score), (50, 3))
+        self.assertTrue(controller.input_latency.pending)  # that frame did not include the input yet
+
+        buffer.publish(Snapshot(2, ((10.0, 24.0, 40),), 35, 3, seq))
+        self.assertTrue(game.render_latest())
+        self.assertEqual(len(view.game_state.leaves), 1)
+        self.assertFalse(controller.input_latency.pending)
+        self.assertEqual(controller.input_latency.count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from src.models.game_state import GameState
+from src.models.leaf import Leaf
+from src.utils.tk_accounting import TkAccounting, TkBudgetExceeded, TkCallBudget
+
+
+class _FakeCanvas:
+    def __init__(self):
+        self.deleted = []
+
+    def delete(self, *tags):
+        self.deleted.extend(tags)
+
+    def create_oval(self, *coords, **options):
+        return 1
+
+
+class TestTkAccounting(unittest.TestCase):
+    def test_counts_calls_per_frame(self):
+        accounting = TkAccounting(clock=iter(range(100)).__next__)
+        canvas = accounting.wrap(_FakeCanvas(), "canvas")
+        canvas.delete("setup")  # outside any frame: dropped
+        accounting.start_frame(leaves=2)
+        canvas.delete("leaves")
+        canvas.create_oval(0, 0, 1, 1)
+        canvas.create_oval(0, 0, 1, 1)
+        accounting.end_frame()
+        self.assertEqual(accounting.last_frame_counts, {"canvas.delete": 1, "canvas.create_oval": 2})
+        self.assertEqual(accounting.last_frame_tcl_ms, 3000.0)  # fake clock: 1 s per call
+        self.assertEqual(canvas.deleted, ["setup", "leaves"])
+
+    def test_budget(self):
+        accounting = TkAccounting(TkCallBudget(fixed=1, per_leaf=1))
+        canvas = accounting.wrap(_FakeCanvas(), "canvas")
+        accounting.start_frame(leaves=1)
+        canvas.delete("leaves")
+        canvas.create_oval(0, 0, 1, 1)
+        accounting.end_frame()
+        accounting.assert_within_budget()
+        accounting.start_frame(leaves=1)
+        for _ in range(3):
+            canvas.create_oval(0, 0, 1, 1)
+        accounting.end_frame()
+        self.assertEqual(accounting.over_budget_frames, 1)
+        with self.assertRaises(TkBudgetExceeded):
+            accounting.assert_within_budget()
+
+
+class TestGameViewBudget(unittest.TestCase):
+    def test_render_stays_within_budget(self):
+        from views import game_view
+        from utils.constants import TK_CALL_BUDGET_FIXED, TK_CALL_BUDGET_PER_LEAF
+
+        state = GameState()
+        state.leaves = [Leaf(x=10 * i, y=5 * i, speed=2, size=40, color="#fff") for i in range(20)]
+        with mock.patch.object(game_view, "Canvas"), mock.patch.object(game_view, "Label"), \
+                redirect_stdout(io.StringIO()):
+            view = game_view.GameView(master=None, game_state=state)
+        accounting = TkAccounting(TkCallBudget(TK_CALL_BUDGET_FIXED, TK_CALL_BUDGET_PER_LEAF))
+        view.attach_tk_accounting(accounting)
+        view.render()  # first frame also draws the background (exempt)
+        view.render()
+        accounting.end_frame()
+        self.assertEqual(accounting.frames, 2)
+        self.assertEqual(accounting.last_frame_leaves, 20)
+        self.assertEqual(accounting.last_frame_calls, 20 + 4)
+        accounting.assert_within_budget()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.utils.tracing import Tracer
+
+
+class TestTracer(unittest.TestCase):
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer()
+        with tracer.span("phase"):
+            pass
+        tracer.instant("first_frame")
+        self.assertIsNone(tracer.write())
+
+    def test_writes_chrome_trace(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            tracer = Tracer()
+            tracer.enable(path)
+            with tracer.span("tk_root"):
+                pass
+            tracer.instant("first_frame")
+            self.assertEqual(tracer.write(), path)
+            with open(path) as fh:
+                events = json.load(fh)["traceEvents"]
+        by_name = {e["name"]: e for e in events}
+        self.assertEqual(by_name["tk_root"]["ph"], "X")
+        self.assertGreaterEqual(by_name["tk_root"]["dur"], 0)
+        self.assertEqual(by_name["first_frame"]["ph"], "i")
+        self.assertEqual(by_name["thread_name"]["ph"], "M")
+        self.assertGreaterEqual(by_name["first_frame"]["ts"], by_name["tk_root"]["ts"])
+
+
+if __name__ == '__main__':
+    unittest.main()
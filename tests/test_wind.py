@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.models.game_state import GameState
+from src.models.leaf import Leaf
+from src.models.wind import Wind
+from src.utils.constants import WINDOW_WIDTH
+
+
+def _positions(seed, ticks):
+    controller = GameController(GameState(), seed=seed)
+    for _ in range(ticks):
+        controller.step()
+    return [(leaf.x, leaf.y) for leaf in controller.game_state.leaves]
+
+
+class TestWind(unittest.TestCase):
+    def test_deterministic_under_seed(self):
+        first = _positions(seed=42, ticks=600)
+        self.assertTrue(first)
+        self.assertEqual(first, _positions(seed=42, ticks=600))
+        self.assertNotEqual(first, _positions(seed=43, ticks=600))
+
+    def test_leaves_sway_sideways(self):
+        wind = Wind(random.Random(0))
+        leaf = Leaf(x=500, y=0, speed=2, size=40, color="#fff", phase=3)
+        xs = set()
+        for _ in range(60):
+            leaf.update(wind.advance())
+            xs.add(round(leaf.x, 3))
+        self.assertGreater(len(xs), 30)
+        self.assertEqual(leaf.y, 120)
+
+    def test_gust_moves_every_leaf(self):
+        wind = Wind(random.Random(0))
+        calm = list(wind.advance())
+        wind.start_gust()
+        gusty = wind.advance()
+        shift = [g - c for g, c in zip(gusty, calm)]
+        self.assertNotEqual(wind.gust, 0.0)
+        # Same gust added to every phase bucket (sway itself moved on by one tick)
+        self.assertAlmostEqual(max(shift) - min(shift), 0.0, delta=0.2)
+
+    def test_leaves_leaving_through_sides_are_swept(self):
+        state = GameState()
+        controller = GameController(state, seed=0)
+        state.leaves = [
+            Leaf(x=-45, y=100, speed=2, size=40, color="#fff", drift=-1.0),
+            Leaf(x=WINDOW_WIDTH + 5, y=100, speed=2, size=40, color="#fff", drift=1.0),
+            Leaf(x=500, y=100, speed=2, size=40, color="#fff"),
+        ]
+        controller.update_game()
+        self.assertEqual(len(state.leaves), 1)
+        self.assertGreater(state.leaves[0].x, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()